@@ -1,4 +1,4 @@
-from graph import Graph, graph_from_file, kruskal
+from delivery_network.graph import Graph, graph_from_file, kruskal
 import time 
 
 g = graph_from_file("input/network.00.in")
@@ -0,0 +1,49 @@
+"""
+Réseau de livraison : graphes, puissance minimale des trajets et allocation des camions.
+
+Les sous-modules ne sont importés qu'à la première utilisation d'un nom (PEP 562) : "from delivery_network import
+Graph" n'importe que graph.py, et rien de coûteux n'est lancé à l'import. La ligne de commande est dans cli.py
+(python -m delivery_network, ou delivery-network une fois le paquet installé).
+"""
+
+import importlib
+
+# nom public -> sous-module qui le définit (pas de nom identique à celui d'un sous-module, comme kruskal ou glouton :
+# l'import du sous-module remplacerait l'attribut du paquet)
+_EXPORTS = {
+    "Graph": "graph",
+    "graph_from_file": "graph",
+    "read_network": "graph",
+    "routes_from_file": "graph",
+    "trucks_from_file": "graph",
+    "kruskal_edges": "graph",
+    "UnionFind": "union_find",
+    "MinPowerTree": "min_power_tree",
+    "CompactGraph": "compact_graph",
+    "ReconstructionTree": "reconstruction_tree",
+    "SpanningForest": "spanning_forest",
+    "QueryCache": "query_cache",
+    "min_power_batch": "batch",
+    "min_power_file": "batch",
+    "load_network": "cache",
+    "min_power_parallel": "parallel",
+    "TruckCatalog": "truck_catalog",
+    "allocate": "allocation",
+    "BUDGET": "allocation",
+    "QueryServer": "server",
+    "Client": "server",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value #les accès suivants ne passent plus par __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
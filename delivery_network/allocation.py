@@ -0,0 +1,163 @@
+"""
+Choix des trajets à couvrir sous contrainte de budget.
+
+Chaque trajet i rapporte profits[i] s'il est couvert et coûte costs[i] (le prix du camion le moins cher capable de le
+couvrir). Il faut choisir les trajets qui maximisent le profit total sans dépasser le budget : c'est un problème de
+sac à dos en 0/1. On propose deux modes :
+    - "greedy" : on trie les trajets par rapport profit / coût décroissant et on prend tous ceux qui rentrent encore
+      dans le budget (rapide, O(T log T)) ;
+    - "exact" : on part de la même liste triée ; les trajets très rentables (avant le premier trajet qui ne rentre plus)
+      et très peu rentables sont fixés comme dans la solution gloutonne, et on résout exactement par séparation et
+      évaluation (bornes de la relaxation continue) le sac à dos restreint aux trajets proches de ce point de rupture.
+Dans les deux cas on renvoie aussi la borne supérieure de la relaxation continue, qui permet de mesurer l'écart à
+l'optimum.
+"""
+
+import time
+
+BUDGET = 25 * 10**9
+
+
+def _ratio_order(profits, costs):
+    """
+    but: renvoyer les indices des trajets utiles (profit > 0) triés par rapport profit / coût décroissant
+    (les trajets gratuits d'abord).
+    """
+    utiles = [i for i in range(len(profits)) if profits[i] > 0 and costs[i] is not None]
+    return sorted(utiles, key=lambda i: (costs[i] > 0, -profits[i] / costs[i] if costs[i] > 0 else 0))
+
+
+def upper_bound(profits, costs, budget, ordre=None):
+    """
+    Renvoie la borne supérieure de Dantzig : la valeur optimale de la relaxation continue du sac à dos
+    (on prend les trajets par rapport décroissant, puis une fraction du premier qui ne rentre pas).
+    """
+    if ordre is None:
+        ordre = _ratio_order(profits, costs)
+    reste, valeur = budget, 0
+    for i in ordre:
+        if costs[i] <= reste:
+            reste -= costs[i]
+            valeur += profits[i]
+        else:
+            return valeur + profits[i] * reste / costs[i]
+    return valeur
+
+
+def _greedy(profits, costs, budget, ordre):
+    """
+    but: prendre les trajets par rapport décroissant tant qu'ils rentrent dans le budget (en continuant après le
+    premier refus : un trajet moins rentable mais moins cher peut encore rentrer).
+    """
+    reste = budget
+    choisis = []
+    for i in ordre:
+        if costs[i] <= reste:
+            reste -= costs[i]
+            choisis.append(i)
+    return choisis
+
+
+def _branch_and_bound(profits, costs, capacity, node_limit):
+    """
+    but: résoudre exactement un petit sac à dos (objets déjà triés par rapport décroissant) par une recherche en
+    profondeur qui coupe les branches dont la borne de la relaxation continue ne dépasse pas la meilleure solution.
+    La recherche est itérative (pile explicite) : la profondeur, égale au nombre d'objets, n'est pas limitée par la
+    pile d'appels de python.
+    Renvoie (valeur, liste des positions choisies, True si la recherche est allée jusqu'au bout).
+    """
+    n = len(profits)
+    meilleur, meilleurs_choix = 0, []
+    choix = []
+    noeuds = 0
+
+    def borne(i, reste, valeur):
+        for j in range(i, n):
+            if costs[j] <= reste:
+                reste -= costs[j]
+                valeur += profits[j]
+            else:
+                return valeur + profits[j] * reste / costs[j]
+        return valeur
+
+    # un noeud : (objet i à décider, budget restant, valeur, longueur de choix chez le parent, objet pris ou -1)
+    pile = [(0, capacity, 0, 0, -1)]
+    while pile:
+        i, reste, valeur, longueur, pris = pile.pop()
+        del choix[longueur:]
+        if pris != -1:
+            choix.append(pris)
+        noeuds += 1
+        if valeur > meilleur:
+            meilleur, meilleurs_choix = valeur, list(choix)
+        if i == n or noeuds > node_limit or borne(i, reste, valeur) <= meilleur:
+            continue
+        # la branche où l'on prend l'objet i est explorée en entier avant celle où on le laisse
+        pile.append((i + 1, reste, valeur, len(choix), -1))
+        if costs[i] <= reste:
+            pile.append((i + 1, reste - costs[i], valeur + profits[i], len(choix), i))
+    return meilleur, meilleurs_choix, noeuds <= node_limit
+
+
+def allocate(profits, costs, budget=BUDGET, mode="greedy", core_size=100, node_limit=200000):
+    """
+    Choisit les trajets à couvrir pour maximiser le profit total sans dépasser le budget.
+
+    Parameters:
+    -----------
+    profits: list
+        profits[i] est le profit du trajet i.
+    costs: list
+        costs[i] est le coût pour couvrir le trajet i (None si aucun camion ne peut le couvrir).
+    budget: numeric
+        Le budget total. Default is 25e9.
+    mode: str
+        "greedy" ou "exact" (voir le début du fichier).
+    core_size: int
+        Pour le mode "exact", nombre de trajets de part et d'autre du point de rupture laissés libres.
+    node_limit: int
+        Pour le mode "exact", nombre maximal de noeuds explorés (au-delà on garde la meilleure solution trouvée).
+
+    Outputs:
+    -----------
+    resultat: dict
+        selected (indices des trajets choisis, dans l'ordre croissant), profit, spend, upper_bound, gap (écart relatif
+        à la borne supérieure), core_optimal (True si la recherche exacte sur les trajets proches du point de rupture
+        est allée jusqu'au bout), mode, time.
+    """
+    if mode not in ("greedy", "exact"):
+        raise ValueError(f"mode inconnu : {mode}")
+    t0 = time.perf_counter()
+    ordre = _ratio_order(profits, costs)
+    choisis = _greedy(profits, costs, budget, ordre)
+    core_optimal = False
+
+    if mode == "exact":
+        # point de rupture : premier trajet (dans l'ordre des rapports) qui ne rentre plus dans le budget
+        reste, rupture = budget, len(ordre)
+        for k, i in enumerate(ordre):
+            if costs[i] > reste:
+                rupture = k
+                break
+            reste -= costs[i]
+        debut, fin = max(0, rupture - core_size), min(len(ordre), rupture + core_size)
+        fixes = ordre[:debut]
+        coeur = ordre[debut:fin]
+        capacite = budget - sum(costs[i] for i in fixes)
+        valeur, positions, core_optimal = _branch_and_bound([profits[i] for i in coeur], [costs[i] for i in coeur],
+                                                       capacite, node_limit)
+        candidat = fixes + [coeur[k] for k in positions]
+        # on complète avec les trajets hors du coeur qui rentrent encore
+        reste = budget - sum(costs[i] for i in candidat)
+        for i in ordre[fin:]:
+            if costs[i] <= reste:
+                reste -= costs[i]
+                candidat.append(i)
+        if sum(profits[i] for i in candidat) >= sum(profits[i] for i in choisis):
+            choisis = candidat
+
+    profit = sum(profits[i] for i in choisis)
+    borne = upper_bound(profits, costs, budget, ordre)
+    return {"selected": sorted(choisis), "profit": profit, "spend": sum(costs[i] for i in choisis),
+            "upper_bound": borne, "gap": (borne - profit) / borne if borne else 0.0,
+            "core_optimal": core_optimal, "mode": mode, "time": time.perf_counter() - t0}
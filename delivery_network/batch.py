@@ -0,0 +1,158 @@
+from .graph import graph_from_file
+from .routes_io import CHUNK_SIZE, RoutesWriter, iter_route_chunks
+from . import instrumentation
+
+
+def sorted_edges(graph):
+    """
+    Renvoie la liste des arêtes du graphe sous la forme (power, i, j), i et j étant les indices des extrémités dans
+    l'ordre de graph.graph, par puissance croissante. C'est la seule partie de min_power_batch qui ne dépend pas des
+    trajets : on peut la calculer une fois pour plusieurs paquets de trajets.
+    """
+    index = {node: i for i, node in enumerate(graph.graph)}
+    edges = [(power, index[node1], index[node2]) for node1, node2, power, _ in graph.edges()]
+    edges.sort()
+    return edges
+
+
+def min_power_batch(graph, pairs, edges=None):
+    """
+    Calcule la puissance minimale de chaque trajet (src, dest) de pairs, tous ensemble.
+
+    On trie les arêtes une seule fois par puissance croissante, puis on les ajoute une à une dans une structure
+    Union-Find (comme dans Kruskal). Chaque composante garde la liste des trajets dont une seule extrémité est dans
+    la composante. Quand l'arête de puissance p fusionne deux composantes, on parcourt la plus petite des deux listes :
+    les trajets dont l'autre extrémité est dans l'autre composante deviennent possibles exactement à la puissance p,
+    les autres passent dans la liste de la nouvelle composante.
+
+    Parameters:
+    -----------
+    graph: Graph
+    pairs: list
+        liste de trajets (src, dest)
+    edges: list, optional
+        les arêtes triées renvoyées par sorted_edges(graph), si elles ont déjà été calculées
+
+    Outputs:
+    -----------
+    powers: list
+        powers[q] est la puissance minimale du trajet q, ou None si src et dest ne sont pas reliés.
+    """
+    pairs = list(pairs)
+    index = {node: i for i, node in enumerate(graph.graph)}
+    n = len(index)
+    powers = [None] * len(pairs)
+    ends = []
+    pending = [[] for _ in range(n)] #trajets en attente pour chaque composante (indexée par sa racine)
+    restants = 0
+    for q, (src, dest) in enumerate(pairs):
+        a, b = index[src], index[dest]
+        ends.append((a, b))
+        if a == b:
+            powers[q] = 0
+        else:
+            pending[a].append(q)
+            pending[b].append(q)
+            restants += 1
+    if not restants:
+        return powers
+
+    if edges is None:
+        edges = sorted_edges(graph)
+
+    parent = list(range(n))
+    size = [1] * n
+
+    def find(x):
+        racine = x
+        while parent[racine] != racine:
+            racine = parent[racine]
+        while parent[x] != racine: #compression de chemin
+            parent[x], x = racine, parent[x]
+        return racine
+
+    for power, a, b in edges:
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        # rs : composante dont la liste de trajets est la plus petite, rl : l'autre
+        if len(pending[ra]) < len(pending[rb]):
+            rs, rl = ra, rb
+        else:
+            rs, rl = rb, ra
+        grande = pending[rl]
+        for q in pending[rs]:
+            if powers[q] is not None:
+                continue
+            x, y = ends[q]
+            autre = y if find(x) == rs else x
+            if find(autre) == rl:
+                powers[q] = power
+                restants -= 1
+            else:
+                grande.append(q)
+        pending[rs] = []
+        # union par taille, la nouvelle racine récupère la liste fusionnée
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        parent[rb] = ra
+        size[ra] += size[rb]
+        pending[ra] = grande
+        if ra != rl:
+            pending[rl] = []
+        if not restants:
+            break
+    return powers
+
+
+def min_power_file(filenetwork, fileroute, fileout=None, cache=False, workers=None, chunk_size=CHUNK_SIZE,
+                   out_of_core=False):
+    """
+    Calcule la puissance minimale de tous les trajets du fichier fileroute sur le réseau filenetwork
+    et écrit une puissance par ligne dans fileout (par défaut routes.x.out à côté de routes.x.in).
+    Si cache est True, le réseau prétraité est relu depuis le cache sur disque (voir cache.py) et les trajets sont
+    traités en flux, par paquets de chunk_size : chaque paquet est lu, résolu sur l'arbre couvrant minimal puis écrit,
+    la mémoire utilisée ne dépend donc pas du nombre de trajets. Si workers est supérieur à 1, les paquets sont
+    répartis entre plusieurs processus (voir parallel.py, qui utilise toujours le cache). Si out_of_core est True,
+    l'arbre couvrant minimal est calculé sans charger le réseau en mémoire (voir out_of_core.py), puis les trajets sont
+    traités en flux de la même façon.
+    Sinon le réseau est chargé (graph_from_file), ses arêtes sont triées une seule fois (sorted_edges), puis chaque
+    paquet de trajets est résolu par min_power_batch et écrit avant de lire le suivant : là aussi, seul un paquet de
+    trajets est en mémoire à la fois.
+    """
+    if fileout is None:
+        fileout = fileroute[:-2] + "out"
+    paquets = iter_route_chunks(fileroute, chunk_size)
+    with RoutesWriter(fileout) as writer:
+        if workers is not None and workers > 1:
+            from .parallel import min_power_parallel_iter
+            for powers in min_power_parallel_iter(filenetwork, paquets, workers):
+                writer.write_many(powers)
+        elif cache or out_of_core:
+            with instrumentation.stage("load_cache"):
+                if out_of_core:
+                    from .out_of_core import load_forest
+                    tree = load_forest(filenetwork)[1]
+                else:
+                    from .cache import load_network
+                    tree = load_network(filenetwork)[2]
+            for paquet in paquets:
+                with instrumentation.stage("min_power_many"):
+                    powers = tree.min_power_many([route[0] for route in paquet], [route[1] for route in paquet])
+                writer.write_many(powers)
+        else:
+            g = graph_from_file(filenetwork)
+            edges = sorted_edges(g)
+            for paquet in paquets:
+                with instrumentation.stage("min_power_batch"):
+                    powers = min_power_batch(g, [(route[0], route[1]) for route in paquet], edges)
+                writer.write_many(powers)
+    return fileout
+
+
+def write_powers(fileout, powers):
+    """
+    Écrit une puissance par ligne dans fileout (format des fichiers routes.x.out).
+    """
+    with RoutesWriter(fileout) as writer:
+        writer.write_many(powers)
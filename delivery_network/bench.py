@@ -0,0 +1,187 @@
+"""
+Banc d'essai des différentes façons de calculer min_power sur les fichiers network.x.in / routes.x.in.
+
+Pour chaque réseau on mesure le chargement, la construction de l'arbre couvrant minimal, le prétraitement de la
+structure de requêtes, puis pour chaque stratégie la latence de chaque requête (p50, p95, p99) et le débit.
+Les résultats sont écrits en JSON pour pouvoir comparer deux versions du code.
+
+Exemple (depuis la racine du dépôt) :
+    python -m delivery_network bench --input input --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from .graph import graph_from_file, kruskal, routes_from_file
+
+try:
+    import resource #Unix seulement : le pic de mémoire du processus n'est alors pas mesuré ailleurs
+except ImportError:
+    resource = None
+
+# nombre de trajets mesurés par défaut pour chaque stratégie (min_power fait plusieurs parcours du graphe par trajet)
+MAX_QUERIES = {"min_power": 20, "min_power_dijkstra": 200, "min_power_kruskal": 10000, "tree": 100000,
+               "batch": None}
+
+
+def percentiles(latences):
+    """
+    Renvoie la moyenne et les percentiles 50, 95 et 99 d'une liste de durées (en secondes).
+    """
+    if not latences:
+        return {"mean": None, "p50": None, "p95": None, "p99": None}
+    triees = sorted(latences)
+
+    def centile(q):
+        return triees[min(len(triees) - 1, int(q * len(triees)))]
+
+    return {"mean": sum(triees) / len(triees), "p50": centile(0.50), "p95": centile(0.95), "p99": centile(0.99)}
+
+
+def chrono(fonction, *args):
+    """
+    Renvoie (résultat, durée en secondes, pic de mémoire allouée en octets ou None) d'un appel à fonction.
+    Le pic de mémoire n'est mesuré que si tracemalloc est actif (option --memory).
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    resultat = fonction(*args)
+    duree = time.perf_counter() - t0
+    pic = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+    return resultat, duree, pic
+
+
+def bench_queries(query, pairs):
+    """
+    Mesure la latence de chaque appel query(src, dest) et le débit sur l'ensemble des trajets.
+    """
+    latences = []
+    t0 = time.perf_counter()
+    for src, dest in pairs:
+        t = time.perf_counter()
+        query(src, dest)
+        latences.append(time.perf_counter() - t)
+    total = time.perf_counter() - t0
+    resultat = {"queries": len(pairs), "total": total, "throughput": len(pairs) / total if total else None}
+    resultat.update(percentiles(latences))
+    return resultat
+
+
+def bench_network(network, routes, strategies, max_queries, seed=0):
+    """
+    Lance toutes les mesures pour un réseau et son fichier de trajets. Renvoie un dictionnaire de résultats.
+    process_max_rss_kb est le pic de mémoire résidente de tout le processus depuis son lancement (Unix seulement) :
+    il est cumulatif, un réseau mesuré après un plus gros reporte le pic de ce dernier. Le pic propre à chaque étape
+    est peak_memory (option --memory).
+    """
+    resultats = {"network": network, "routes": routes, "stages": {}, "strategies": {}}
+    g, duree, pic = chrono(graph_from_file, network)
+    resultats["nb_nodes"], resultats["nb_edges"] = g.nb_nodes, g.nb_edges
+    resultats["stages"]["load"] = {"time": duree, "peak_memory": pic}
+    mst, duree, pic = chrono(kruskal, g)
+    resultats["stages"]["mst"] = {"time": duree, "peak_memory": pic}
+    tree, duree, pic = chrono(g.min_power_tree, mst) #sans refaire Kruskal ; min_power_kruskal la réutilise ensuite
+    resultats["stages"]["preprocessing"] = {"time": duree, "peak_memory": pic}
+
+    trajets, duree, _ = chrono(routes_from_file, routes)
+    resultats["stages"]["load_routes"] = {"time": duree, "routes": len(trajets)}
+    pairs = [(src, dest) for src, dest, _ in trajets]
+
+    tirage = random.Random(seed)
+    for nom in strategies:
+        limite = max_queries.get(nom)
+        echantillon = pairs if limite is None or limite >= len(pairs) else tirage.sample(pairs, limite)
+        if nom == "batch":
+            _, duree, pic = chrono(g.min_power_batch, echantillon)
+            resultats["strategies"][nom] = {"queries": len(echantillon), "total": duree, "peak_memory": pic,
+                                            "throughput": len(echantillon) / duree if duree else None}
+        else:
+            query = {"min_power": g.min_power, "min_power_dijkstra": g.min_power_dijkstra,
+                     "min_power_kruskal": g.min_power_kruskal, "tree": tree.min_power}[nom]
+            resultats["strategies"][nom] = bench_queries(query, echantillon)
+    resultats["process_max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None
+    return resultats
+
+
+def find_inputs(dossier, numeros):
+    """
+    Renvoie la liste des couples (network.x.in, routes.x.in) présents dans dossier pour x dans numeros.
+    """
+    couples = []
+    for x in numeros:
+        network = os.path.join(dossier, f"network.{x}.in")
+        routes = os.path.join(dossier, f"routes.{x}.in")
+        if os.path.exists(network) and os.path.exists(routes):
+            couples.append((network, routes))
+    return couples
+
+
+def add_arguments(parser):
+    """
+    Ajoute les options du banc d'essai à parser (aussi utilisé par la commande delivery-network bench).
+    """
+    parser.add_argument("--input", default="input", help="dossier contenant network.x.in et routes.x.in")
+    parser.add_argument("--networks", default="1-10", help="numéros des réseaux, par exemple 1-10 ou 1,2,5")
+    parser.add_argument("--strategies", default=",".join(MAX_QUERIES),
+                        help="stratégies à mesurer parmi " + ", ".join(MAX_QUERIES))
+    parser.add_argument("--max-queries", type=int, default=None,
+                        help="nombre maximal de trajets mesurés par stratégie (remplace les valeurs par défaut)")
+    parser.add_argument("--memory", action="store_true", help="mesurer le pic de mémoire de chaque étape (plus lent)")
+    parser.add_argument("--label", default=None, help="nom de la version mesurée, recopié dans les résultats")
+    parser.add_argument("--output", default=None, help="fichier JSON où écrire les résultats")
+
+
+def run(args, parser):
+    """
+    Lance le banc d'essai avec les options args (lues par parser). Renvoie les résultats.
+    """
+    numeros = []
+    for morceau in args.networks.split(","):
+        if "-" in morceau:
+            debut, fin = map(int, morceau.split("-"))
+            numeros.extend(range(debut, fin + 1))
+        else:
+            numeros.append(int(morceau))
+    strategies = [nom for nom in args.strategies.split(",") if nom]
+    for nom in strategies:
+        if nom not in MAX_QUERIES:
+            parser.error(f"stratégie inconnue : {nom}")
+    max_queries = dict(MAX_QUERIES)
+    if args.max_queries is not None:
+        max_queries = {nom: args.max_queries for nom in MAX_QUERIES}
+
+    if args.memory:
+        tracemalloc.start()
+    resultats = {"label": args.label, "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                 "platform": platform.platform(), "runs": []}
+    for network, routes in find_inputs(args.input, numeros):
+        mesures = bench_network(network, routes, strategies, max_queries)
+        resultats["runs"].append(mesures)
+        print(f"{network}: load {mesures['stages']['load']['time']:.3f}s, mst {mesures['stages']['mst']['time']:.3f}s, "
+              f"preprocessing {mesures['stages']['preprocessing']['time']:.3f}s")
+        for nom, mesure in mesures["strategies"].items():
+            ligne = f"  {nom}: {mesure['queries']} trajets, {mesure['throughput'] or 0:.0f} trajets/s"
+            if "p50" in mesure and mesure["p50"] is not None:
+                ligne += f", p50 {mesure['p50'] * 1e6:.1f}us, p95 {mesure['p95'] * 1e6:.1f}us, p99 {mesure['p99'] * 1e6:.1f}us"
+            print(ligne)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(resultats, file, indent=2)
+    return resultats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des stratégies de calcul de min_power")
+    add_arguments(parser)
+    return run(parser.parse_args(argv), parser)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,10 @@
-from graph import Graph, graph_from_file
+from .graph import Graph, graph_from_file
 
 def find_all_paths(self, src, dest, path=[]):
         """
         Renvoie tous les chemins entre src et dest 
         """
-        test=False
-
-        for liste in self.connected_components_set(): #on vérifie si les pt de départ et d'arrivé sont reliés pour savoir si un chemin existe
-            if src and dest in liste:
-                test=True
+        test=self.same_component(src, dest) #on vérifie si les pt de départ et d'arrivé sont reliés pour savoir si un chemin existe
 
         if not test:
             paths=None
@@ -0,0 +1,213 @@
+"""
+Cache sur disque des réseaux prétraités.
+
+Un fichier de cache contient, à la suite :
+    - la ligne MAGIC,
+    - la taille (8 octets, little endian) puis le texte d'un en-tête JSON : la description des données (fichier source,
+      empreinte sha1 de son contenu, noeuds, et pour chaque tableau son type, sa position et sa longueur),
+    - les tableaux eux-mêmes, octet par octet, chacun aligné sur 8 octets.
+Les tableaux sont relus avec mmap : ils ne sont pas copiés en mémoire, le système ne charge que les pages utilisées,
+et plusieurs processus qui ouvrent le même fichier partagent les mêmes pages.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from array import array
+from contextlib import contextmanager
+from itertools import chain
+from .compact_graph import CompactGraph
+from .min_power_tree import MinPowerTree, _column_code
+
+MAGIC = b"DELIVERY-NETWORK-CACHE-1\n"
+
+
+def file_hash(filename):
+    """
+    Renvoie l'empreinte sha1 du contenu d'un fichier.
+    """
+    h = hashlib.sha1()
+    with open(filename, "rb") as file:
+        for bloc in iter(lambda: file.read(1 << 20), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+def _layout(meta, shapes):
+    """
+    but: renvoyer (descriptions, header, debut, taille) pour des tableaux décrits par shapes (dictionnaire
+    nom -> (type, longueur)) : la position de chaque tableau, l'en-tête JSON, le début et la taille des données.
+    """
+    descriptions = {}
+    position = 0
+    for name, (code, longueur) in shapes.items():
+        descriptions[name] = [code, position, longueur]
+        position += (longueur * array(code).itemsize + 7) // 8 * 8
+    header = json.dumps({"meta": meta, "arrays": descriptions}).encode()
+    debut = (len(MAGIC) + 8 + len(header) + 7) // 8 * 8
+    return descriptions, header, debut, position
+
+
+def _write_header(file, header, debut):
+    file.write(MAGIC)
+    file.write(len(header).to_bytes(8, "little"))
+    file.write(header)
+    file.write(b"\0" * (debut - file.tell()))
+
+
+def write_arrays(path, meta, arrays):
+    """
+    Écrit les tableaux arrays (dictionnaire nom -> array) et le dictionnaire meta dans le fichier path.
+    Le fichier est d'abord écrit à côté puis renommé, pour qu'un lecteur ne voie jamais un fichier à moitié écrit.
+    """
+    _, header, debut, _ = _layout(meta, {name: (_column_code(values), len(values)) for name, values in arrays.items()})
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as file:
+        _write_header(file, header, debut)
+        for values in arrays.values():
+            octets = memoryview(values).cast("B")
+            file.write(octets)
+            file.write(b"\0" * (-len(octets) % 8))
+    os.replace(tmp, path)
+
+
+@contextmanager
+def create_arrays(path, meta, shapes):
+    """
+    Crée le fichier path au format de write_arrays avec des tableaux remplis de zéros, décrits par shapes (dictionnaire
+    nom -> (type, longueur)), et donne dans un bloc with le dictionnaire nom -> memoryview modifiable sur le fichier
+    projeté en mémoire : les tableaux sont remplis en place sans jamais devoir tenir en mémoire. Comme pour
+    write_arrays, le fichier n'est mis à sa place qu'à la fin du bloc (et il est effacé en cas d'erreur).
+    Les memoryview ne sont plus utilisables après le bloc.
+    """
+    descriptions, header, debut, taille = _layout(meta, shapes)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w+b") as file:
+        _write_header(file, header, debut)
+        file.truncate(debut + taille) #les données valent zéro (fichier creux tant qu'elles ne sont pas écrites)
+        projection = mmap.mmap(file.fileno(), 0)
+    donnees = memoryview(projection)
+    morceaux = {name: donnees[debut + position: debut + position + longueur * array(code).itemsize]
+                for name, (code, position, longueur) in descriptions.items()}
+    arrays = {name: morceau.cast(descriptions[name][0]) for name, morceau in morceaux.items()}
+    try:
+        yield arrays
+    except BaseException:
+        _release(arrays, morceaux, donnees, projection)
+        os.remove(tmp)
+        raise
+    projection.flush()
+    _release(arrays, morceaux, donnees, projection)
+    os.replace(tmp, path)
+
+
+def _release(arrays, morceaux, donnees, projection):
+    # la projection ne peut être fermée qu'une fois toutes les vues sur elle libérées
+    for vue in chain(arrays.values(), morceaux.values(), [donnees]):
+        vue.release()
+    projection.close()
+
+
+def read_arrays(path):
+    """
+    Relit un fichier écrit par write_arrays. Renvoie (meta, arrays) où les tableaux sont des memoryview
+    sur le fichier projeté en mémoire (aucune copie). Renvoie (None, None) si le fichier n'est pas un cache valide.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            return None, None
+        taille = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(taille))
+        debut = (len(MAGIC) + 8 + taille + 7) // 8 * 8
+        donnees = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    arrays = {}
+    for name, (code, position, longueur) in header["arrays"].items():
+        taille = longueur * array(code).itemsize
+        arrays[name] = donnees[debut + position: debut + position + taille].cast(code)
+    return header["meta"], arrays
+
+
+def cache_path(filename, cache_dir=None):
+    """
+    Renvoie le chemin du fichier de cache associé au fichier network.x.in filename
+    (par défaut dans un dossier .cache à côté de filename).
+    """
+    filename = os.path.abspath(filename)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(filename), ".cache")
+    nom = hashlib.sha1(filename.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(filename)}.{nom}.bin")
+
+
+def _labels_to_json(labels):
+    if isinstance(labels, range):
+        return {"range": [labels.start, labels.stop, labels.step]}
+    return {"list": list(labels)}
+
+
+def _labels_from_json(labels):
+    if "range" in labels:
+        return range(*labels["range"])
+    return labels["list"]
+
+
+def save_network(path, graph, mst, tree, meta=None):
+    """
+    Enregistre dans path le graphe compact, son arbre couvrant minimal (mst : indices des arêtes gardées par
+    Kruskal dans les colonnes edge_* du graphe) et les tables de la structure de requêtes.
+    """
+    arrays = {f"graph.{name}": values for name, values in graph.columns().items()}
+    arrays["mst"] = array("q", mst)
+    tables = tree.tables()
+    levels = tables.pop("levels")
+    arrays.update({f"tree.{name}": values for name, values in tables.items()})
+    meta = dict(meta or {})
+    meta.update({"labels": _labels_to_json(graph.labels), "levels": levels})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_arrays(path, meta, arrays)
+
+
+def load_network(filename, cache_dir=None):
+    """
+    Charge le réseau filename avec son arbre couvrant minimal et sa structure de requêtes.
+
+    Au premier appel, le fichier est lu (CompactGraph), Kruskal et les tables de MinPowerTree sont calculés, et tout
+    est enregistré dans un fichier de cache. Les appels suivants relisent ce fichier en quelques millisecondes, tant que
+    le contenu de filename n'a pas changé (on compare l'empreinte sha1 du contenu).
+
+    Outputs:
+    -----------
+    graph: CompactGraph
+    mst: array
+        Les indices des arêtes de la forêt couvrante minimale dans les colonnes edge_* de graph.
+    tree: MinPowerTree
+    """
+    path = cache_path(filename, cache_dir)
+    empreinte = file_hash(filename)
+    if os.path.exists(path):
+        network = read_network_cache(path)
+        if network is not None and network[0] == empreinte:
+            return network[1:]
+
+    graph = CompactGraph.from_file(filename)
+    mst = graph.mst_edges()
+    tree = graph.min_power_tree(mst)
+    save_network(path, graph, mst, tree, {"source": os.path.abspath(filename), "sha1": empreinte})
+    return graph, mst, tree
+
+
+def read_network_cache(path):
+    """
+    Relit un fichier écrit par save_network. Renvoie (empreinte du fichier source, graph, mst, tree),
+    ou None si path n'est pas un cache valide.
+    """
+    meta, arrays = read_arrays(path)
+    if meta is None:
+        return None
+    labels = _labels_from_json(meta["labels"])
+    graph = CompactGraph.from_arrays(labels, {name[6:]: values for name, values in arrays.items()
+                                              if name.startswith("graph.")})
+    tables = {name[5:]: values for name, values in arrays.items() if name.startswith("tree.")}
+    tables["levels"] = meta["levels"]
+    return meta.get("sha1"), graph, arrays["mst"], MinPowerTree.from_arrays(labels, tables)
@@ -0,0 +1,155 @@
+"""
+Ligne de commande delivery-network (ou python -m delivery_network), avec une sous-commande par tâche :
+    load      lire un réseau et afficher sa taille (et remplir le cache du réseau prétraité avec --cache)
+    mst       calculer la forêt couvrante minimale d'un réseau
+    minpower  puissance minimale d'un trajet, ou de tous les trajets d'un fichier routes.x.in
+    allocate  choisir les trajets et les camions sous contrainte de budget
+    bench     banc d'essai des stratégies de calcul de min_power (voir bench.py)
+Les options --stats et --profile, placées avant la sous-commande, activent les mesures internes (instrumentation.py).
+"""
+
+import argparse
+import sys
+import time
+
+
+def cmd_load(args):
+    t0 = time.perf_counter()
+    if args.cache:
+        from .cache import load_network
+        graph = load_network(args.network)[0]
+        nb_nodes, nb_edges = len(graph.labels), len(graph.edge_power)
+    else:
+        from .graph import graph_from_file
+        graph = graph_from_file(args.network)
+        nb_nodes, nb_edges = graph.nb_nodes, graph.nb_edges
+    print(f"{args.network}: {nb_nodes} noeuds, {nb_edges} arêtes, chargé en {time.perf_counter() - t0:.3f}s")
+
+
+def cmd_mst(args):
+    if args.out_of_core:
+        from .out_of_core import external_kruskal, save_forest
+        n, m, node1, node2, power = external_kruskal(args.network)
+        print(f"{args.network}: forêt couvrante de {len(power)} arêtes, puissance totale {sum(power)}")
+        if args.output is not None: #fichier binaire, relu par out_of_core.read_forest
+            save_forest(args.output, n, node1, node2, power, {"source": args.network, "nb_edges": m})
+        return
+    from .graph import graph_from_file, kruskal
+    mst = kruskal(graph_from_file(args.network))
+    edges = list(mst.edges())
+    print(f"{args.network}: forêt couvrante de {len(edges)} arêtes, puissance totale "
+          f"{sum(power for _, _, power, _ in edges)}")
+    if args.output is not None: #même format que les fichiers network.x.in
+        with open(args.output, "w") as file:
+            file.write(f"{mst.nb_nodes} {len(edges)}\n")
+            file.writelines(f"{node1} {node2} {power} {dist}\n" for node1, node2, power, dist in edges)
+
+
+def cmd_minpower(args):
+    if args.routes is not None:
+        from .batch import min_power_file
+        print(min_power_file(args.network, args.routes, args.output, not args.no_cache, args.workers,
+                             out_of_core=args.out_of_core))
+        return
+    if args.src is None or args.dest is None:
+        raise SystemExit("minpower : donner un fichier de trajets, ou --src et --dest")
+    if args.out_of_core:
+        from .out_of_core import load_forest
+        tree = load_forest(args.network)[1]
+    elif args.no_cache:
+        from .graph import graph_from_file
+        tree = graph_from_file(args.network).min_power_tree()
+    else:
+        from .cache import load_network
+        tree = load_network(args.network)[2]
+    power = tree.min_power(args.src, args.dest)
+    if power is None:
+        print(f"pas de chemin entre {args.src} et {args.dest}")
+    else:
+        print(f"puissance {power}, chemin {tree.get_path(args.src, args.dest)}")
+
+
+def cmd_allocate(args):
+    from .glouton import glouton
+    allocation = glouton(args.network, args.routes, args.trucks, args.budget, args.mode, args.output,
+                         not args.no_cache, not args.no_paths, args.workers)
+    print(f"{len(allocation['selected'])} trajets, profit {allocation['profit']}, dépense {allocation['spend']}, "
+          f"borne supérieure {allocation['upper_bound']:.0f}")
+    print(", ".join(f"{etape} {duree:.3f}s" for etape, duree in allocation["timings"].items()))
+
+
+def cmd_bench(args):
+    from .bench import run
+    run(args, args.parser)
+
+
+def build_parser():
+    """
+    Renvoie le parseur de la ligne de commande.
+    """
+    from .allocation import BUDGET
+    parser = argparse.ArgumentParser(prog="delivery-network", description="Réseau de livraison : puissance minimale "
+                                     "des trajets et allocation des camions")
+    parser.add_argument("--stats", default=None, help="fichier JSON où écrire les mesures internes")
+    parser.add_argument("--profile", default=None, help="fichier où écrire les statistiques de cProfile")
+    commandes = parser.add_subparsers(dest="command", required=True)
+
+    load = commandes.add_parser("load", help="lire un réseau")
+    load.add_argument("network", help="fichier network.x.in")
+    load.add_argument("--cache", action="store_true", help="passer par le cache du réseau prétraité")
+    load.set_defaults(func=cmd_load)
+
+    mst = commandes.add_parser("mst", help="forêt couvrante minimale d'un réseau")
+    mst.add_argument("network", help="fichier network.x.in")
+    mst.add_argument("-o", "--output", default=None, help="fichier où écrire les arêtes de la forêt")
+    mst.add_argument("--out-of-core", action="store_true",
+                     help="ne pas charger le réseau en mémoire (la forêt est alors écrite en binaire)")
+    mst.set_defaults(func=cmd_mst)
+
+    minpower = commandes.add_parser("minpower", help="puissance minimale d'un ou de plusieurs trajets")
+    minpower.add_argument("network", help="fichier network.x.in")
+    minpower.add_argument("routes", nargs="?", default=None, help="fichier routes.x.in")
+    minpower.add_argument("--src", type=int, default=None, help="départ d'un trajet unique")
+    minpower.add_argument("--dest", type=int, default=None, help="arrivée d'un trajet unique")
+    minpower.add_argument("-o", "--output", default=None, help="fichier de sortie (par défaut routes.x.out)")
+    minpower.add_argument("--no-cache", action="store_true", help="ne pas utiliser le cache du réseau prétraité")
+    minpower.add_argument("-j", "--workers", type=int, default=None, help="nombre de processus de calcul")
+    minpower.add_argument("--out-of-core", action="store_true",
+                          help="calculer l'arbre couvrant minimal sans charger le réseau en mémoire")
+    minpower.set_defaults(func=cmd_minpower)
+
+    allocate = commandes.add_parser("allocate", help="allocation des camions sous contrainte de budget")
+    allocate.add_argument("network", help="fichier network.x.in")
+    allocate.add_argument("routes", help="fichier routes.x.in")
+    allocate.add_argument("trucks", help="fichier trucks.x.in")
+    allocate.add_argument("--budget", type=int, default=BUDGET)
+    allocate.add_argument("--mode", choices=["greedy", "exact"], default="greedy")
+    allocate.add_argument("-o", "--output", default=None, help="fichier où écrire la puissance de chaque trajet")
+    allocate.add_argument("--no-cache", action="store_true", help="ne pas utiliser le cache du réseau prétraité")
+    allocate.add_argument("--no-paths", action="store_true", help="ne pas reconstruire les chemins")
+    allocate.add_argument("-j", "--workers", type=int, default=None, help="nombre de processus de calcul")
+    allocate.set_defaults(func=cmd_allocate)
+
+    from .bench import add_arguments
+    bench = commandes.add_parser("bench", help="banc d'essai des stratégies de calcul de min_power")
+    add_arguments(bench)
+    bench.set_defaults(func=cmd_bench, parser=bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.stats is None and args.profile is None:
+        return args.func(args)
+    from . import instrumentation
+    instrumentation.enable()
+    try:
+        if args.profile is not None:
+            resultat, texte = instrumentation.profile(args.func, args, output=args.profile)
+            print(texte, file=sys.stderr)
+            return resultat
+        return args.func(args)
+    finally:
+        instrumentation.disable()
+        if args.stats is not None:
+            instrumentation.write_summary(args.stats)
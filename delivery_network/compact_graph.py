@@ -0,0 +1,257 @@
+from array import array
+from .graph import Graph, read_network, kruskal_edges
+from .min_power_tree import MinPowerTree, _typecode, _column_code, _index_labels
+
+
+class CompactGraph:
+    """
+    Représentation compacte d'un graphe non orienté, stockée dans des tableaux (format CSR) plutôt que dans un
+    dictionnaire de listes de tuples. Les noeuds sont numérotés de 0 à n-1 en interne, les voisins du noeud i sont
+    neighbor[offsets[i]:offsets[i+1]] (avec les puissances et distances correspondantes aux mêmes positions).
+    Une arête coûte ainsi quelques entiers de 8 octets au lieu d'un tuple et de trois objets Python par sens.
+
+    Attributes:
+    -----------
+    labels: list
+        labels[i] est le nom du noeud d'indice i.
+    index: dict
+        index[noeud] est l'indice du noeud.
+    offsets: array
+        début de la liste d'adjacence de chaque noeud (taille n+1).
+    neighbor, power, dist: array
+        colonnes des listes d'adjacence (chaque arête y apparaît deux fois, une par sens).
+    edge_node1, edge_node2, edge_power, edge_dist: array
+        colonnes des arêtes, chacune une seule fois (indices des extrémités).
+    nb_nodes: int
+    nb_edges: int
+    """
+
+    def __init__(self, labels, node1, node2, power, dist):
+        """
+        Parameters:
+        -----------
+        labels: list
+            Les noeuds, dans l'ordre de leurs indices.
+        node1, node2, power, dist: array
+            Les colonnes des arêtes, node1 et node2 étant des indices dans labels.
+        """
+        self.labels, self.index = _index_labels(labels)
+        self.nb_nodes = n = len(self.labels)
+        self.nb_edges = m = len(node1)
+        self.edge_node1 = array("q", node1)
+        self.edge_node2 = array("q", node2)
+        self.edge_power = array(_column_code(power) if not isinstance(power, list) else _typecode(power), power)
+        self.edge_dist = array(_column_code(dist) if not isinstance(dist, list) else _typecode(dist), dist)
+
+        # chaque arête donne deux arcs (a -> b et b -> a), rangés par origine par un tri par dénombrement : degrés,
+        # sommes cumulées, puis une passe sur les arcs a -> b et une sur les arcs b -> a (le même ordre qu'un tri
+        # stable de tous les arcs), sans autre tableau intermédiaire que les prochaines places libres
+        offsets = array("q", [0]) * (n + 1)
+        for a, b in zip(self.edge_node1, self.edge_node2):
+            offsets[a + 1] += 1
+            offsets[b + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        place = offsets[:n]
+        neighbor = array("q", [0]) * (2 * m)
+        power = array(_column_code(self.edge_power), [0]) * (2 * m)
+        dist = array(_column_code(self.edge_dist), [0]) * (2 * m)
+        for origine, extremite in ((self.edge_node1, self.edge_node2), (self.edge_node2, self.edge_node1)):
+            for a, b, p, d in zip(origine, extremite, self.edge_power, self.edge_dist):
+                k = place[a]
+                neighbor[k], power[k], dist[k] = b, p, d
+                place[a] = k + 1
+        self.offsets = offsets
+        self.neighbor, self.power, self.dist = neighbor, power, dist
+        self._powers = None
+
+    _COLUMNS = ("offsets", "neighbor", "power", "dist", "edge_node1", "edge_node2", "edge_power", "edge_dist")
+
+    @classmethod
+    def from_arrays(cls, labels, columns):
+        """
+        Reconstruit le graphe à partir de colonnes déjà calculées (voir columns), sans aucun calcul :
+        les colonnes peuvent être des array ou des memoryview sur un fichier (voir cache.py).
+        """
+        g = cls.__new__(cls)
+        g.labels, g.index = _index_labels(labels)
+        for name in cls._COLUMNS:
+            setattr(g, name, columns[name])
+        g.nb_nodes = len(g.labels)
+        g.nb_edges = len(g.edge_node1)
+        g._powers = None
+        return g
+
+    def columns(self):
+        """
+        Renvoie un dictionnaire contenant toutes les colonnes du graphe (pour les enregistrer, voir cache.py).
+        """
+        return {name: getattr(self, name) for name in self._COLUMNS}
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        Lit un fichier network.x.in (même format que graph_from_file) directement sous forme compacte.
+        """
+        n, m, node1, node2, power, dist = read_network(filename)
+        if m and (min(min(node1), min(node2)) < 1 or max(max(node1), max(node2)) > n):
+            raise Exception("Format incorrect")
+        # les noeuds 1..n ont pour indices 0..n-1
+        node1 = array("q", (a - 1 for a in node1))
+        node2 = array("q", (b - 1 for b in node2))
+        return cls(range(1, n + 1), node1, node2, power, dist)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Convertit un objet de la classe Graph.
+        """
+        labels, node1, node2, power, dist = graph.edge_columns()
+        return cls(labels, node1, node2, power, dist)
+
+    def to_graph(self):
+        """
+        Reconvertit en objet de la classe Graph.
+        """
+        g = Graph(list(self.labels))
+        labels = self.labels
+        for a, b, p, d in zip(self.edge_node1, self.edge_node2, self.edge_power, self.edge_dist):
+            g.add_edge(labels[a], labels[b], p, d)
+        return g
+
+    def __str__(self):
+        """Prints the graph as a list of neighbors for each node (one per line)"""
+        if not self.nb_nodes:
+            return "The graph is empty"
+        output = f"The graph has {self.nb_nodes} nodes and {self.nb_edges} edges.\n"
+        for i, node in enumerate(self.labels):
+            voisins = [(self.labels[self.neighbor[k]], self.power[k], self.dist[k])
+                       for k in range(self.offsets[i], self.offsets[i + 1])]
+            output += f"{node}-->{voisins}\n"
+        return output
+
+    def edges(self):
+        """
+        Renvoie un générateur sur les arêtes, chacune une seule fois, sous la forme (node1, node2, power, dist).
+        """
+        labels = self.labels
+        for a, b, p, d in zip(self.edge_node1, self.edge_node2, self.edge_power, self.edge_dist):
+            yield labels[a], labels[b], p, d
+
+    def _components(self):
+        """
+        but: renvoyer pour chaque indice de noeud le numéro de sa composante connexe, et le nombre de composantes.
+        """
+        offsets, neighbor = self.offsets, self.neighbor
+        comp = array("q", [-1]) * self.nb_nodes
+        nb = 0
+        for s in range(self.nb_nodes):
+            if comp[s] != -1:
+                continue
+            comp[s] = nb
+            pile = [s]
+            while pile:
+                node = pile.pop()
+                for k in range(offsets[node], offsets[node + 1]):
+                    voisin = neighbor[k]
+                    if comp[voisin] == -1:
+                        comp[voisin] = nb
+                        pile.append(voisin)
+            nb += 1
+        return comp, nb
+
+    def connected_components(self):
+        """
+        Renvoie la liste des composantes connexes (chacune est une liste de noeuds).
+        """
+        comp, nb = self._components()
+        composantes = [[] for _ in range(nb)]
+        for i, c in enumerate(comp):
+            composantes[c].append(self.labels[i])
+        return composantes
+
+    def connected_components_set(self):
+        """
+        The result should be a set of frozensets (one per component).
+        """
+        return set(map(frozenset, self.connected_components()))
+
+    def _reachable(self, a, b, power):
+        """
+        but: parcours en largeur de l'indice a vers l'indice b en n'empruntant que des arêtes de puissance <= power.
+        Renvoie le tableau des parents si b est atteint, None sinon.
+        """
+        offsets, neighbor, powers = self.offsets, self.neighbor, self.power
+        parent = array("q", [-1]) * self.nb_nodes
+        parent[a] = a
+        file = [a]
+        for node in file:
+            if node == b:
+                return parent
+            for k in range(offsets[node], offsets[node + 1]):
+                voisin = neighbor[k]
+                if parent[voisin] == -1 and powers[k] <= power:
+                    parent[voisin] = node
+                    file.append(voisin)
+        return None
+
+    def get_path_with_power(self, src, dest, power):
+        """
+        Renvoie un chemin admissible de src à dest pour un camion de puissance power, ou None s'il n'y en a pas.
+        """
+        a, b = self.index[src], self.index[dest]
+        parent = self._reachable(a, b, power)
+        if parent is None:
+            return None
+        chemin = [b]
+        while chemin[-1] != a:
+            chemin.append(parent[chemin[-1]])
+        return [self.labels[i] for i in reversed(chemin)]
+
+    def min_power(self, src, dest):
+        """
+        Renvoie (chemin, puissance minimale) pour le trajet src -> dest, ou (None, None) s'il n'est pas couvrable.
+        Dichotomie sur les puissances distinctes des arêtes (triées une fois pour toutes).
+        """
+        a, b = self.index[src], self.index[dest]
+        if a == b:
+            return [src], 0
+        if self._powers is None:
+            self._powers = sorted(set(self.edge_power))
+        powers = self._powers
+        if not powers or self._reachable(a, b, powers[-1]) is None:
+            return None, None
+        lo, hi = 0, len(powers) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._reachable(a, b, powers[mid]) is None:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.get_path_with_power(src, dest, powers[lo]), powers[lo]
+
+    def mst_edges(self):
+        """
+        Renvoie les indices (dans les colonnes edge_*) des arêtes d'une forêt couvrante de poids minimal, dans l'ordre.
+        """
+        return sorted(kruskal_edges(self.nb_nodes, self.edge_node1, self.edge_node2, self.edge_power))
+
+    def kruskal(self):
+        """
+        Renvoie une forêt couvrante de poids minimal, sous forme de CompactGraph sur les mêmes noeuds.
+        """
+        garde = self.mst_edges()
+        return CompactGraph(self.labels,
+                            array("q", (self.edge_node1[e] for e in garde)),
+                            array("q", (self.edge_node2[e] for e in garde)),
+                            array(_column_code(self.edge_power), (self.edge_power[e] for e in garde)),
+                            array(_column_code(self.edge_dist), (self.edge_dist[e] for e in garde)))
+
+    def min_power_tree(self, mst=None):
+        """
+        Renvoie la structure de requêtes MinPowerTree construite sur la forêt couvrante minimale
+        (mst : indices des arêtes de la forêt, s'ils sont déjà connus).
+        """
+        if mst is None:
+            mst = self.mst_edges()
+        return MinPowerTree(self.labels, ((self.edge_node1[e], self.edge_node2[e], self.edge_power[e]) for e in mst))
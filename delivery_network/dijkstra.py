@@ -0,0 +1,216 @@
+"""
+Plus courts chemins (au sens de la distance des arêtes) pour un camion de puissance donnée : seules les arêtes de
+puissance minimale <= power peuvent être empruntées. Algorithme de Dijkstra avec un tas binaire (heapq), en
+O((|S|+|A|) log |S|), arrêté dès que la destination est définitivement atteinte.
+
+On y trouve aussi la variante "minimax" de Dijkstra (bottleneck_dijkstra), où la valeur d'un chemin est la plus
+grande puissance de ses arêtes au lieu de la somme des distances : elle donne min_power pour un trajet isolé sans
+construire l'arbre couvrant minimal.
+"""
+
+from heapq import heappush, heappop
+from . import instrumentation
+
+
+def _chemin(parent, node):
+    """
+    but: reconstruire le chemin de la source jusqu'à node en remontant les parents.
+    """
+    chemin = [node]
+    while parent[chemin[-1]] is not None:
+        chemin.append(parent[chemin[-1]])
+    chemin.reverse()
+    return chemin
+
+
+def dijkstra(graph, src, power, targets=None):
+    """
+    Dijkstra depuis src en n'empruntant que les arêtes de puissance <= power.
+
+    Parameters:
+    -----------
+    graph: Graph
+    src: NodeType
+    power: numeric
+    targets: set, optional
+        Si targets est donné, on s'arrête dès que tous ces noeuds ont été atteints définitivement.
+
+    Outputs:
+    -----------
+    dist, parent: dict
+        dist[node] est la distance minimale de src à node (pour les noeuds atteints définitivement) et parent[node]
+        le noeud précédent sur un plus court chemin (None pour src).
+    """
+    dist = {src: 0}
+    parent = {src: None}
+    fini = set()
+    restants = set(targets) if targets is not None else None
+    tas = [(0, 0, src)] #(distance, compteur, noeud) : le compteur évite de comparer des noeuds
+    compteur = 1
+    while tas:
+        d, _, node = heappop(tas)
+        if node in fini: #entrée périmée, le noeud a déjà été atteint par un chemin plus court
+            continue
+        fini.add(node)
+        if restants is not None:
+            restants.discard(node)
+            if not restants:
+                break
+        for voisin, power_min, longueur in graph.graph[node]:
+            if power_min <= power and voisin not in fini:
+                nouvelle = d + longueur
+                if voisin not in dist or nouvelle < dist[voisin]:
+                    dist[voisin] = nouvelle
+                    parent[voisin] = node
+                    heappush(tas, (nouvelle, compteur, voisin))
+                    compteur += 1
+    if instrumentation.ENABLED:
+        instrumentation.count("dijkstra_calls")
+        instrumentation.count("dijkstra_nodes_settled", len(fini))
+        instrumentation.count("dijkstra_edges_relaxed", compteur - 1) #chaque relâchement réussi ajoute une entrée au tas
+    return {node: dist[node] for node in fini}, parent
+
+
+def shortest_path_with_power(graph, src, dest, power):
+    """
+    Renvoie (chemin, distance) d'un plus court chemin admissible de src à dest pour un camion de puissance power,
+    ou (None, None) s'il n'y en a pas.
+    """
+    if not graph.same_component(src, dest):
+        return None, None
+    dist, parent = dijkstra(graph, src, power, {dest})
+    if dest not in dist:
+        return None, None
+    return _chemin(parent, dest), dist[dest]
+
+
+def bidirectional_shortest_path_with_power(graph, src, dest, power):
+    """
+    Même résultat que shortest_path_with_power, mais on lance Dijkstra à la fois depuis src et depuis dest (le graphe
+    n'est pas orienté) en avançant à chaque fois le côté dont le tas a la plus petite distance. On s'arrête dès que la
+    somme des deux plus petites distances en attente dépasse la meilleure distance trouvée entre les deux côtés :
+    on explore en général bien moins de noeuds qu'avec une seule recherche.
+    """
+    if not graph.same_component(src, dest):
+        return None, None
+    if src == dest:
+        return [src], 0
+    dist = ({src: 0}, {dest: 0})
+    parent = ({src: None}, {dest: None})
+    fini = (set(), set())
+    tas = ([(0, 0, src)], [(0, 0, dest)])
+    compteur = 1
+    meilleur, milieu = None, None
+    while tas[0] and tas[1]:
+        if meilleur is not None and tas[0][0][0] + tas[1][0][0] >= meilleur:
+            break
+        cote = 0 if tas[0][0][0] <= tas[1][0][0] else 1
+        d, _, node = heappop(tas[cote])
+        if node in fini[cote]:
+            continue
+        fini[cote].add(node)
+        for voisin, power_min, longueur in graph.graph[node]:
+            if power_min > power or voisin in fini[cote]:
+                continue
+            nouvelle = d + longueur
+            if voisin not in dist[cote] or nouvelle < dist[cote][voisin]:
+                dist[cote][voisin] = nouvelle
+                parent[cote][voisin] = node
+                heappush(tas[cote], (nouvelle, compteur, voisin))
+                compteur += 1
+            if voisin in dist[1 - cote]: #les deux recherches se rejoignent par l'arête (node, voisin)
+                total = nouvelle + dist[1 - cote][voisin]
+                if meilleur is None or total < meilleur:
+                    meilleur = total
+                    milieu = (node, voisin) if cote == 0 else (voisin, node)
+    if meilleur is None:
+        return None, None
+    a, b = milieu #a est atteint depuis src, b depuis dest, et l'arête (a, b) relie les deux côtés
+    debut = _chemin(parent[0], a)
+    fin = _chemin(parent[1], b)
+    fin.reverse()
+    if debut[-1] == fin[0]:
+        fin = fin[1:]
+    return debut + fin, meilleur
+
+
+def shortest_paths_with_power_batch(graph, queries):
+    """
+    Version par lot : queries est une liste de trajets (src, dest, power). Les trajets de même source et de même
+    puissance sont regroupés : un seul Dijkstra depuis src sert à tous, et il s'arrête dès que toutes leurs
+    destinations sont atteintes. Renvoie la liste des (chemin, distance) dans l'ordre des trajets.
+    """
+    groupes = {}
+    for q, (src, dest, power) in enumerate(queries):
+        groupes.setdefault((src, power), []).append(q)
+    resultats = [(None, None)] * len(queries)
+    for (src, power), indices in groupes.items():
+        cibles = {queries[q][1] for q in indices if graph.same_component(src, queries[q][1])}
+        if not cibles:
+            continue
+        dist, parent = dijkstra(graph, src, power, cibles)
+        for q in indices:
+            dest = queries[q][1]
+            if dest in dist:
+                resultats[q] = (_chemin(parent, dest), dist[dest])
+    return resultats
+
+
+def bottleneck_dijkstra(graph, src, targets=None):
+    """
+    Dijkstra "minimax" depuis src : la valeur d'un chemin est la puissance maximale de ses arêtes, et on cherche pour
+    chaque noeud le chemin de valeur minimale. Les noeuds sortent du tas par puissance croissante ; on s'arrête dès
+    que tous les noeuds de targets (s'il est donné) sont sortis. Complexité : O(|A| log |S|).
+
+    Outputs:
+    -----------
+    power, parent: dict
+        power[node] est la puissance minimale pour aller de src à node (pour les noeuds atteints définitivement) et
+        parent[node] le noeud précédent sur un chemin de cette puissance (None pour src).
+    """
+    power = {src: 0}
+    parent = {src: None}
+    fini = set()
+    restants = set(targets) if targets is not None else None
+    tas = [(0, 0, src)] #(puissance du chemin, compteur, noeud)
+    compteur = 1
+    while tas:
+        p, _, node = heappop(tas)
+        if node in fini:
+            continue
+        fini.add(node)
+        if restants is not None:
+            restants.discard(node)
+            if not restants:
+                break
+        for voisin, power_min, _ in graph.graph[node]:
+            if voisin not in fini:
+                nouvelle = p if p >= power_min else power_min
+                if voisin not in power or nouvelle < power[voisin]:
+                    power[voisin] = nouvelle
+                    parent[voisin] = node
+                    heappush(tas, (nouvelle, compteur, voisin))
+                    compteur += 1
+    if instrumentation.ENABLED:
+        instrumentation.count("bottleneck_dijkstra_calls")
+        instrumentation.count("bottleneck_dijkstra_nodes_settled", len(fini))
+    return {node: power[node] for node in fini}, parent
+
+
+def min_power_dijkstra(graph, src, dest):
+    """
+    Renvoie (puissance minimale, chemin) pour le trajet src -> dest par bottleneck_dijkstra, arrêté dès que dest est
+    atteint, ou (None, None) si le trajet est impossible.
+    """
+    if not graph.same_component(src, dest):
+        return None, None
+    power, parent = bottleneck_dijkstra(graph, src, {dest})
+    return power[dest], _chemin(parent, dest)
+
+
+def min_power_from(graph, src):
+    """
+    Renvoie un dictionnaire noeud -> puissance minimale pour aller de src à ce noeud (les noeuds non reliés à src
+    n'y figurent pas) : tous les trajets partant de src sont résolus par un seul parcours.
+    """
+    return bottleneck_dijkstra(graph, src)[0]
@@ -1,61 +1,106 @@
-from graph import Graph, graph_from_file
-
-def glouton(filegraph, fileroute, filetruck):
-    g=graph_from_file(filegraph)
-
-    f=open(fileroute, "r", encoding="utf-8")
-    s=f.readlines()
-    route=[]
-    for i in range(1, len(s)):
-        s[i]=s[i].split(" ")
-        route.append([int(s[i][2]),int(s[i][0]),int(s[i][1])]) #profit, départ, arrivée
-    route.sort(reverse=True)
-   
-
-    t=open(filetruck, "r", encoding="utf-8")
-    truck=t.readlines()
-    trucks=[]
-    for i in range(1, len(truck)):
-        truck[i]=truck[i].split(" ")
-        trucks.append([int(truck[i][0]),int(truck[i][1])]) #puissance et coût
-        trucks.sort()
-    
-    def sort_trucks(trucks):
-        for i in range(0,(len(trucks)-2)): #on met -2 car naturellement, la len rajoute 1 pour obtenir la bonne longueur dans une boucle in range, donc étant donné qu'on utilise i+1, il faut faire -1 en plus
-            if trucks[i+1][1]<=trucks[i][1]:
-                trucks.remove(trucks[i])
-        return trucks
-    
-    trucks=sort_trucks(trucks)
-
-    def coeff_advantage(g, route, trucks):
-        for i in range (len(route)):
-            min_power, path = g.min_power_kruskal(route[i][1],route[i][2])
-            test=True
-            while test:
-                for j in range(len(trucks)):
-                    if trucks[j][0]>=min_power:
-                        route[i][0]=route[i][0]/trucks[j][1] #on divise le profit par le coût de revient
-                        route[i]+=[path,j]#on ajoute l'indice du camion qu'il faudra prendre pour le retrouver facilement par la suite lors des calculs
-                        test=False
-                        break
-        route.sort(reverse=True)
-        return route
-    
-    route=coeff_advantage(g,route,trucks)
-            
-    budget=25*(10**9)
-    spend=0
-    results=[]
-
-    while spend < budget:
-        for i in range(len(route)):
-            spend=spend + trucks[route[i][4]][1]
-            results+=[[route[i][4],route[i][3]]] #l'indice du camion acheté + le chemin qu'il va réaliser
-    
-    if spend>budget:
-        results.remove(results[-1])
-
-    return results
-
-print(glouton("input/network.2.in", "input/routes.2.in", "input/trucks.0.in"))
\ No newline at end of file
+"""
+Chaîne de traitement pour l'allocation des camions, découpée en étapes dont chaque résultat peut être réutilisé :
+    1. load_network : lecture du réseau et construction (une seule fois) de l'arbre couvrant minimal et de la
+       structure de requêtes MinPowerTree (éventuellement relue dans le cache sur disque, voir cache.py) ;
+    2. route_powers : puissance minimale de tous les trajets d'un coup (écrite dans routes.x.out si demandé) ;
+    3. assign_trucks : camion le moins cher capable de couvrir chaque trajet (TruckCatalog.cheapest_many) ;
+    4. allocate (allocation.py) : choix des trajets sous contrainte de budget.
+La fonction glouton enchaîne les étapes et chronomètre chacune d'elles.
+"""
+
+import time
+from . import instrumentation
+from .graph import graph_from_file, routes_from_file
+from .truck_catalog import TruckCatalog
+from .allocation import allocate, BUDGET
+from .batch import write_powers
+
+
+def load_network(filegraph, cache=False):
+    """
+    Étape 1 : renvoie la structure de requêtes MinPowerTree du réseau filegraph.
+    """
+    if cache:
+        from .cache import load_network as load_cached
+        return load_cached(filegraph)[2]
+    return graph_from_file(filegraph).min_power_tree()
+
+
+def route_powers(tree, routes, fileout=None, filegraph=None, workers=None):
+    """
+    Étape 2 : renvoie la liste des puissances minimales des trajets (None si le trajet est impossible),
+    et l'écrit dans fileout si ce n'est pas None.
+    Si workers est supérieur à 1, le calcul est réparti entre plusieurs processus qui partagent le prétraitement
+    du réseau filegraph par le cache sur disque (voir parallel.py).
+    """
+    if workers is not None and workers > 1:
+        from .parallel import min_power_parallel
+        powers = min_power_parallel(filegraph, [(route[0], route[1]) for route in routes], workers)
+    else:
+        powers = tree.min_power_many([route[0] for route in routes], [route[1] for route in routes])
+    if fileout is not None:
+        write_powers(fileout, powers)
+    return powers
+
+
+def assign_trucks(catalog, powers):
+    """
+    Étape 3 : renvoie (trucks, costs), le camion le moins cher pour chaque trajet et son coût (None si aucun camion
+    ne convient).
+    """
+    trucks = catalog.cheapest_many(powers)
+    costs = [catalog.cost(j) if j is not None else None for j in trucks]
+    return trucks, costs
+
+
+def glouton(filegraph, fileroute, filetruck, budget=BUDGET, mode="greedy", fileout=None, cache=False, with_paths=True,
+            workers=None):
+    """
+    but: choisir les trajets de fileroute à couvrir et le camion à acheter pour chacun, sans dépasser le budget.
+    Chaque trajet est associé au camion le moins cher capable de le couvrir, puis le choix des trajets est fait par
+    allocate (allocation.py) : "greedy" pour le classement par profit / coût, "exact" pour la recherche exacte
+    autour du point de rupture.
+    Avec workers > 1, les puissances des trajets sont calculées par plusieurs processus (le cache est alors utilisé).
+    Renvoie le résultat de allocate, complété par :
+        results : la liste des [indice du camion, chemin] achetés (chemin None si with_paths est False),
+        timings : la durée de chaque étape en secondes.
+    """
+    timings = {}
+    t = time.perf_counter()
+    tree = load_network(filegraph, cache or (workers is not None and workers > 1))
+    timings["network"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    routes = routes_from_file(fileroute) #(départ, arrivée, profit)
+    catalog = TruckCatalog.from_file(filetruck) #seulement les camions utiles, triés par puissance (et donc par coût)
+    timings["inputs"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    powers = route_powers(tree, routes, fileout, filegraph, workers)
+    timings["powers"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    trucks, costs = assign_trucks(catalog, powers)
+    timings["trucks"] = time.perf_counter() - t
+
+    allocation = allocate([route[2] for route in routes], costs, budget, mode)
+    timings["allocation"] = allocation["time"]
+
+    t = time.perf_counter()
+    allocation["results"] = [[trucks[i], tree.get_path(routes[i][0], routes[i][1]) if with_paths else None]
+                             for i in allocation["selected"]] #l'indice du camion acheté + le chemin qu'il va réaliser
+    timings["paths"] = time.perf_counter() - t
+    allocation["timings"] = timings
+    if instrumentation.ENABLED:
+        for etape, duree in timings.items():
+            instrumentation.add_time(f"glouton.{etape}", duree)
+        instrumentation.count("glouton_routes", len(routes))
+        instrumentation.count("glouton_selected", len(allocation["selected"]))
+    return allocation
+
+
+if __name__ == "__main__":
+    allocation = glouton("input/network.2.in", "input/routes.2.in", "input/trucks.0.in")
+    print(f"{len(allocation['selected'])} trajets, profit {allocation['profit']}, dépense {allocation['spend']}, "
+          f"borne supérieure {allocation['upper_bound']:.0f}")
+    print(", ".join(f"{etape} {duree:.3f}s" for etape, duree in allocation["timings"].items()))
@@ -1,4 +1,7 @@
-import math as mt
+from collections import deque
+from array import array
+from bisect import bisect_left
+from . import instrumentation
 
 class Graph:
     """
@@ -27,9 +30,16 @@ class Graph:
             A list of nodes. Default is empty.
         """
         self.nodes = nodes
-        self.graph = dict([(n, []) for n in nodes])
+        self.graph = {n: [] for n in nodes}
         self.nb_nodes = len(nodes)
         self.nb_edges = 0
+        self._min_power_tree = None #structure de requêtes sur l'arbre couvrant minimal, calculée à la demande
+        self._powers = None #liste triée des puissances distinctes, calculée à la demande
+        self._component = None #numéro de composante connexe de chaque noeud, calculé à la demande
+        self._nb_components = 0
+        self._reconstruction_tree = None #arbre de reconstruction de Kruskal, calculé à la demande
+        self._forest = None #forêt couvrante minimale, maintenue au fil des modifications une fois calculée
+        self._query_cache = None #cache des requêtes min_power, désactivé par défaut (voir enable_query_cache)
     
 
     def __str__(self):
@@ -57,6 +67,8 @@ class Graph:
         dist: numeric (int or float), optional
             Distance between node1 and node2 on the edge. Default is 1.
         """
+        forest = self._maintained_forest()
+        nouveau = node1 not in self.graph or node2 not in self.graph
         if node1 not in self.graph:
             self.graph[node1] = []
             self.nb_nodes += 1
@@ -69,38 +81,202 @@ class Graph:
         self.graph[node1].append((node2, power_min, dist))
         self.graph[node2].append((node1, power_min, dist))
         self.nb_edges += 1
-    
+        if forest is None:
+            self._invalidate(True, True)
+        else:
+            changed, merged = forest.insert(node1, node2, power_min)
+            #un nouveau noeud n'est pas indexé par les structures : elles sont alors reconstruites
+            self._invalidate(changed or nouveau, merged or nouveau, None if nouveau else forest.last_change)
+        if self._powers is not None:
+            k = bisect_left(self._powers, power_min)
+            if k == len(self._powers) or self._powers[k] != power_min:
+                self._powers.insert(k, power_min)
+
+    def remove_edge(self, node1, node2, power_min=None):
+        """
+        Supprime une arête entre node1 et node2 (de puissance power_min si elle est précisée, sinon la première trouvée).
+        Renvoie (power_min, dist) de l'arête supprimée ; lève ValueError si une telle arête n'existe pas.
+        """
+        for k, (voisin, power, dist) in enumerate(self.graph.get(node1, [])):
+            if voisin == node2 and (power_min is None or power == power_min):
+                break
+        else:
+            raise ValueError(f"pas d'arête entre {node1} et {node2}" +
+                             (f" de puissance {power_min}" if power_min is not None else ""))
+        forest = self._maintained_forest()
+        del self.graph[node1][k]
+        self.graph[node2].remove((node1, power, dist))
+        self.nb_edges -= 1
+        self._powers = None
+        if forest is None:
+            self._invalidate(True, True)
+        else:
+            changed, split = forest.delete(self, node1, node2, power)
+            self._invalidate(changed, split, forest.last_change)
+        return power, dist
+
+    def change_edge_power(self, node1, node2, power_min, new_power):
+        """
+        Change la puissance minimale d'une arête entre node1 et node2 de power_min à new_power (la distance est gardée).
+        """
+        _, dist = self.remove_edge(node1, node2, power_min)
+        self.add_edge(node1, node2, new_power, dist)
+
+    def spanning_forest(self):
+        """
+        Renvoie la forêt couvrante minimale du graphe (voir spanning_forest.py). Une fois calculée, elle est mise à jour
+        à chaque ajout, suppression ou changement de puissance d'une arête au lieu d'être recalculée.
+        """
+        if self._forest is None:
+            from .spanning_forest import SpanningForest
+            self._forest = SpanningForest.from_graph(self)
+        return self._forest
+
+    def _maintained_forest(self):
+        """
+        but: renvoyer la forêt couvrante à mettre à jour lors d'une modification, ou None s'il n'y a rien à maintenir.
+        Si une structure de requêtes a déjà été construite, on calcule la forêt (une fois) avant la modification
+        pour ne plus avoir à tout reconstruire ensuite.
+        """
+        if self._forest is None and (self._min_power_tree is not None or self._reconstruction_tree is not None):
+            self.spanning_forest()
+        return self._forest
+
+    def _invalidate(self, forest_changed, components_changed, change=None):
+        """
+        but: n'oublier que les résultats qu'une modification du graphe a pu rendre faux. Quand la forêt couvrante a
+        changé de change = (removed, added), la structure MinPowerTree n'est mise à jour que sur le sous-arbre déplacé
+        (voir MinPowerTree.update) ; l'arbre de reconstruction de Kruskal, lui, est entièrement recalculé à la demande.
+        """
+        if forest_changed:
+            tree = self._min_power_tree
+            if tree is not None and (change is None or not tree.update(self._forest.adjacency, *change)):
+                self._min_power_tree = None
+            self._reconstruction_tree = None #dépend de l'ordre de toutes les arêtes de la forêt
+        if components_changed:
+            self._component = None
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def enable_query_cache(self, maxsize=100000):
+        """
+        Active le cache des résultats de min_power et min_power_kruskal (voir query_cache.py) : au plus maxsize
+        trajets sont gardés, (src, dest) et (dest, src) partageant la même entrée. Le cache est vidé à chaque
+        modification du graphe.
+        """
+        from .query_cache import QueryCache
+        self._query_cache = QueryCache(maxsize)
+
+    def disable_query_cache(self):
+        """Désactive le cache des requêtes."""
+        self._query_cache = None
+
+    def query_cache_info(self):
+        """
+        Renvoie les compteurs du cache des requêtes (hits, misses, size, maxsize), ou None s'il n'est pas activé.
+        """
+        return self._query_cache.info() if self._query_cache is not None else None
+
 
  
     
 
+    def edges(self):
+        """
+        Renvoie un générateur sur les arêtes du graphe, chacune une seule fois, sous la forme (node1, node2, power, dist).
+        """
+        position = {node: i for i, node in enumerate(self.graph)}
+        for node, voisins in self.graph.items():
+            boucle = False
+            for voisin, power, dist in voisins:
+                if voisin == node: #une boucle apparaît deux fois dans la liste d'adjacence du noeud
+                    boucle = not boucle
+                    if boucle:
+                        yield node, voisin, power, dist
+                elif position[voisin] > position[node]:
+                    yield node, voisin, power, dist
+
+    def edge_columns(self):
+        """
+        Renvoie les arêtes sous forme de colonnes sur des noeuds numérotés : (labels, node1, node2, power, dist),
+        où labels[i] est le noeud d'indice i et node1[e], node2[e] sont les indices des extrémités de l'arête e.
+        """
+        labels = list(self.graph)
+        index = {node: i for i, node in enumerate(labels)}
+        node1, node2, power, dist = [], [], [], []
+        # même parcours que edges, mais directement sur les indices et sans tuple intermédiaire par arête
+        ajout1, ajout2, ajout_power, ajout_dist = node1.append, node2.append, power.append, dist.append
+        for i, voisins in enumerate(self.graph.values()):
+            boucle = False
+            for voisin, p, d in voisins:
+                j = index[voisin]
+                if j < i:
+                    continue
+                if j == i: #une boucle apparaît deux fois dans la liste d'adjacence du noeud
+                    boucle = not boucle
+                    if not boucle:
+                        continue
+                ajout1(i)
+                ajout2(j)
+                ajout_power(p)
+                ajout_dist(d)
+        return labels, node1, node2, power, dist
+
+    def min_power_batch(self, pairs):
+        """
+        Calcule la puissance minimale de tous les trajets (src, dest) de pairs en une seule passe (algorithme hors ligne,
+        voir batch.py). Renvoie la liste des puissances dans l'ordre des trajets (None si le trajet est impossible).
+        """
+        from .batch import min_power_batch
+        with instrumentation.stage("min_power_batch"):
+            return min_power_batch(self, pairs)
+
     def connected_components(self):
         """
         but: déterminer les différentes composantes connexes du graphe.
         """
-        liste_composantes = [] #on va faire une liste de liste de noeuds qui formeront une composante connexe
-        noeuds_visites = {noeud: False for noeud in self.nodes} #on utilise un dictionnaire pour marquer si un noeud a été visité ou non
-
-        def visiter(noeud):
-            """
-            but: à partir d'un noeud qui n'a pas été visité, on parcourt tout ses voisins, puis les voisins de ses voisins par récursivité 
-            pour renvoyer une composante connexe à partir d'un noeud
-            """
-            composante = [noeud]
-            for voisin in self.graph[noeud]: #on regarde les voisins du noeud considéré
-                voisin = voisin[0]
-                if not noeuds_visites[voisin]: #s'il n'a pas déjà été visité (càd ajouté à la liste d'une composante)
-                    noeuds_visites[voisin]=True
-                    composante += visiter(voisin) #on itère sur les voisins des voisins 
-            return composante
-
-        for noeud in self.nodes:
-            if not noeuds_visites[noeud]: #tant que tous les noeuds ont pas été visités
-                liste_composantes.append(visiter(noeud)) #on ajoute les composantes connexes une à une 
-
+        liste_composantes = [[] for _ in range(self.nb_components())] #une liste de noeuds par composante connexe
+        for noeud, composante in self.component_labels().items():
+            liste_composantes[composante].append(noeud)
         return liste_composantes
 
+    def component_labels(self):
+        """
+        Renvoie un dictionnaire qui associe à chaque noeud le numéro (0, 1, ...) de sa composante connexe.
+        Le calcul se fait par des parcours en largeur itératifs (pas de récursivité, donc pas de limite sur la taille du
+        graphe) ; il n'est fait qu'une fois, puis gardé en mémoire tant qu'aucune arête n'est ajoutée.
+        """
+        if self._component is None:
+            composantes = {}
+            nb = 0
+            for noeud in self.graph:
+                if noeud in composantes: #déjà visité
+                    continue
+                composantes[noeud] = nb
+                file = [noeud]
+                for sommet in file: #la liste grandit pendant qu'on la parcourt : c'est un parcours en largeur
+                    for voisin, _, _ in self.graph[sommet]:
+                        if voisin not in composantes:
+                            composantes[voisin] = nb
+                            file.append(voisin)
+                nb += 1
+            self._component = composantes
+            self._nb_components = nb
+        return self._component
+
+    def nb_components(self):
+        """
+        Renvoie le nombre de composantes connexes du graphe.
+        """
+        self.component_labels()
+        return self._nb_components
 
+    def same_component(self, node1, node2):
+        """
+        Renvoie True si node1 et node2 sont dans la même composante connexe, en O(1) une fois les composantes calculées.
+        """
+        composantes = self.component_labels()
+        return composantes[node1] == composantes[node2]
 
     def connected_components_set(self):
         """
@@ -112,84 +288,199 @@ class Graph:
 
 
 
-    def get_path_with_power(self, src, dest, power):
+    def get_path_with_power(self, src, dest, power, return_path=True):
         """
         Détermine si un camion de puissance p peut couvrir le trajet t,
         et retourne un chemin admissible si c'est possible, ou None sinon.
+        Si return_path est False, on renvoie seulement True ou False (pas de reconstruction de chemin).
         """
+        if not self.same_component(src, dest): #inutile de parcourir le graphe
+            return False if not return_path else None
         # Recherche en largeur du graphe pour trouver un chemin de s à t
-        queue = [(src, [])]  # (sommet, chemin)
-        visited = set()
+        parent = {src: None} #parent[noeud] est le noeud d'où l'on vient : sert aussi d'ensemble des sommets visités
+        queue = deque([src])
         while queue: #tant que queue est non vide
-            node, path = queue.pop(0)
-            """
-            L'instruction queue.pop(0) supprime et retourne le premier élément de la liste queue. 
-            Dans ce cas, la variable node prend la valeur du premier élément de la liste, 
-            qui est un tuple contenant le sommet courant, et la liste path qui contient le chemin parcouru pour arriver à ce sommet. 
-            Ainsi, à chaque itération de la boucle while, on considère le prochain sommet de la queue pour explorer ses voisins.
-            """
+            node = queue.popleft() #O(1) avec une deque, au lieu de O(n) pour list.pop(0)
             if node == dest:  # Nous avons trouvé un chemin de src à dest
-                return path + [dest]  # Ajouter le dernier sommet à la fin du chemin
-            visited.add(node) #on ajoute node à la liste des sommets visités
-            for voisin in self.graph[node]:
-                if voisin[0] not in visited and voisin[1] <=  power:  # Nous ne visitons que les sommets avec des arêtes valides
-                    queue.append((voisin[0], path + [node]))  # Ajouter le chemin à la liste de chemins pour le reparcourir
+                if instrumentation.ENABLED: #noeuds sortis de la file = noeuds marqués - noeuds encore en attente
+                    instrumentation.count("bfs_calls")
+                    instrumentation.count("bfs_nodes_expanded", len(parent) - len(queue))
+                if not return_path:
+                    return True
+                path = [dest]
+                while parent[path[-1]] is not None: #on remonte les parents jusqu'à src
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            for voisin, power_min, _ in self.graph[node]:
+                # on marque le voisin dès qu'il est mis dans la file : chaque sommet n'y entre qu'une fois
+                if power_min <= power and voisin not in parent:
+                    parent[voisin] = node
+                    queue.append(voisin)
         # Si nous sortons de la boucle while sans trouver de chemin, cela signifie que nous n'avons pas trouvé de chemin valide
-        return None
+        if instrumentation.ENABLED:
+            instrumentation.count("bfs_calls")
+            instrumentation.count("bfs_nodes_expanded", len(parent))
+        return False if not return_path else None
     """
     Question 6: complexité
     La fonction get_path_with_power est une recherche en largeur où on explore les sommets puis les arrêtes de ces sommets 
     un à un donc la complexité de l'algorythme dépend du graph sur lequel on travaille (sa taille)
     donc la complexité peut se résumer par O(|S|+|A|) avec S le nb de sommets et A le nb d'arrêtes. 
+    Chaque sommet n'entre qu'une fois dans la file (il est marqué dès qu'on l'y ajoute) et chaque retrait de la deque
+    est en O(1) ; le chemin n'est reconstruit qu'une fois à la fin, en remontant les parents.
     """
 
-    def min_power(self,src,dest):
+    def shortest_path_with_power(self, src, dest, power, bidirectional=False):
+        """
+        Renvoie (chemin, distance) d'un chemin de distance minimale de src à dest qu'un camion de puissance power
+        peut emprunter, ou (None, None) s'il n'y en a pas. Dijkstra avec un tas, arrêté dès que dest est atteint ;
+        avec bidirectional=True, la recherche part des deux extrémités à la fois (voir dijkstra.py).
+        """
+        from .dijkstra import shortest_path_with_power, bidirectional_shortest_path_with_power
+        if bidirectional:
+            return bidirectional_shortest_path_with_power(self, src, dest, power)
+        return shortest_path_with_power(self, src, dest, power)
+
+    def shortest_paths_with_power_batch(self, queries):
+        """
+        Version par lot de shortest_path_with_power pour une liste de trajets (src, dest, power) : un seul Dijkstra
+        par couple (src, power). Renvoie la liste des (chemin, distance) dans l'ordre des trajets.
+        """
+        from .dijkstra import shortest_paths_with_power_batch
+        return shortest_paths_with_power_batch(self, queries)
+
+    def min_power(self, src, dest):
+        """
+        Renvoie (chemin, puissance minimale) pour le trajet src -> dest (voir _min_power), en passant par le cache des
+        requêtes s'il est activé.
+        """
+        if self._query_cache is not None:
+            return self._query_cache.call("min_power", src, dest, self._min_power)
+        return self._min_power(src, dest)
+
+    def _min_power(self,src,dest):
         """
         calcule, pour un trajet t donné, la puissance minimale d'un camion pouvant couvrir ce trajet. La fonction devra 
         retourner le chemin, et la puissance minimale.
-        On utilise ici une approche par dichotomie 
+        On utilise ici une approche par dichotomie sur la liste triée des puissances distinctes des arêtes : la puissance
+        minimale est forcément l'une d'elles. Renvoie (None, None) si le trajet est impossible.
         """
-        min_power=0
-        max_power=0
-        for node in self.nodes: #d'abord on va chercher à déterminer qu'elle est la puissance maximale pour circuler sur le graph
-            for voisin in self.graph[node]:
-                if voisin[1]>max_power:
-                    max_power=voisin[1]
-        while max_power-min_power>1: #par dichotomie, on va déterminer la puissance minimale pour effectuer un trajet 
-            if self.get_path_with_power(src,dest,min_power)==None:
-                min_power=mt.floor((max_power+min_power)/2)-1
-            else: 
-                max_power=mt.floor((max_power+min_power)/2)
+        if instrumentation.ENABLED:
+            instrumentation.count("min_power_calls")
+        if src == dest:
+            return [src], 0
+        # d'abord on vérifie que src et dest sont reliés, en O(1) grâce aux composantes connexes gardées en mémoire
+        if not self.same_component(src, dest):
+            return None, None
+        powers = self.distinct_powers()
+        lo, hi = 0, len(powers) - 1 #invariant : powers[hi] suffit, toute puissance < powers[lo] ne suffit pas
+        while lo < hi: #par dichotomie, on va déterminer la puissance minimale pour effectuer un trajet 
+            mid = (lo + hi) // 2
+            if self.get_path_with_power(src, dest, powers[mid], return_path=False):
+                hi = mid
+            else:
+                lo = mid + 1
+        return self.get_path_with_power(src, dest, powers[lo]), powers[lo]
+    """
+    Complexité de min_power : la liste des k puissances distinctes (k <= |A|) est triée une seule fois par graphe,
+    puis chaque appel fait au plus log2(k) + 2 parcours en largeur en O(|S|+|A|), soit O((|S|+|A|) log |A|) par trajet.
+    """
 
-        return self.get_path_with_power(src,dest,min_power), min_power
+    def distinct_powers(self):
+        """
+        Renvoie la liste triée des puissances distinctes des arêtes (calculée une fois, puis gardée en mémoire
+        tant qu'aucune arête n'est ajoutée).
+        """
+        if self._powers is None:
+            self._powers = sorted({power for voisins in self.graph.values() for _, power, _ in voisins})
+        return self._powers
 
+    def min_power_tree(self, mst=None):
+        """
+        Renvoie la structure de requêtes (MinPowerTree) construite sur l'arbre couvrant minimal du graphe. Si l'arbre
+        couvrant minimal a déjà été calculé (mst, résultat de kruskal), la structure est construite à partir de lui
+        sans relancer Kruskal ; mst est ignoré si la structure existe déjà.
+        Elle n'est calculée qu'une fois ; quand une modification d'arête change la forêt couvrante, seules les lignes
+        du sous-arbre déplacé sont recalculées (elle n'est reconstruite entièrement que si un noeud est ajouté ou si
+        ses tables ne peuvent pas être modifiées en place).
+        """
+        if self._min_power_tree is None:
+            from .min_power_tree import MinPowerTree
+            with instrumentation.stage("min_power_tree"):
+                if self._forest is not None:
+                    self._min_power_tree = MinPowerTree(*self._forest.indexed_edges())
+                elif mst is not None:
+                    self._min_power_tree = MinPowerTree.from_mst(mst, self.nodes)
+                else:
+                    self._min_power_tree = MinPowerTree.from_graph(self)
+        return self._min_power_tree
+
+    def reconstruction_tree(self):
+        """
+        Renvoie l'arbre de reconstruction de Kruskal du graphe (voir reconstruction_tree.py), calculé une seule fois
+        tant que la forêt couvrante ne change pas. Il n'est pas mis à jour partiellement : toute modification de la
+        forêt le fait reconstruire entièrement (à partir de la forêt maintenue, sans relancer Kruskal sur le graphe).
+        """
+        if self._reconstruction_tree is None:
+            from .reconstruction_tree import ReconstructionTree
+            if self._forest is not None:
+                self._reconstruction_tree = ReconstructionTree(*self._forest.indexed_edges())
+            else:
+                self._reconstruction_tree = ReconstructionTree.from_graph(self)
+        return self._reconstruction_tree
 
-    def min_power_kruskal(self,src,dest):
+    def reachable_with_power(self, src, power):
         """
+        Renvoie la liste des noeuds qu'un camion de puissance power peut atteindre depuis src, en O(log n + taille du
+        résultat) grâce à l'arbre de reconstruction de Kruskal.
         """
-        g = kruskal(self)
-        path=g.get_path_with_power(src,dest,float('inf'))
-        def get_power(path): #on définit une fonction qui calcule la puissance nécéssaire pour parcourir un chemin
-            power = 0
-            for i in range(len(path)-1):
-                for voisin in self.graph[path[i]]:
-                    if voisin[0] == path[i+1] and voisin[1] > power:
-                        power = voisin[1]
-            return power
+        return self.reconstruction_tree().reachable(src, power)
 
-        return get_power(path), path
-    """
-    L'algorithme de Kruskal a une complexité de O(E log E), où E est le nombre d'arêtes du graphe.
+    def min_power_dijkstra(self, src, dest):
+        """
+        Renvoie (puissance minimale, chemin) pour le trajet src -> dest, ou (None, None), par une recherche "minimax"
+        à la Dijkstra arrêtée dès que dest est atteint : pour une requête isolée, ni dichotomie ni arbre couvrant
+        (voir dijkstra.py). Complexité : O(|A| log |S|).
+        """
+        from .dijkstra import min_power_dijkstra
+        return min_power_dijkstra(self, src, dest)
 
-    Ensuite, la fonction dfs est appelée pour trouver le chemin le plus court entre src et dest dans l'arbre de recouvrement minimum. 
-    La complexité de dfs est O(E), car elle visite chaque arête une fois.
+    def min_power_from(self, src):
+        """
+        Renvoie un dictionnaire noeud -> puissance minimale d'un trajet depuis src, pour tous les noeuds reliés à src,
+        en un seul parcours (voir dijkstra.py).
+        """
+        from .dijkstra import min_power_from
+        return min_power_from(self, src)
+
+    def min_power_kruskal(self,src,dest):
+        """
+        calcule la puissance minimale pour couvrir le trajet src -> dest et un chemin admissible, en passant par
+        l'arbre couvrant minimal. Renvoie (puissance, chemin), ou (None, None) si src et dest ne sont pas reliés.
+        """
+        if self._query_cache is not None:
+            return self._query_cache.call("min_power_kruskal", src, dest, self._min_power_kruskal)
+        return self._min_power_kruskal(src, dest)
+
+    def _min_power_kruskal(self, src, dest):
+        """Calcul de min_power_kruskal, sans passer par le cache des requêtes."""
+        if instrumentation.ENABLED:
+            instrumentation.count("min_power_kruskal_calls")
+        tree = self.min_power_tree()
+        power = tree.min_power(src, dest)
+        if power is None:
+            return None, None
+        return power, tree.get_path(src, dest)
+    """
+    L'algorithme de Kruskal n'est lancé qu'une fois par graphe (au premier appel), la structure MinPowerTree
+    est ensuite gardée en mémoire : sa construction coûte O(n log n) (binary lifting sur l'arbre enraciné).
 
-    Enfin, la fonction get_power est appelée pour calculer la puissance minimale nécessaire pour parcourir le chemin trouvé. 
-    Cette fonction a une complexité de O(N^2), où N est le nombre de sommets du graphe, car elle doit parcourir toutes les arêtes 
-    adjacentes à chaque sommet dans le chemin.
+    Chaque appel coûte ensuite O(log n) pour la puissance (remontée simultanée de src et dest vers leur plus
+    proche ancêtre commun en conservant la puissance maximale des sauts), plus O(longueur du chemin) pour
+    reconstruire le chemin en suivant les pointeurs vers les parents.
 
-    Ainsi, la complexité totale de min_power_kruskal est de O(E log E + E + N^2), où E est le nombre d'arêtes du graphe et 
-    N est le nombre de sommets du graphe.
+    Ainsi, pour T trajets sur le même graphe, la complexité totale est de O(E log E + n log n + T log n) au lieu de
+    T fois un Kruskal complet.
     """
 
     
@@ -197,9 +488,10 @@ class Graph:
     
 
 
-def graph_from_file(filename):
+def graph_from_file(filename, compact=False):
     """
-    Reads a text file and returns the graph as an object of the Graph class.
+    Reads a text file and returns the graph as an object of the Graph class
+    (or of the CompactGraph class if compact is True).
 
     The file should have the following format: 
         The first line of the file is 'n m'
@@ -211,93 +503,188 @@ def graph_from_file(filename):
     -----------
     filename: str
         The name of the file
+    compact: bool, optional
+        If True, the graph is stored in arrays (see compact_graph.py). Default is False.
 
     Outputs: 
     -----------
     g: Graph
         An object of the class Graph with the graph from file_name.
     """
-    with open(filename, "r") as file:
+    if compact:
+        from .compact_graph import CompactGraph
+        return CompactGraph.from_file(filename)
+    with instrumentation.stage("parse"):
+        n, m, node1, node2, power, dist = read_network(filename)
+    g = Graph(list(range(1, n+1))) #une liste : add_edge peut y ajouter des noeuds
+    if m and (min(min(node1), min(node2)) < 1 or max(max(node1), max(node2)) > n):
+        # des noeuds hors de 1..n : on passe par add_edge qui sait les ajouter
+        for edge in zip(node1, node2, power, dist):
+            g.add_edge(*edge)
+        return g
+    adjacency = g.graph
+    with instrumentation.stage("adjacency"):
+        # les tuples (voisin, puissance, distance) sont fabriqués par zip, la boucle ne fait que les ranger
+        for a, b, vers_b, vers_a in zip(node1, node2, zip(node2, power, dist), zip(node1, power, dist)):
+            adjacency[a].append(vers_b)
+            adjacency[b].append(vers_a)
+    g.nb_edges = m
+    return g
+
+
+def read_network(filename):
+    """
+    Lit un fichier network.x.in en une seule passe et renvoie ses colonnes.
+
+    Tout le fichier est lu d'un coup et découpé en entiers dans un array, puis les colonnes sont extraites par
+    tranches (une arête = 3 ou 4 entiers). Ce raccourci n'est pris que si les m lignes ont toutes le même nombre de
+    colonnes ; sinon on relit le fichier ligne par ligne, ce qui vérifie chaque ligne.
+
+    Outputs:
+    -----------
+    n, m: int
+        Le nombre de noeuds et d'arêtes.
+    node1, node2, power, dist: array
+        Les colonnes des m arêtes (dist vaut 1 si la 4e colonne est absente).
+    """
+    with open(filename, "rb") as file:
         n, m = map(int, file.readline().split())
-        g = Graph(range(1, n+1))
+        # chaque fin de ligne devient un mot ";" : après le découpage, on sait encore où chaque ligne se termine
+        mots = file.read().replace(b"\n", b" ; ").split()
+    if mots and mots[-1] != b";": #dernière ligne sans retour à la ligne
+        mots.append(b";")
+    fins = mots.count(b";")
+    for k in (3, 4):
+        # m lignes de k entiers exactement : le mot numéro k de chaque ligne est sa fin
+        if fins == m and len(mots) == (k + 1) * m and mots[k::k + 1].count(b";") == m:
+            del mots[k::k + 1]
+            values = array("q", map(int, mots))
+            node1, node2, power = values[0::k], values[1::k], values[2::k]
+            dist = values[3::k] if k == 4 else array("q", [1]) * m
+            return n, m, node1, node2, power, dist
+    del mots
+
+    # colonnes de taille variable (ou lignes en trop) : lecture ligne par ligne
+    node1, node2, power, dist = array("q"), array("q"), array("q"), array("q")
+    with open(filename, "rb") as file:
+        file.readline()
         for _ in range(m):
             edge = list(map(int, file.readline().split()))
             if len(edge) == 3:
-                node1, node2, power_min = edge
-                g.add_edge(node1, node2, power_min) # will add dist=1 by default
-            elif len(edge) == 4:
-                node1, node2, power_min, dist = edge
-                g.add_edge(node1, node2, power_min, dist)
-            else:
+                edge.append(1)
+            elif len(edge) != 4:
                 raise Exception("Format incorrect")
-    return g
+            node1.append(edge[0])
+            node2.append(edge[1])
+            power.append(edge[2])
+            dist.append(edge[3])
+    return n, m, node1, node2, power, dist
+
+
+def routes_from_file(filename):
+    """
+    Lit un fichier routes.x.in en une seule passe et renvoie la liste des trajets (src, dest, utility).
+    """
+    with open(filename, "rb") as file:
+        nb_trajets = int(file.readline())
+        values = array("q", map(int, file.read().split()))
+    if len(values) != 3 * nb_trajets:
+        raise Exception("Format incorrect")
+    return list(zip(values[0::3], values[1::3], values[2::3]))
+
+
+def trucks_from_file(filename):
+    """
+    Lit un fichier trucks.x.in en une seule passe et renvoie la liste des camions (power, cost).
+    """
+    with open(filename, "rb") as file:
+        nb_camions = int(file.readline())
+        values = array("q", map(int, file.read().split()))
+    if len(values) != 2 * nb_camions:
+        raise Exception("Format incorrect")
+    return list(zip(values[0::2], values[1::2]))
 
 
 def kruskal(graph):
     """
     fonction kruskal qui prend en entrée un graphe au format de la classe Graph (e.g., g) et qui retourne un autre 
-    élément de cette classe (e.g., g_mst) correspondant à un arbre couvrant de poids minimal de g. 
-    Analyser la complexité de l'algorithme implémenté.
-    Indice : On suggère d'implémenter l'algorithme de Kruskal. Celui-ci est très simple : on prend chaque
-    arête dans l'ordre des poids croissant seulement si l'ajouter aux arêtes déjà prises ne crée pas de cycle
-    (sinon on la jète et on passe à la suivante). La difficulté est de, quand on considère une arête, déterminer
-    rapidement si l'ajouter aux arêtes déjà prises crée un cycle. Ceci peut être fait efficacement avec une
-    structure de donnée particulière appelé Union-Find.
+    élément de cette classe (e.g., g_mst) correspondant à une forêt couvrante de poids minimal de g (un arbre
+    couvrant par composante connexe).
+    On prend chaque arête dans l'ordre des puissances croissantes seulement si l'ajouter aux arêtes déjà prises
+    ne crée pas de cycle, ce que l'on teste avec un Union-Find (déroulé dans kruskal_edges : compression par division
+    de moitié et union par taille).
     """
-    # création d'une liste qui contiendra les arêtes triées par poids croissant
-    edges = []
-    for node in graph.nodes:
-        for voisin in graph.graph[node]:
-            edges.append((voisin[1], node, voisin[0])) #on met power en argument 1 pour que sort() l'ordonne 
-    edges.sort()
-
-    # création d'une liste qui contiendra les ensembles de noeuds connectés
-    node_sets = []
-    for node in graph.nodes:
-        node_sets.append({node})
-
-    # création d'un dictionnaire qui contiendra l'arbre couvrant de poids minimal
-    mst_graph = Graph()
-
-
-    # parcours de toutes les composantes connexes du graphe
-    for component in graph.connected_components():
-        # on réinitialise les listes et dictionnaires pour chaque composante connexe
-        node_sets = []
-        for node in component:
-            node_sets.append({node})
-        mst_graph.nodes = list(component)
-        mst_graph.nb_nodes = len(mst_graph.nodes)
-        mst_graph.graph = {node: [] for node in component}
-
-        # parcours des arêtes triées par poids croissant
-        for power, node1, node2 in edges:
-            # recherche des ensembles auxquels appartiennent node1 et node2
-            node1_set = None
-            node2_set = None
-            for s in node_sets:
-                if node1 in s:
-                    node1_set = s
-                if node2 in s:
-                    node2_set = s
-            # si les noeuds ne sont pas dans le même ensemble, alors l'arête est ajoutée à l'arbre couvrant
-            if node1_set != node2_set:
-                mst_graph.add_edge(node1, node2, power)
-                # fusion des ensembles
-                node1_set.update(node2_set)
-                node_sets.remove(node2_set)
-            # arrêt de la boucle si tous les noeuds appartiennent au même ensemble
-            if len(node_sets) == 1:
-                break
-        
-
+    labels, node1, node2, power, dist = graph.edge_columns() #chaque arête une seule fois
+
+    # le nombre de composantes ne sert qu'à arrêter Kruskal plus tôt : on ne le calcule pas exprès pour ça
+    nb_components = graph._nb_components if graph._component is not None else None
+    garde = kruskal_edges(len(labels), node1, node2, power, nb_components)
+
+    mst_graph = Graph(list(graph.nodes))
+    adjacency = mst_graph.graph #les listes d'adjacence sont remplies directement, sans passer par add_edge
+    for e in garde:
+        a, b = labels[node1[e]], labels[node2[e]]
+        adjacency[a].append((b, power[e], dist[e]))
+        adjacency[b].append((a, power[e], dist[e]))
+    mst_graph.nb_edges = len(garde)
     return mst_graph
 
+
+def kruskal_edges(n, node1, node2, power, nb_components=None):
+    """
+    Coeur de l'algorithme de Kruskal, sur des noeuds numérotés de 0 à n-1.
+
+    Parameters:
+    -----------
+    n: int
+        Le nombre de noeuds.
+    node1, node2, power: list or array
+        Les colonnes des arêtes (une entrée par arête non orientée).
+    nb_components: int, optional
+        Le nombre c de composantes connexes s'il est connu : une forêt couvrante a exactement n - c arêtes,
+        on s'arrête dès qu'on les a. Par défaut on ne s'arrête avant la fin que si le graphe est connexe (n - 1 arêtes).
+
+    Outputs:
+    -----------
+    garde: list
+        Les indices des arêtes de la forêt couvrante minimale, par puissance croissante.
+    """
+    objectif = n - (nb_components or 1)
+    garde = []
+    if objectif <= 0:
+        return garde
+    with instrumentation.stage("kruskal"):
+        ordre = sorted(range(len(node1)), key=power.__getitem__) #un seul tri (stable) des arêtes
+        # Union-Find déroulé dans la boucle : c'est la partie chaude de kruskal, un appel de méthode par find
+        # y coûte plus cher que le find lui-même
+        parent = list(range(n))
+        taille = [1] * n #union par taille plutôt que par rang, pour n'avoir qu'une liste à mettre à jour
+        for e in ordre:
+            x = node1[e]
+            while parent[x] != x:
+                parent[x] = x = parent[parent[x]] #compression par division de moitié
+            y = node2[e]
+            while parent[y] != y:
+                parent[y] = y = parent[parent[y]]
+            if x == y:
+                continue
+            if taille[x] < taille[y]:
+                x, y = y, x
+            parent[y] = x
+            taille[x] += taille[y]
+            garde.append(e)
+            if len(garde) == objectif:
+                break
+    if instrumentation.ENABLED and ordre:
+        examinees = ordre.index(e) + 1 if len(garde) == objectif else len(ordre)
+        instrumentation.count("kruskal_edges_examined", examinees)
+        instrumentation.count("union_find_finds", 2 * examinees) #chaque union cherche les deux représentants
+        instrumentation.count("union_find_unions", len(garde))
+    return garde
+
 """
-La complexité de l'algorithme de Kruskal implémenté ici est de O(m log n), où n est le nombre de nœuds dans le graphe et m est le 
-nombre d'arêtes dans le graphe. La complexité de la création de la liste des arêtes triées est de O(m log m) en raison du tri, mais 
-étant donné que m est au maximum de l'ordre de n^2, cela revient à O(n^2 log n^2) = O(n^2 log n), qui est la même complexité que la 
-fusion et la recherche d'ensemble dans la boucle principale. La création d'une nouvelle instance de la classe Graph dans la boucle 
-principale peut également avoir une complexité linéaire en n, mais cela n'affecte pas la complexité globale de l'algorithme.
+Complexité de kruskal : on parcourt les listes d'adjacence une fois pour obtenir les m arêtes (O(n + m)), on les trie
+une seule fois (O(m log m)), puis chaque arête coûte deux find quasiment en temps constant grâce à la compression
+de chemin par division de moitié et à l'union par taille (O(m α(n))). Le total est donc O(m log m), au lieu de O(m n) par composante
+pour l'ancienne version qui cherchait l'ensemble de chaque extrémité en parcourant toutes les listes d'ensembles.
 """
-
@@ -1,50 +1,22 @@
-
-from graph import Graph, graph_from_file
-import math as mt
-
-def fct_fichier_min_power(fileroute,filenetwork):
-
-    f=open(fileroute, "r", encoding="utf-8")
-    s=f.readlines()
-    a=0
-    b=mt.floor(mt.log(len(s)))
-    L=[]
-    for i in range(1, len(s)):
-        s[i]=s[i].split(" ")
-        s[i][1]=int(s[i][1])
-        s[i][0]=int(s[i][0])
-    g=graph_from_file(filenetwork)
-
-
-    for i in range(1,len(s)):
-        L.append(str(g.min_power(s[i][0], s[i][1])[1]))
-
-
-    print(L)
-
-    with open(fileroute[:-2]+"out", "w") as file:
-
-
-
-        for item in L:
-
-            file.write(item + "\n")
-
-    
-
-    file.close()
-
-
-
-
-
-fct_fichier_min_power("input/routes.2.in", "input/network.2.in")
-
-
-
-import os
-
-
-
-print(os.path.abspath("input/routes.1.out")) 
-
+import argparse
+from .batch import min_power_file
+
+
+def fct_fichier_min_power(fileroute, filenetwork, fileout=None, cache=False, workers=None):
+    """
+    but: écrire dans routes.x.out la puissance minimale de chaque trajet de routes.x.in (une par ligne).
+    Tous les trajets sont traités ensemble par min_power_batch au lieu d'un appel à min_power par trajet
+    (ou par l'arbre couvrant minimal relu dans le cache si cache est True, éventuellement dans workers processus).
+    """
+    return min_power_file(filenetwork, fileroute, fileout, cache, workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcule la puissance minimale de chaque trajet d'un fichier routes.x.in")
+    parser.add_argument("routes", help="fichier routes.x.in")
+    parser.add_argument("network", help="fichier network.x.in")
+    parser.add_argument("-o", "--output", default=None, help="fichier de sortie (par défaut routes.x.out)")
+    parser.add_argument("--no-cache", action="store_true", help="ne pas utiliser le cache du réseau prétraité")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="nombre de processus de calcul")
+    args = parser.parse_args()
+    print(fct_fichier_min_power(args.routes, args.network, args.output, not args.no_cache, args.workers))
@@ -0,0 +1,159 @@
+"""
+Mesures internes des algorithmes : durée de chaque étape (lecture, Kruskal, prétraitement, ...) et compteurs (parcours
+en largeur par min_power, noeuds visités, arêtes relâchées, opérations union-find). Tout est désactivé par défaut : le
+code mesuré ne teste alors que le booléen ENABLED, une fois par appel de fonction et jamais dans les boucles internes
+(et les modules de profilage ne sont importés que lorsqu'on s'en sert).
+
+Utilisation dans le code :
+    from . import instrumentation
+    with instrumentation.stage("kruskal"):
+        ...
+    if instrumentation.ENABLED:
+        instrumentation.count("bfs_calls")
+
+Pour mesurer n'importe quel script ou module (depuis la racine du dépôt) :
+    python -m delivery_network.instrumentation --json stats.json --profile run.prof delivery_network.glouton
+(voir aussi les options --stats et --profile de la commande delivery-network).
+"""
+
+import time
+
+ENABLED = False
+counters = {}
+timers = {} #nom de l'étape -> [durée totale en secondes, nombre d'appels]
+
+
+def enable():
+    """Active les mesures."""
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    """Désactive les mesures (les valeurs déjà mesurées sont gardées)."""
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    """Remet tous les compteurs et chronomètres à zéro."""
+    counters.clear()
+    timers.clear()
+
+
+def count(name, n=1):
+    """Ajoute n au compteur name."""
+    counters[name] = counters.get(name, 0) + n
+
+
+def add_time(name, seconds):
+    """Ajoute une durée (en secondes) mesurée ailleurs à l'étape name."""
+    total = timers.setdefault(name, [0.0, 0])
+    total[0] += seconds
+    total[1] += 1
+
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        add_time(self.name, time.perf_counter() - self.t0)
+        return False
+
+
+class _NoStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name):
+    """
+    Renvoie un gestionnaire de contexte qui chronomètre le bloc sous le nom name (et ne fait rien si les mesures
+    sont désactivées).
+    """
+    return _Stage(name) if ENABLED else _NO_STAGE
+
+
+def summary():
+    """
+    Renvoie un dictionnaire avec toutes les mesures : stages (durée totale et nombre d'appels de chaque étape) et
+    counters.
+    """
+    return {"stages": {name: {"time": total, "calls": calls} for name, (total, calls) in timers.items()},
+            "counters": dict(counters)}
+
+
+def write_summary(filename):
+    """Écrit le résumé des mesures (summary) dans le fichier JSON filename."""
+    import json
+    with open(filename, "w") as file:
+        json.dump(summary(), file, indent=2)
+
+
+def profile(fonction, *args, output=None, sort="cumulative", limit=30, **kwargs):
+    """
+    Appelle fonction(*args, **kwargs) sous cProfile. Renvoie (résultat, statistiques sous forme de texte) ; les
+    statistiques brutes sont aussi écrites dans output si ce n'est pas None (lisibles par pstats ou snakeviz).
+    """
+    import cProfile
+    import io
+    import pstats
+    profiler = cProfile.Profile()
+    try:
+        resultat = profiler.runcall(fonction, *args, **kwargs)
+    finally:
+        if output is not None:
+            profiler.dump_stats(output)
+    texte = io.StringIO()
+    pstats.Stats(profiler, stream=texte).sort_stats(sort).print_stats(limit)
+    return resultat, texte.getvalue()
+
+
+def main(argv=None):
+    import argparse
+    import json
+    import runpy
+    import sys
+    parser = argparse.ArgumentParser(description="Lance un script ou un module en activant les mesures internes")
+    parser.add_argument("--json", default=None, help="fichier JSON où écrire le résumé des mesures")
+    parser.add_argument("--profile", default=None, help="fichier où écrire les statistiques de cProfile")
+    parser.add_argument("script", help="script (fichier .py) ou module (par exemple delivery_network.glouton) à lancer")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments du script")
+    args = parser.parse_args(argv)
+
+    sys.argv = [args.script] + args.args
+    if args.script.endswith(".py"):
+        lancer, cible = runpy.run_path, args.script
+    else:
+        lancer, cible = runpy.run_module, args.script
+    enable()
+    try:
+        if args.profile is not None:
+            _, texte = profile(lancer, cible, run_name="__main__", output=args.profile)
+            print(texte, file=sys.stderr)
+        else:
+            lancer(cible, run_name="__main__")
+    finally:
+        disable()
+        if args.json is not None:
+            write_summary(args.json)
+        else:
+            print(json.dumps(summary(), indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    # le script est chargé sous le nom __main__ : on passe par le module importé, celui que voient graph.py et les
+    # autres modules, pour que enable() les concerne aussi
+    from delivery_network import instrumentation
+    instrumentation.main()
@@ -1,8 +1,9 @@
-from graph import Graph, graph_from_file
+from .graph import Graph, graph_from_file
 
 
 data_path = "input/"
 file_name = "network.01.in"
 
-g = graph_from_file(data_path + file_name)
-print(g)
\ No newline at end of file
+if __name__ == "__main__": #python -m delivery_network.main, depuis la racine du dépôt
+    g = graph_from_file(data_path + file_name)
+    print(g)
@@ -0,0 +1,458 @@
+import operator
+from array import array
+from .graph import kruskal_edges
+
+# en dessous de ce nombre de trajets, min_power_many reste en python pur (convertir en tableaux numpy coûte plus cher)
+NUMPY_THRESHOLD = 256
+
+_numpy_module = None
+
+
+def _numpy():
+    """
+    but: renvoyer le module numpy s'il est installé, None sinon. numpy est une dépendance optionnelle : il n'est
+    importé qu'à la première requête par lot, et une seule tentative est faite.
+    """
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
+
+
+def _typecode(values):
+    """
+    but: choisir le type d'un tableau array pour des puissances (entiers si possible, flottants sinon).
+    """
+    for value in values:
+        if not isinstance(value, int):
+            return "d"
+    return "q"
+
+
+def _column_code(column):
+    """
+    but: renvoyer le type des éléments d'une colonne (array, ou memoryview quand elle est lue dans un cache).
+    """
+    return column.typecode if isinstance(column, array) else column.format
+
+
+def _index_labels(labels):
+    """
+    but: renvoyer (labels, index) où index[noeud] donne l'indice du noeud dans labels.
+    Quand les noeuds sont les entiers d'un range (fichiers network.x.in), on évite de créer un dictionnaire.
+    """
+    if isinstance(labels, range):
+        return labels, _RangeIndex(labels)
+    labels = list(labels)
+    return labels, {node: i for i, node in enumerate(labels)}
+
+
+class _RangeIndex:
+    """
+    Remplace le dictionnaire index quand les noeuds sont les entiers d'un range.
+    """
+
+    def __init__(self, labels):
+        self.labels = labels
+
+    def __getitem__(self, node):
+        try:
+            node = operator.index(node) #entier, numpy compris ; refuse 3.0
+        except TypeError:
+            raise KeyError(node) from None
+        i, reste = divmod(node - self.labels.start, self.labels.step)
+        if reste or not 0 <= i < len(self.labels):
+            raise KeyError(node)
+        return i
+
+    def __contains__(self, node):
+        try:
+            self[node]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class MinPowerTree:
+    """
+    Structure de requêtes construite une seule fois à partir d'un arbre (ou d'une forêt) couvrant de poids minimal.
+    Sur un arbre couvrant minimal, la puissance minimale pour aller de src à dest est le maximum des puissances
+    des arêtes du chemin entre src et dest dans l'arbre. On enracine chaque arbre, puis on précalcule par
+    "binary lifting" l'ancêtre à distance 2^k de chaque noeud et la puissance maximale rencontrée sur ce saut :
+    une requête coûte alors O(log n) au lieu d'un parcours complet.
+
+    Attributes:
+    -----------
+    labels: list or range
+        labels[i] est le noeud d'indice i.
+    index: dict
+        index[noeud] est l'indice du noeud.
+    parent: array
+        parent[i] est l'indice du parent de i (-1 pour une racine).
+    parent_power: array
+        puissance de l'arête entre i et son parent (0 pour une racine).
+    depth: array
+        profondeur de i dans son arbre.
+    root: array
+        indice de la racine de l'arbre contenant i (sert à savoir si deux noeuds sont reliés).
+    up: list of array
+        up[k][i] est l'ancêtre de i à distance 2^k (une racine est son propre ancêtre).
+    up_power: list of array
+        up_power[k][i] est la puissance maximale sur le chemin entre i et up[k][i].
+    """
+
+    def __init__(self, labels, edges):
+        """
+        Parameters:
+        -----------
+        labels: list
+            Les noeuds, dans l'ordre de leurs indices.
+        edges: iterable
+            Les arêtes de la forêt couvrante sous la forme (i, j, power), i et j étant des indices.
+        """
+        self.labels, self.index = _index_labels(labels)
+        n = len(self.labels)
+
+        voisins = [[] for _ in range(n)]
+        powers = []
+        for i, j, power in edges:
+            voisins[i].append((j, power))
+            voisins[j].append((i, power))
+            powers.append(power)
+        code = _typecode(powers)
+
+        # on enracine chaque arbre de la forêt par un parcours en largeur (itératif, pas de limite de récursion)
+        parent = array("q", [-1]) * n
+        parent_power = array(code, [0]) * n
+        depth = array("q", [0]) * n
+        root = array("q", [-1]) * n
+        for r in range(n):
+            if root[r] != -1:
+                continue
+            root[r] = r
+            file = [r]
+            for node in file:
+                for voisin, power in voisins[node]:
+                    if root[voisin] == -1:
+                        root[voisin] = r
+                        parent[voisin] = node
+                        parent_power[voisin] = power
+                        depth[voisin] = depth[node] + 1
+                        file.append(voisin)
+
+        self.parent = parent
+        self.parent_power = parent_power
+        self.depth = depth
+        self.root = root
+        self._build_tables()
+
+    def _build_tables(self):
+        """
+        but: construire les tables up et up_power à partir de parent et parent_power.
+        """
+        n = len(self.labels)
+        max_depth = max(self.depth, default=0)
+        up0 = array("q", (p if p != -1 else i for i, p in enumerate(self.parent)))
+        self.up = [up0]
+        self.up_power = [array(_column_code(self.parent_power), self.parent_power)]
+        for _ in range(1, max(1, max_depth.bit_length())):
+            prev, prev_power = self.up[-1], self.up_power[-1]
+            self.up.append(array("q", (prev[prev[i]] for i in range(n))))
+            self.up_power.append(array(_column_code(prev_power),
+                                       (max(prev_power[i], prev_power[prev[i]]) for i in range(n))))
+
+    def update(self, adjacency, removed=None, added=None):
+        """
+        Met à jour la structure en place après une modification de la forêt couvrante (voir SpanningForest.last_change),
+        sans tout reconstruire : seul le sous-arbre qui change de place est réenraciné, et seules ses lignes des tables
+        sont recalculées, en O(k log n) pour un sous-arbre de k noeuds.
+
+        Parameters:
+        -----------
+        adjacency: dict
+            La forêt après la modification (SpanningForest.adjacency).
+        removed, added: tuple, optional
+            L'arête (node1, node2, power) sortie de la forêt, et celle qui y est entrée.
+
+        Outputs:
+        -----------
+        updated: bool
+            False si la mise à jour en place est impossible (tables en lecture seule lues dans un cache, noeud inconnu,
+            puissance non entière dans des tables d'entiers) : la structure n'a alors pas été modifiée et il faut la
+            reconstruire. Si l'arbre devient plus profond que ce que couvrent les tables, un niveau est ajouté (O(n)).
+        """
+        parent, parent_power, depth, root = self.parent, self.parent_power, self.depth, self.root
+        if not all(isinstance(table, array) for table in (parent, parent_power, depth, root, *self.up, *self.up_power)):
+            return False
+        if added is not None and _column_code(parent_power) == "q" and not isinstance(added[2], int):
+            return False
+        index, labels, up, up_power = self.index, self.labels, self.up, self.up_power
+        try:
+            if removed is not None:
+                a, b = index[removed[0]], index[removed[1]]
+                enfant = a if parent[a] == b else b #le sous-arbre de enfant se détache
+                if parent[enfant] not in (a, b):
+                    return False
+            if added is not None:
+                u, v = index[added[0]], index[added[1]]
+        except KeyError:
+            return False
+
+        # debut : la nouvelle racine du morceau déplacé, rattachée à pere (-1 si le morceau devient un arbre à part)
+        if added is None:
+            debut, pere = enfant, -1
+        elif removed is None: #deux arbres réunis : celui de u est accroché sous v
+            debut, pere = u, v
+        else:
+            debut, pere = (u, v) if self._in_subtree(u, enfant) else (v, u)
+
+        # parcours en largeur du morceau depuis debut, dans la forêt modifiée, sans repasser par pere
+        file, peres, puissances = [debut], [pere], [added[2] if added is not None else 0]
+        profondeurs = [depth[pere] + 1 if pere != -1 else 0]
+        for k, i in enumerate(file):
+            for voisin, power in adjacency[labels[i]].items():
+                j = index[voisin]
+                if j != peres[k]:
+                    file.append(j)
+                    peres.append(i)
+                    puissances.append(power)
+                    profondeurs.append(profondeurs[k] + 1)
+        racine = root[pere] if pere != -1 else debut
+        for i, p, power, d in zip(file, peres, puissances, profondeurs):
+            parent[i], parent_power[i], depth[i], root[i] = p, power, d, racine
+        # dans l'ordre du parcours, les ancêtres d'un noeud ont déjà leurs lignes à jour (ou n'ont pas bougé)
+        for i in file:
+            up[0][i] = parent[i] if parent[i] != -1 else i
+            up_power[0][i] = parent_power[i]
+            for k in range(1, len(up)):
+                milieu = up[k - 1][i]
+                up[k][i] = up[k - 1][milieu]
+                up_power[k][i] = max(up_power[k - 1][i], up_power[k - 1][milieu])
+        while max(profondeurs) >= 1 << len(up): #les sauts de 2^k ne suffisent plus : un niveau de plus, en O(n)
+            prev, prev_power = up[-1], up_power[-1]
+            up.append(array("q", (prev[prev[i]] for i in range(len(labels)))))
+            up_power.append(array(_column_code(prev_power),
+                                  (max(prev_power[i], prev_power[prev[i]]) for i in range(len(labels)))))
+            self._np_tables = None #les vues numpy ne couvrent pas le nouveau niveau
+        return True
+
+    def _in_subtree(self, x, c):
+        """
+        but: dire si le noeud d'indice x est dans le sous-arbre de c (c est l'ancêtre de x à la profondeur de c).
+        """
+        diff = self.depth[x] - self.depth[c]
+        if diff < 0:
+            return False
+        k = 0
+        while diff:
+            if diff & 1:
+                x = self.up[k][x]
+            diff >>= 1
+            k += 1
+        return x == c
+
+    @classmethod
+    def from_arrays(cls, labels, tables):
+        """
+        Reconstruit la structure à partir de tables déjà calculées (voir tables), sans aucun calcul :
+        les tables peuvent être des array ou des memoryview sur un fichier (voir cache.py).
+        """
+        tree = cls.__new__(cls)
+        tree.labels, tree.index = _index_labels(labels)
+        tree.parent = tables["parent"]
+        tree.parent_power = tables["parent_power"]
+        tree.depth = tables["depth"]
+        tree.root = tables["root"]
+        tree.up = [tables[f"up{k}"] for k in range(tables["levels"])]
+        tree.up_power = [tables[f"up_power{k}"] for k in range(tables["levels"])]
+        return tree
+
+    def tables(self):
+        """
+        Renvoie un dictionnaire contenant toutes les tables de la structure (pour les enregistrer, voir cache.py).
+        """
+        tables = {"parent": self.parent, "parent_power": self.parent_power, "depth": self.depth,
+                  "root": self.root, "levels": len(self.up)}
+        for k in range(len(self.up)):
+            tables[f"up{k}"] = self.up[k]
+            tables[f"up_power{k}"] = self.up_power[k]
+        return tables
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construit la structure à partir d'un graphe quelconque (on calcule d'abord son arbre couvrant minimal).
+        """
+        labels, node1, node2, power, _ = graph.edge_columns()
+        garde = kruskal_edges(len(labels), node1, node2, power, graph.nb_components())
+        return cls(labels, ((node1[e], node2[e], power[e]) for e in garde))
+
+    @classmethod
+    def from_mst(cls, mst, nodes=None):
+        """
+        Construit la structure à partir d'un arbre couvrant déjà calculé (objet de la classe Graph).
+        nodes permet de garder les noeuds isolés qui n'apparaissent pas dans l'arbre.
+        """
+        labels = list(nodes) if nodes is not None else list(mst.graph)
+        index = {node: i for i, node in enumerate(labels)}
+        for node in mst.graph:
+            if node not in index:
+                index[node] = len(labels)
+                labels.append(node)
+        edges = []
+        for node, voisins in mst.graph.items():
+            for voisin, power, _ in voisins:
+                if index[voisin] > index[node]: #chaque arête non orientée n'est prise qu'une fois
+                    edges.append((index[node], index[voisin], power))
+        return cls(labels, edges)
+
+    def _lca(self, a, b):
+        """
+        but: renvoyer l'indice du plus proche ancêtre commun de a et b et la puissance maximale sur le chemin a-b.
+        a et b doivent être dans le même arbre.
+        """
+        up, up_power, depth = self.up, self.up_power, self.depth
+        power = 0
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                power = max(power, up_power[k][a])
+                a = up[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a, power
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][a] != up[k][b]:
+                power = max(power, up_power[k][a], up_power[k][b])
+                a = up[k][a]
+                b = up[k][b]
+        power = max(power, up_power[0][a], up_power[0][b])
+        return up[0][a], power
+
+    def min_power(self, src, dest):
+        """
+        Renvoie la puissance minimale d'un camion pouvant couvrir le trajet src -> dest, ou None s'il n'existe
+        aucun chemin. Complexité : O(log n).
+        """
+        a, b = self.index[src], self.index[dest]
+        if self.root[a] != self.root[b]:
+            return None
+        return self._lca(a, b)[1]
+
+    def min_power_many(self, srcs, dests):
+        """
+        Version par lot de min_power : renvoie la liste des puissances minimales des trajets srcs[i] -> dests[i].
+        Si numpy est installé et qu'il y a assez de trajets, le calcul passe par min_power_array.
+        """
+        np = _numpy()
+        if np is not None and hasattr(srcs, "__len__") and len(srcs) >= NUMPY_THRESHOLD:
+            powers, connected = self.min_power_array(srcs, dests)
+            powers = powers.tolist()
+            for i in np.flatnonzero(~connected).tolist():
+                powers[i] = None
+            return powers
+        index, root, lca = self.index, self.root, self._lca
+        powers = []
+        for src, dest in zip(srcs, dests):
+            a, b = index[src], index[dest]
+            powers.append(lca(a, b)[1] if root[a] == root[b] else None)
+        return powers
+
+    def _numpy_tables(self, np):
+        """
+        but: renvoyer (depth, root, up, up_power) sous forme de tableaux numpy partageant la mémoire des tables
+        (array ou memoryview sur le cache), sans copie. Ils sont gardés pour les appels suivants.
+        """
+        tables = getattr(self, "_np_tables", None) #absent si la structure vient de from_arrays
+        if tables is None:
+            vue = lambda table: np.frombuffer(table, dtype=_column_code(table))
+            tables = (vue(self.depth), vue(self.root), [vue(table) for table in self.up],
+                      [vue(table) for table in self.up_power])
+            self._np_tables = tables
+        return tables
+
+    def _numpy_indices(self, np, nodes):
+        """
+        but: renvoyer le tableau numpy des indices des noeuds de nodes (KeyError pour un noeud inconnu).
+        """
+        if isinstance(self.labels, range):
+            labels = self.labels
+            decalage = np.asarray(nodes, dtype=np.int64) - labels.start
+            indices = decalage // labels.step
+            inconnus = (indices < 0) | (indices >= len(labels)) | (decalage % labels.step != 0)
+            if inconnus.any():
+                raise KeyError((decalage[inconnus][0] + labels.start).item())
+            return indices
+        nodes = list(nodes)
+        return np.fromiter(map(self.index.__getitem__, nodes), dtype=np.int64, count=len(nodes))
+
+    def min_power_array(self, srcs, dests):
+        """
+        Version vectorisée de min_power (nécessite numpy) : srcs et dests sont des tableaux (ou des listes) de noeuds.
+        Les deux tableaux d'extrémités sont remontés ensemble dans les tables du binary lifting, niveau par niveau :
+        il n'y a plus de boucle python par trajet, seulement O(log n) opérations sur des tableaux.
+
+        Outputs:
+        -----------
+        powers: numpy.ndarray
+            powers[i] est la puissance minimale du trajet srcs[i] -> dests[i] (sans signification si le trajet est
+            impossible).
+        connected: numpy.ndarray
+            connected[i] vaut True si srcs[i] et dests[i] sont reliés.
+        """
+        np = _numpy()
+        if np is None:
+            raise ImportError("min_power_array nécessite numpy")
+        depth, root, up, up_power = self._numpy_tables(np)
+        a, b = self._numpy_indices(np, srcs), self._numpy_indices(np, dests)
+        connected = root[a] == root[b]
+
+        # a devient l'extrémité la plus profonde
+        echange = depth[a] < depth[b]
+        a, b = np.where(echange, b, a), np.where(echange, a, b)
+        diff = depth[a] - depth[b]
+        powers = np.zeros(len(a), dtype=up_power[0].dtype)
+        # on remonte a à la profondeur de b, bit par bit de la différence de profondeur
+        for k in range(len(up)):
+            saut = (diff >> k) & 1 == 1
+            powers = np.where(saut, np.maximum(powers, up_power[k][a]), powers)
+            a = np.where(saut, up[k][a], a)
+        # puis on remonte a et b ensemble tant que leurs ancêtres diffèrent
+        for k in range(len(up) - 1, -1, -1):
+            up_a, up_b = up[k][a], up[k][b]
+            saut = up_a != up_b
+            powers = np.where(saut, np.maximum(powers, np.maximum(up_power[k][a], up_power[k][b])), powers)
+            a, b = np.where(saut, up_a, a), np.where(saut, up_b, b)
+        dernier = a != b #le dernier saut jusqu'au plus proche ancêtre commun
+        powers = np.where(dernier, np.maximum(powers, np.maximum(up_power[0][a], up_power[0][b])), powers)
+        return powers, connected
+
+    def get_path(self, src, dest):
+        """
+        Renvoie le chemin de src à dest dans l'arbre (c'est un chemin de puissance minimale), ou None.
+        Complexité : O(log n + longueur du chemin).
+        """
+        a, b = self.index[src], self.index[dest]
+        if self.root[a] != self.root[b]:
+            return None
+        lca = self._lca(a, b)[0]
+        debut, fin = [], []
+        while a != lca:
+            debut.append(a)
+            a = self.parent[a]
+        while b != lca:
+            fin.append(b)
+            b = self.parent[b]
+        chemin = debut + [lca] + fin[::-1]
+        return [self.labels[i] for i in chemin]
@@ -0,0 +1,248 @@
+"""
+Arbre couvrant minimal des réseaux trop gros pour tenir en mémoire sous forme de Graph.
+
+Le fichier network.x.in n'est jamais chargé en entier :
+    1. il est lu en flux par paquets de run_size arêtes ; chaque paquet est trié par puissance et écrit dans un fichier
+       binaire temporaire (un "run") ;
+    2. les runs sont relus en flux et fusionnés (heapq.merge) : on obtient toutes les arêtes par puissance croissante
+       en ne gardant en mémoire qu'un bloc de chaque run ;
+    3. Kruskal consomme ce flux avec une structure Union-Find de taille n ; la forêt (au plus n - 1 arêtes) est gardée
+       dans des tableaux array ;
+    4. la forêt est enracinée sur une liste d'adjacence compacte (tableaux array de O(n) entiers), puis les tables de
+       MinPowerTree sont calculées niveau par niveau directement dans un fichier binaire au format de cache.py,
+       projeté en mémoire : les n log n entrées des tables ne sont jamais en mémoire en même temps. Le fichier est
+       relu ensuite avec mmap sans aucun calcul.
+La mémoire utilisée est donc O(n) (Union-Find, forêt, enracinement) plus un run en cours de tri, indépendamment du
+nombre m d'arêtes. À puissance égale, les arêtes restent dans l'ordre du fichier : la forêt obtenue est la même que
+celle de kruskal.
+"""
+
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import chain
+from .cache import create_arrays, read_arrays, file_hash, cache_path, _labels_to_json, _labels_from_json
+from .min_power_tree import MinPowerTree, _column_code
+from .union_find import UnionFind
+
+RUN_MEMORY = 64 << 20 #mémoire visée pour trier un run (octets)
+RUN_EDGE_BYTES = 120 #mémoire par arête pendant le tri d'un run (colonnes, permutation et clés du tri), mesurée avec tracemalloc
+RUN_SIZE = RUN_MEMORY // RUN_EDGE_BYTES #arêtes par run trié, environ 560 000
+BLOCK_SIZE = 8192 #arêtes relues à la fois dans chaque run pendant la fusion
+
+
+def write_sorted_runs(filename, run_dir, run_size=RUN_SIZE):
+    """
+    Lit le fichier network.x.in filename en flux et écrit dans run_dir des runs triés par puissance, chaque arête étant
+    enregistrée sous la forme (puissance, numéro de l'arête dans le fichier, node1, node2) en entiers de 8 octets.
+    Renvoie (n, m, liste des chemins des runs).
+    """
+    runs = []
+    m = 0
+    with open(filename, "rb") as file:
+        n = int(file.readline().split()[0])
+        node1, node2, power = array("q"), array("q"), array("q")
+        for ligne in file:
+            valeurs = ligne.split()
+            if not valeurs:
+                continue
+            if len(valeurs) not in (3, 4):
+                raise Exception("Format incorrect")
+            a, b = int(valeurs[0]), int(valeurs[1])
+            if not (1 <= a <= n and 1 <= b <= n):
+                raise ValueError(f"noeud hors de 1..{n} : {ligne.decode().strip()}")
+            node1.append(a)
+            node2.append(b)
+            power.append(int(valeurs[2]))
+            if len(power) == run_size:
+                runs.append(_write_run(run_dir, len(runs), m, node1, node2, power))
+                m += len(power)
+                node1, node2, power = array("q"), array("q"), array("q")
+        if power:
+            runs.append(_write_run(run_dir, len(runs), m, node1, node2, power))
+            m += len(power)
+    return n, m, runs
+
+
+def _write_run(run_dir, numero, debut, node1, node2, power):
+    """
+    but: trier un paquet d'arêtes (colonnes array, la première étant l'arête numéro debut du fichier) par puissance et
+    l'écrire dans le run numero de run_dir. Renvoie le chemin du run.
+    """
+    ordre = sorted(range(len(power)), key=power.__getitem__) #tri stable : à puissance égale, l'ordre du fichier
+    path = os.path.join(run_dir, f"run.{numero}.bin")
+    with open(path, "wb") as run:
+        array("q", chain.from_iterable((power[e], debut + e, node1[e], node2[e]) for e in ordre)).tofile(run)
+    return path
+
+
+def iter_run(path, block_size=BLOCK_SIZE):
+    """
+    Renvoie un générateur sur les arêtes (puissance, numéro, node1, node2) d'un run, lues par blocs de block_size.
+    """
+    with open(path, "rb") as file:
+        while True:
+            bloc = array("q")
+            try:
+                bloc.fromfile(file, 4 * block_size)
+            except EOFError: #fin du fichier : bloc contient quand même les dernières arêtes
+                pass
+            if not bloc:
+                return
+            for k in range(0, len(bloc), 4):
+                yield bloc[k], bloc[k + 1], bloc[k + 2], bloc[k + 3]
+
+
+def external_kruskal(filename, run_size=RUN_SIZE, tmp_dir=None):
+    """
+    Calcule la forêt couvrante minimale du fichier network.x.in filename sans le charger en mémoire.
+    Renvoie (n, m, node1, node2, power) : le nombre de noeuds et d'arêtes du réseau, puis les colonnes (array) des
+    arêtes de la forêt par puissance croissante. Les runs sont écrits dans un dossier temporaire de tmp_dir.
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as dossier:
+        n, m, runs = write_sorted_runs(filename, dossier, run_size)
+        union = UnionFind(n).union
+        node1, node2, power = array("q"), array("q"), array("q")
+        flux = heapq.merge(*(iter_run(path) for path in runs))
+        for p, _, a, b in flux:
+            if union(a - 1, b - 1):
+                node1.append(a)
+                node2.append(b)
+                power.append(p)
+                if len(power) == n - 1: #la forêt est un arbre couvrant : les arêtes suivantes sont inutiles
+                    break
+        flux.close()
+    return n, m, node1, node2, power
+
+
+def forest_path(filename, cache_dir=None):
+    """
+    Renvoie le chemin du fichier de forêt associé au fichier network.x.in filename (à côté du cache de cache.py).
+    """
+    return cache_path(filename, cache_dir)[:-len(".bin")] + ".forest.bin"
+
+
+def save_forest(path, n, node1, node2, power, meta=None):
+    """
+    Enregistre dans path la forêt (colonnes node1, node2, power sur les noeuds 1..n) et les tables de MinPowerTree.
+    Les tables sont calculées directement dans le fichier projeté en mémoire (cache.create_arrays), niveau par niveau :
+    aucune structure MinPowerTree n'est construite en mémoire. Renvoie la structure MinPowerTree relue sur le fichier.
+    """
+    parent, parent_power, depth, root = _root_forest(n, node1, node2, power)
+    levels = max(1, max(depth, default=0).bit_length()) #autant de niveaux que MinPowerTree
+    code = _column_code(power)
+    shapes = {"forest.node1": ("q", len(node1)), "forest.node2": ("q", len(node2)), "forest.power": (code, len(power)),
+              "tree.parent": ("q", n), "tree.parent_power": (code, n), "tree.depth": ("q", n), "tree.root": ("q", n)}
+    for k in range(levels):
+        shapes[f"tree.up{k}"] = ("q", n)
+        shapes[f"tree.up_power{k}"] = (code, n)
+    meta = dict(meta or {})
+    meta.update({"kind": "forest", "labels": _labels_to_json(range(1, n + 1)), "levels": levels})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with create_arrays(path, meta, shapes) as arrays:
+        for name, values in (("forest.node1", node1), ("forest.node2", node2), ("forest.power", power),
+                             ("tree.parent", parent), ("tree.parent_power", parent_power), ("tree.depth", depth),
+                             ("tree.root", root)):
+            arrays[name][:] = memoryview(values)
+        del parent_power, depth, root
+        up, up_power = arrays["tree.up0"], arrays["tree.up_power0"]
+        for i in range(n):
+            up[i] = parent[i] if parent[i] != -1 else i
+        up_power[:] = arrays["tree.parent_power"]
+        del parent
+        # le niveau k se calcule à partir du niveau k - 1 seulement, relu dans le fichier
+        for k in range(1, levels):
+            prev, prev_power = up, up_power
+            up, up_power = arrays[f"tree.up{k}"], arrays[f"tree.up_power{k}"]
+            for i in range(n):
+                milieu = prev[i]
+                up[i] = prev[milieu]
+                up_power[i] = max(prev_power[i], prev_power[milieu])
+    return read_forest(path)[2]
+
+
+def _root_forest(n, node1, node2, power):
+    """
+    but: enraciner chaque arbre de la forêt (colonnes node1, node2, power sur les noeuds 1..n) comme le fait
+    MinPowerTree, mais sur une liste d'adjacence compacte (tableaux array, sans objet python par noeud ni par arête).
+    Renvoie les tables (parent, parent_power, depth, root) sur les indices 0..n-1.
+    """
+    code = _column_code(power)
+    # liste d'adjacence au format CSR : les voisins de i sont voisin[debut[i]:debut[i + 1]]
+    debut = array("q", [0]) * (n + 1)
+    for a, b in zip(node1, node2):
+        debut[a] += 1
+        debut[b] += 1
+    for i in range(n):
+        debut[i + 1] += debut[i]
+    place = array("q", debut)
+    voisin = array("q", [0]) * (2 * len(node1))
+    voisin_power = array(code, [0]) * (2 * len(node1))
+    for a, b, p in zip(node1, node2, power):
+        for i, j in ((a - 1, b - 1), (b - 1, a - 1)):
+            voisin[place[i]] = j
+            voisin_power[place[i]] = p
+            place[i] += 1
+    del place
+
+    parent = array("q", [-1]) * n
+    parent_power = array(code, [0]) * n
+    depth = array("q", [0]) * n
+    root = array("q", [-1]) * n
+    file = array("q", [0]) * n #file du parcours en largeur, partagée par tous les arbres
+    fin = 0
+    for r in range(n):
+        if root[r] != -1:
+            continue
+        root[r] = r
+        k = fin
+        file[fin] = r
+        fin += 1
+        while k < fin:
+            i = file[k]
+            k += 1
+            for e in range(debut[i], debut[i + 1]):
+                j = voisin[e]
+                if root[j] == -1:
+                    root[j] = r
+                    parent[j] = i
+                    parent_power[j] = voisin_power[e]
+                    depth[j] = depth[i] + 1
+                    file[fin] = j
+                    fin += 1
+    return parent, parent_power, depth, root
+
+
+def read_forest(path):
+    """
+    Relit un fichier écrit par save_forest. Renvoie (meta, forest, tree) où forest est le dictionnaire des colonnes
+    node1, node2, power de la forêt et tree la structure MinPowerTree, toutes deux sur le fichier projeté en mémoire.
+    Renvoie None si path n'est pas un fichier de forêt valide.
+    """
+    meta, arrays = read_arrays(path)
+    if meta is None or meta.get("kind") != "forest":
+        return None
+    forest = {name[7:]: values for name, values in arrays.items() if name.startswith("forest.")}
+    tables = {name[5:]: values for name, values in arrays.items() if name.startswith("tree.")}
+    tables["levels"] = meta["levels"]
+    return meta, forest, MinPowerTree.from_arrays(_labels_from_json(meta["labels"]), tables)
+
+
+def load_forest(filename, cache_dir=None, run_size=RUN_SIZE):
+    """
+    Renvoie (forest, tree) pour le fichier network.x.in filename (voir read_forest) : la forêt est relue dans son
+    fichier si le contenu de filename n'a pas changé (empreinte sha1), sinon elle est recalculée par external_kruskal
+    puis enregistrée.
+    """
+    path = forest_path(filename, cache_dir)
+    empreinte = file_hash(filename)
+    if os.path.exists(path):
+        resultat = read_forest(path)
+        if resultat is not None and resultat[0].get("sha1") == empreinte:
+            return resultat[1:]
+    os.makedirs(os.path.dirname(path), exist_ok=True) #les runs temporaires sont écrits à côté du fichier de forêt
+    n, m, node1, node2, power = external_kruskal(filename, run_size, os.path.dirname(path))
+    save_forest(path, n, node1, node2, power, {"source": os.path.abspath(filename), "sha1": empreinte,
+                                               "nb_edges": m})
+    return read_forest(path)[1:]
@@ -0,0 +1,84 @@
+"""
+Calcul en parallèle des puissances minimales d'un grand nombre de trajets.
+
+Le réseau est prétraité une seule fois dans le processus principal et enregistré dans le cache sur disque
+(cache.py). Chaque processus de calcul relit ce fichier avec mmap au démarrage : les tables de MinPowerTree ne sont
+ni copiées ni envoyées par pickle, le système partage les mêmes pages entre tous les processus. Seuls les trajets
+(découpés en paquets) et les puissances trouvées transitent entre les processus, et les résultats sont remis dans
+l'ordre des trajets.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .cache import load_network, cache_path, read_arrays, read_network_cache
+
+_tree = None #structure de requêtes du processus de calcul, relue dans le cache par _init_worker
+_erreur = None #pourquoi _tree n'a pas pu être relue
+
+
+def _init_worker(path, empreinte):
+    """
+    but: relire la structure de requêtes dans le cache path, qui doit correspondre au réseau d'empreinte sha1
+    empreinte. Une erreur levée ici casserait le pool sans message utile : elle est gardée et levée par _solve_shard,
+    ce qui la transmet au processus principal.
+    """
+    global _tree, _erreur
+    network = read_network_cache(path) if os.path.exists(path) else None
+    if network is None:
+        _erreur = f"cache du réseau absent ou illisible : {path}"
+    elif network[0] != empreinte:
+        _erreur = f"cache du réseau périmé (modifié depuis le lancement des processus) : {path}"
+    else:
+        _tree = network[3]
+
+
+def _solve_shard(shard):
+    if _tree is None:
+        raise RuntimeError(_erreur)
+    srcs, dests = shard
+    return _tree.min_power_many(srcs, dests)
+
+
+def min_power_parallel(filenetwork, pairs, workers=None, shard_size=None, cache_dir=None):
+    """
+    Renvoie la liste des puissances minimales des trajets (src, dest) de pairs sur le réseau filenetwork,
+    calculées par workers processus (par défaut, autant que de processeurs).
+
+    Parameters:
+    -----------
+    filenetwork: str
+        Le fichier network.x.in (son prétraitement est relu dans le cache, ou calculé et enregistré au premier appel).
+    pairs: list
+        La liste des trajets (src, dest).
+    workers: int, optional
+        Le nombre de processus.
+    shard_size: int, optional
+        Le nombre de trajets envoyés à la fois à un processus (par défaut, environ 4 paquets par processus).
+    """
+    pairs = list(pairs)
+    workers = workers or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = max(1, -(-len(pairs) // (4 * workers)))
+    shards = (pairs[k:k + shard_size] for k in range(0, len(pairs), shard_size))
+    return [power for shard in min_power_parallel_iter(filenetwork, shards, workers, cache_dir) for power in shard]
+
+
+def min_power_parallel_iter(filenetwork, shards, workers=None, cache_dir=None):
+    """
+    Version en flux de min_power_parallel : shards est un itérable de paquets de trajets (src, dest) (par exemple
+    routes_io.iter_route_chunks), et on renvoie un générateur des listes de puissances de chaque paquet, dans l'ordre.
+    Au plus 2 * workers paquets sont en cours de calcul à la fois, la mémoire utilisée reste donc bornée.
+    """
+    workers = workers or os.cpu_count() or 1
+    load_network(filenetwork, cache_dir) #le cache est à jour avant de lancer les processus
+    path = cache_path(filenetwork, cache_dir)
+    empreinte = read_arrays(path)[0]["sha1"] #chaque processus vérifie qu'il relit bien ce cache-là
+    en_cours = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path, empreinte)) as executor:
+        for shard in shards:
+            en_cours.append(executor.submit(_solve_shard, ([route[0] for route in shard], [route[1] for route in shard])))
+            if len(en_cours) >= 2 * workers:
+                yield en_cours.popleft().result() #les résultats sont rendus dans l'ordre des paquets
+        while en_cours:
+            yield en_cours.popleft().result()
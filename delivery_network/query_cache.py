@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+
+def _mirror(resultat):
+    """
+    but: renvoyer le résultat du trajet dest -> src à partir de celui de src -> dest (les chemins sont retournés,
+    la puissance est la même puisque le graphe n'est pas orienté).
+    """
+    return tuple(x[::-1] if isinstance(x, list) else x for x in resultat)
+
+
+def _copy(resultat):
+    """
+    but: copier les chemins d'un résultat pour que l'appelant ne puisse pas modifier ce qui est gardé en mémoire.
+    """
+    return tuple(list(x) if isinstance(x, list) else x for x in resultat)
+
+
+class QueryCache:
+    """
+    Cache des résultats de requêtes sur un graphe (min_power, min_power_kruskal), de taille bornée : quand il est
+    plein, on oublie le résultat utilisé le moins récemment (LRU).
+    Le graphe n'étant pas orienté, (src, dest) et (dest, src) partagent la même entrée : la clé est la paire non
+    ordonnée, et le chemin est retourné quand on demande le trajet en sens inverse.
+
+    Attributes:
+    -----------
+    maxsize: int
+        Le nombre maximal de résultats gardés.
+    hits, misses: int
+        Le nombre de requêtes trouvées dans le cache et le nombre de requêtes calculées.
+    """
+
+    def __init__(self, maxsize=100000):
+        if maxsize <= 0:
+            raise ValueError("maxsize doit être strictement positif")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict() #(requête, paire non ordonnée) -> (src du calcul, résultat)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def call(self, kind, src, dest, fonction):
+        """
+        Renvoie fonction(src, dest) (un tuple), en le reprenant dans le cache si la requête kind a déjà été faite pour
+        (src, dest) ou (dest, src).
+        """
+        key = (kind, frozenset((src, dest)))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            debut, resultat = entry
+            return _copy(resultat) if debut == src else _mirror(resultat)
+        self.misses += 1
+        resultat = fonction(src, dest)
+        self._entries[key] = (src, _copy(resultat))
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return resultat
+
+    def clear(self):
+        """
+        Oublie tous les résultats (après une modification du graphe). Les compteurs sont gardés.
+        """
+        self._entries.clear()
+
+    def info(self):
+        """
+        Renvoie un dictionnaire avec les compteurs et la taille du cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
@@ -0,0 +1,186 @@
+from array import array
+from .graph import kruskal_edges
+from .union_find import UnionFind
+from .min_power_tree import _typecode, _index_labels
+
+
+class ReconstructionTree:
+    """
+    Arbre de reconstruction de Kruskal.
+
+    On déroule l'algorithme de Kruskal : chaque fois qu'une arête de puissance p fusionne deux composantes, on crée un
+    nouveau noeud interne de poids p dont les deux fils sont les noeuds représentant ces composantes. Les feuilles sont
+    les noeuds du graphe et les poids croissent en remontant vers la racine. Les noeuds que peut atteindre un camion de
+    puissance p depuis src sont alors exactement les feuilles du sous-arbre du plus haut ancêtre de src de poids <= p.
+    On trouve cet ancêtre par "binary lifting" en O(log n) ; comme les feuilles de chaque sous-arbre sont consécutives
+    dans l'ordre du parcours en profondeur, la taille de la composante s'obtient en O(1) et son énumération en temps
+    proportionnel au nombre de noeuds renvoyés.
+
+    Attributes:
+    -----------
+    labels: list or range
+        labels[i] est le noeud du graphe d'indice i (les feuilles sont les indices 0 à n-1).
+    index: dict
+        index[noeud] est l'indice de la feuille du noeud.
+    parent: array
+        parent[x] est le père du noeud x de l'arbre (-1 pour une racine) ; les noeuds internes sont les indices >= n.
+    weight: array
+        weight[x] est la puissance de l'arête qui a créé le noeud interne x (0 pour une feuille).
+    start, size: array
+        les feuilles du sous-arbre de x sont order[start[x]], ..., order[start[x] + size[x] - 1].
+    order: array
+        les feuilles dans l'ordre du parcours en profondeur.
+    depth, root: array
+        profondeur et racine de chaque noeud.
+    up: list of array
+        up[k][x] est l'ancêtre de x à distance 2^k (une racine est son propre ancêtre).
+    """
+
+    def __init__(self, labels, edges):
+        """
+        Parameters:
+        -----------
+        labels: list
+            Les noeuds, dans l'ordre de leurs indices.
+        edges: iterable
+            Les arêtes de la forêt couvrante minimale sous la forme (i, j, power), i et j étant des indices,
+            par puissance croissante.
+        """
+        self.labels, self.index = _index_labels(labels)
+        n = len(self.labels)
+        edges = list(edges)
+        total = n + len(edges)
+
+        parent = array("q", [-1]) * total
+        weight = array(_typecode(power for _, _, power in edges), [0]) * total
+        left = array("q", [-1]) * total
+        right = array("q", [-1]) * total
+        union_find = UnionFind(n)
+        top = list(range(n)) #top[représentant] est le noeud de l'arbre qui représente la composante
+        for k, (i, j, power) in enumerate(edges):
+            a, b = union_find.find(i), union_find.find(j)
+            x = n + k
+            parent[top[a]] = parent[top[b]] = x
+            left[x], right[x] = top[a], top[b]
+            weight[x] = power
+            union_find.union(a, b)
+            top[union_find.find(a)] = x
+
+        # les fils ont toujours un indice plus petit que leur père : un parcours par indices croissants traite les
+        # fils avant le père, un parcours par indices décroissants traite le père avant ses fils
+        size = array("q", [1]) * n + array("q", [0]) * len(edges)
+        for x in range(total):
+            if parent[x] != -1:
+                size[parent[x]] += size[x]
+        start = array("q", [0]) * total
+        depth = array("q", [0]) * total
+        root = array("q", [0]) * total
+        order = array("q", [0]) * n
+        debut = 0
+        for x in range(total - 1, -1, -1):
+            if parent[x] == -1:
+                start[x] = debut
+                debut += size[x]
+                root[x] = x
+            else:
+                depth[x] = depth[parent[x]] + 1
+                root[x] = root[parent[x]]
+            if x >= n:
+                start[left[x]] = start[x]
+                start[right[x]] = start[x] + size[left[x]]
+            else:
+                order[start[x]] = x
+
+        self.parent, self.weight = parent, weight
+        self.start, self.size, self.order = start, size, order
+        self.depth, self.root = depth, root
+        self.up = [array("q", (p if p != -1 else x for x, p in enumerate(parent)))]
+        for _ in range(1, max(1, max(depth, default=0).bit_length())):
+            prev = self.up[-1]
+            self.up.append(array("q", (prev[prev[x]] for x in range(total))))
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construit l'arbre de reconstruction d'un graphe (objet de la classe Graph).
+        """
+        labels, node1, node2, power, _ = graph.edge_columns()
+        garde = kruskal_edges(len(labels), node1, node2, power, graph.nb_components())
+        return cls(labels, ((node1[e], node2[e], power[e]) for e in garde))
+
+    def _climb(self, x, power):
+        """
+        but: renvoyer le plus haut ancêtre de x de poids <= power (x lui-même si aucun).
+        """
+        up, weight = self.up, self.weight
+        for k in range(len(up) - 1, -1, -1):
+            y = up[k][x]
+            if weight[y] <= power:
+                x = y
+        return x
+
+    def _lca(self, a, b):
+        """
+        but: renvoyer le plus proche ancêtre commun de a et b, qui doivent avoir la même racine.
+        """
+        up, depth = self.up, self.depth
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                a = up[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][a] != up[k][b]:
+                a, b = up[k][a], up[k][b]
+        return up[0][a]
+
+    def component_size(self, src, power):
+        """
+        Renvoie le nombre de noeuds qu'un camion de puissance power peut atteindre depuis src (src compris).
+        Complexité : O(log n).
+        """
+        return self.size[self._climb(self.index[src], power)]
+
+    def reachable(self, src, power):
+        """
+        Renvoie la liste des noeuds qu'un camion de puissance power peut atteindre depuis src (src compris).
+        Complexité : O(log n + nombre de noeuds renvoyés).
+        """
+        x = self._climb(self.index[src], power)
+        labels, order = self.labels, self.order
+        return [labels[order[i]] for i in range(self.start[x], self.start[x] + self.size[x])]
+
+    def same_component(self, src, dest, power):
+        """
+        Renvoie True si un camion de puissance power peut aller de src à dest. Complexité : O(log n).
+        """
+        return self._climb(self.index[src], power) == self._climb(self.index[dest], power)
+
+    def min_power(self, src, dest):
+        """
+        Renvoie la puissance minimale pour aller de src à dest (le poids de leur plus proche ancêtre commun),
+        ou None s'il n'existe aucun chemin.
+        """
+        return self.min_power_set([src, dest])
+
+    def min_power_set(self, nodes):
+        """
+        Renvoie la puissance minimale d'un camion capable de circuler entre tous les noeuds de nodes (le poids de
+        leur plus proche ancêtre commun), ou None s'ils ne sont pas tous dans la même composante connexe.
+        """
+        ancetre = None
+        for node in nodes:
+            x = self.index[node]
+            if ancetre is None:
+                ancetre = x
+            elif self.root[x] != self.root[ancetre]:
+                return None
+            else:
+                ancetre = self._lca(ancetre, x)
+        return self.weight[ancetre] if ancetre is not None else None
@@ -0,0 +1,87 @@
+"""
+Lecture et écriture des fichiers de trajets en flux, en mémoire bornée.
+
+iter_route_chunks lit un fichier routes.x.in par paquets de lignes et ne garde jamais plus d'un paquet en mémoire ;
+RoutesWriter écrit les réponses (une par ligne, format routes.x.out) au fur et à mesure qu'elles sont calculées.
+Un fichier de plusieurs dizaines de millions de trajets peut ainsi être traité en mémoire constante.
+"""
+
+from itertools import islice
+
+CHUNK_SIZE = 65536
+
+
+def iter_route_chunks(filename, chunk_size=CHUNK_SIZE):
+    """
+    Renvoie un générateur de paquets (listes d'au plus chunk_size trajets (src, dest, utility)) lus dans filename.
+    """
+    with open(filename, "rb") as file:
+        restants = int(file.readline())
+        while restants > 0:
+            lignes = list(islice(file, min(chunk_size, restants)))
+            if not lignes:
+                raise Exception("Format incorrect")
+            restants -= len(lignes)
+            paquet = []
+            for ligne in lignes:
+                src, dest, utility = ligne.split()
+                paquet.append((int(src), int(dest), int(utility)))
+            yield paquet
+
+
+def iter_routes(filename, chunk_size=CHUNK_SIZE):
+    """
+    Renvoie un générateur sur les trajets (src, dest, utility) du fichier filename, lus par paquets.
+    """
+    for paquet in iter_route_chunks(filename, chunk_size):
+        yield from paquet
+
+
+def read_routes_arrays(filename):
+    """
+    Lit tout le fichier routes.x.in dans trois tableaux numpy (src, dest, utility), par exemple pour
+    MinPowerTree.min_power_array. Nécessite numpy.
+    """
+    import numpy as np
+    with open(filename, "rb") as file:
+        nb = int(file.readline())
+        valeurs = np.array(file.read().split(), dtype=np.int64)
+    if len(valeurs) != 3 * nb:
+        raise Exception("Format incorrect")
+    trajets = valeurs.reshape(nb, 3)
+    return trajets[:, 0].copy(), trajets[:, 1].copy(), trajets[:, 2].copy()
+
+
+class RoutesWriter:
+    """
+    Écrit un fichier routes.x.out ligne par ligne. S'utilise avec with :
+
+        with RoutesWriter("routes.1.out") as writer:
+            writer.write(power)
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = open(filename, "w")
+        self.count = 0
+
+    def write(self, power):
+        """Écrit la réponse du trajet suivant."""
+        self.file.write(f"{power}\n")
+        self.count += 1
+
+    def write_many(self, powers):
+        """Écrit les réponses de plusieurs trajets consécutifs, puis vide le tampon sur le disque."""
+        lignes = [f"{power}\n" for power in powers]
+        self.file.writelines(lignes)
+        self.count += len(lignes)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
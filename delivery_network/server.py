@@ -0,0 +1,269 @@
+"""
+Service local de requêtes : les réseaux sont chargés une seule fois (par le cache sur disque, voir cache.py) puis
+gardés en mémoire, et chaque question ne coûte plus qu'une requête O(log n) sur l'arbre couvrant minimal au lieu
+d'une lecture du fichier et d'un prétraitement complet.
+
+Protocole : une requête JSON par ligne, une réponse JSON par ligne, dans le même ordre. Un client peut envoyer
+plusieurs requêtes sans attendre les réponses (pipelining). Requêtes :
+    {"id": 1, "op": "min_power", "network": "network.1", "src": 1, "dest": 2, "path": false}
+    {"id": 2, "op": "get_path_with_power", "network": "network.1", "src": 1, "dest": 2, "power": 30}
+    {"id": 3, "op": "min_power_batch", "network": "network.1", "pairs": [[1, 2], [3, 4]]}
+    {"id": 4, "op": "networks"}
+Réponses : {"id": 1, "result": ...} ou {"id": 1, "error": "..."}.
+
+Lancement (depuis la racine du dépôt) :
+    python -m delivery_network.server input/network.1.in input/network.2.in --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+from .cache import load_network
+
+PORT = 8765
+LINE_LIMIT = 1 << 26 #taille maximale d'une requête (64 Mio), la limite par défaut d'asyncio (64 Kio) est trop faible pour min_power_batch
+
+
+def network_name(filename):
+    """
+    but: nom sous lequel le réseau filename est servi (network.1 pour input/network.1.in).
+    """
+    nom = os.path.basename(filename)
+    return nom[:-3] if nom.endswith(".in") else nom
+
+
+async def _skip_line(reader):
+    """
+    but: jeter la suite de la ligne en cours (trop longue pour le tampon), retour à la ligne compris, pour que la
+    requête suivante soit lue depuis son début.
+    """
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as erreur: #rien n'a été consommé : on jette ce qui est déjà dans le tampon
+            await reader.readexactly(erreur.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+class QueryServer:
+    """
+    Serveur asyncio qui répond aux requêtes min_power sur des réseaux gardés en mémoire.
+
+    Attributes:
+    -----------
+    trees: dict
+        trees[nom] est la structure MinPowerTree du réseau nom.
+    """
+
+    def __init__(self, networks, cache_dir=None, line_limit=LINE_LIMIT):
+        """
+        Parameters:
+        -----------
+        networks: list or dict
+            Les fichiers network.x.in à servir, ou un dictionnaire nom -> fichier.
+        cache_dir: str, optional
+            Le dossier du cache (voir cache.cache_path).
+        line_limit: int, optional
+            La taille maximale d'une requête en octets ; une requête plus longue reçoit une erreur.
+        """
+        if not isinstance(networks, dict):
+            networks = {network_name(filename): filename for filename in networks}
+        self.trees = {nom: load_network(filename, cache_dir)[2] for nom, filename in networks.items()}
+        self.line_limit = line_limit
+        self._server = None
+
+    def handle(self, requete):
+        """
+        Répond à une requête (dictionnaire) : renvoie le dictionnaire de la réponse.
+        """
+        reponse = {"id": requete.get("id")}
+        try:
+            reponse["result"] = self._answer(requete)
+        except KeyError as erreur:
+            reponse["error"] = f"inconnu : {erreur.args[0]}"
+        except (TypeError, ValueError) as erreur:
+            reponse["error"] = str(erreur)
+        return reponse
+
+    def _answer(self, requete):
+        op = requete["op"]
+        if op == "networks":
+            return sorted(self.trees)
+        tree = self.trees[requete["network"]]
+        if op == "min_power":
+            power = tree.min_power(requete["src"], requete["dest"])
+            if not requete.get("path"):
+                return power
+            return [power, tree.get_path(requete["src"], requete["dest"]) if power is not None else None]
+        if op == "get_path_with_power":
+            # un chemin de puissance minimale convient dès que la puissance du camion est suffisante
+            power = tree.min_power(requete["src"], requete["dest"])
+            if power is None or power > requete["power"]:
+                return None
+            return tree.get_path(requete["src"], requete["dest"])
+        if op == "min_power_batch":
+            pairs = requete["pairs"]
+            if not isinstance(pairs, list) or not all(isinstance(pair, list) and len(pair) == 2 for pair in pairs):
+                raise ValueError("pairs doit être une liste de trajets [src, dest]")
+            return tree.min_power_many([pair[0] for pair in pairs], [pair[1] for pair in pairs])
+        raise ValueError(f"opération inconnue : {op}")
+
+    async def _client(self, reader, writer):
+        """
+        but: répondre aux requêtes d'une connexion, ligne par ligne et dans l'ordre. Les requêtes envoyées à la suite
+        par le client attendent dans le tampon de lecture : il n'y a pas d'aller-retour par requête.
+        """
+        try:
+            while True:
+                try:
+                    ligne = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as fin: #dernière ligne sans retour à la ligne, ou fin de connexion
+                    if not fin.partial:
+                        break
+                    ligne = fin.partial
+                except asyncio.LimitOverrunError:
+                    await _skip_line(reader)
+                    ligne = None
+                try:
+                    requete = json.loads(ligne) if ligne is not None else None
+                except json.JSONDecodeError:
+                    requete = None
+                if ligne is None:
+                    reponse = {"id": None, "error": "requête trop longue"}
+                elif not isinstance(requete, dict):
+                    reponse = {"id": None, "error": "requête invalide"}
+                else:
+                    try:
+                        reponse = self.handle(requete)
+                    except Exception as erreur: #une requête inattendue ne doit pas couper la connexion
+                        reponse = {"id": requete.get("id"), "error": f"erreur interne : {erreur!r}"}
+                writer.write(json.dumps(reponse).encode() + b"\n")
+                await writer.drain() #n'attend que si le client ne lit pas assez vite
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=PORT, path=None):
+        """
+        Démarre le serveur en TCP sur host:port (port 0 : un port libre est choisi), ou sur le socket Unix path.
+        Renvoie l'adresse effective (host, port) ou path.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._client, path, limit=self.line_limit)
+            return path
+        self._server = await asyncio.start_server(self._client, host, port, limit=self.line_limit)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """Répond aux requêtes jusqu'à l'arrêt du serveur."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Arrête le serveur."""
+        self._server.close()
+        await self._server.wait_closed()
+
+
+class Client:
+    """
+    Client (synchrone) du serveur de requêtes.
+
+    Exemple :
+        with Client(port=8765) as client:
+            client.min_power("network.1", 1, 2)
+            client.pipeline([{"op": "min_power", "network": "network.1", "src": s, "dest": d} for s, d in pairs])
+    """
+
+    def __init__(self, host="127.0.0.1", port=PORT, path=None, timeout=None):
+        if path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(path)
+        else:
+            self.socket = socket.create_connection((host, port), timeout)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self.socket.makefile("rb")
+        self._id = 0
+
+    def close(self):
+        self._file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def pipeline(self, requetes):
+        """
+        Envoie toutes les requêtes d'un coup puis lit les réponses. Renvoie la liste des résultats dans l'ordre des
+        requêtes ; lève RuntimeError si le serveur a renvoyé une erreur.
+        """
+        requetes = list(requetes)
+        lignes = []
+        for requete in requetes:
+            self._id += 1
+            lignes.append(json.dumps(dict(requete, id=self._id)).encode() + b"\n")
+        self.socket.sendall(b"".join(lignes))
+        reponses = [json.loads(self._file.readline()) for _ in requetes] #toutes, pour rester synchronisé
+        for reponse in reponses:
+            if "error" in reponse:
+                raise RuntimeError(reponse["error"])
+        return [reponse["result"] for reponse in reponses]
+
+    def call(self, op, **params):
+        """Envoie une requête et renvoie son résultat."""
+        return self.pipeline([dict(params, op=op)])[0]
+
+    def networks(self):
+        """Renvoie la liste des réseaux servis."""
+        return self.call("networks")
+
+    def min_power(self, network, src, dest, path=False):
+        """
+        Renvoie la puissance minimale du trajet src -> dest (None s'il est impossible), ou [puissance, chemin] si path
+        est True.
+        """
+        return self.call("min_power", network=network, src=src, dest=dest, path=path)
+
+    def get_path_with_power(self, network, src, dest, power):
+        """Renvoie un chemin admissible pour un camion de puissance power, ou None."""
+        return self.call("get_path_with_power", network=network, src=src, dest=dest, power=power)
+
+    def min_power_batch(self, network, pairs):
+        """Renvoie la liste des puissances minimales des trajets (src, dest) de pairs."""
+        return self.call("min_power_batch", network=network, pairs=[list(pair) for pair in pairs])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service local de requêtes min_power")
+    parser.add_argument("networks", nargs="+", help="fichiers network.x.in à charger")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--unix", default=None, help="socket Unix à utiliser à la place de TCP")
+    parser.add_argument("--cache-dir", default=None, help="dossier du cache des réseaux prétraités")
+    args = parser.parse_args(argv)
+
+    server = QueryServer(args.networks, args.cache_dir)
+
+    async def run():
+        adresse = await server.start(args.host, args.port, args.unix)
+        print(f"réseaux {', '.join(sorted(server.trees))} servis sur {adresse}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Forêt couvrante minimale maintenue au fil des modifications du graphe (routes fermées, limites de puissance modifiées),
+sans relancer Kruskal sur toutes les arêtes :
+    - ajout d'une arête (u, v, p) : si u et v ne sont pas encore reliés dans la forêt, l'arête y entre ; sinon elle
+      ferme un cycle avec le chemin de u à v dans la forêt, et elle remplace l'arête de puissance maximale de ce
+      chemin si elle est strictement moins puissante (propriété du cycle) ;
+    - suppression d'une arête de la forêt : la forêt se coupe en deux morceaux ; on parcourt les listes d'adjacence
+      du plus petit des deux et on reconnecte par l'arête de puissance minimale qui les relie, s'il y en a une
+      (propriété de la coupe).
+Chaque modification coûte O(n + degrés du plus petit morceau) au lieu de O(m log m) pour un nouveau Kruskal.
+La structure MinPowerTree du graphe suit la forêt : seules les lignes du sous-arbre qui change de place sont
+recalculées (MinPowerTree.update). L'arbre de reconstruction de Kruskal est, lui, reconstruit à partir de la forêt.
+"""
+
+from .graph import kruskal_edges
+
+
+class SpanningForest:
+    """
+    Forêt couvrante de poids minimal d'un graphe, modifiable arête par arête.
+
+    Attributes:
+    -----------
+    adjacency: dict
+        adjacency[noeud][voisin] est la puissance de l'arête de la forêt entre noeud et voisin.
+    last_change: tuple
+        (removed, added) : l'arête (node1, node2, power) sortie de la forêt et celle qui y est entrée lors de la
+        dernière modification (None s'il n'y en a pas), pour mettre à jour les structures de requêtes (voir
+        MinPowerTree.update).
+    """
+
+    def __init__(self, nodes, edges=()):
+        """
+        Parameters:
+        -----------
+        nodes: list
+            Les noeuds du graphe.
+        edges: iterable
+            Les arêtes d'une forêt couvrante minimale, sous la forme (node1, node2, power).
+        """
+        self.adjacency = {node: {} for node in nodes}
+        self.last_change = (None, None)
+        for node1, node2, power in edges:
+            self._link(node1, node2, power)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construit la forêt couvrante minimale d'un graphe (objet de la classe Graph) par l'algorithme de Kruskal.
+        """
+        labels, node1, node2, power, _ = graph.edge_columns()
+        garde = kruskal_edges(len(labels), node1, node2, power, graph.nb_components())
+        return cls(labels, ((labels[node1[e]], labels[node2[e]], power[e]) for e in garde))
+
+    def _link(self, node1, node2, power):
+        self.adjacency[node1][node2] = power
+        self.adjacency[node2][node1] = power
+
+    def _cut(self, node1, node2):
+        del self.adjacency[node1][node2]
+        del self.adjacency[node2][node1]
+
+    def edges(self):
+        """
+        Renvoie la liste des arêtes de la forêt (node1, node2, power), chacune une seule fois, par puissance croissante.
+        """
+        position = {node: i for i, node in enumerate(self.adjacency)}
+        edges = [(node, voisin, power) for node, voisins in self.adjacency.items()
+                 for voisin, power in voisins.items() if position[voisin] > position[node]]
+        edges.sort(key=lambda edge: edge[2])
+        return edges
+
+    def indexed_edges(self):
+        """
+        Renvoie (labels, edges) où labels est la liste des noeuds et edges la liste des arêtes de la forêt sous la
+        forme (i, j, power) sur les indices des noeuds, par puissance croissante (pour MinPowerTree et
+        ReconstructionTree).
+        """
+        labels = list(self.adjacency)
+        index = {node: i for i, node in enumerate(labels)}
+        return labels, [(index[node1], index[node2], power) for node1, node2, power in self.edges()]
+
+    def _path(self, src, dest):
+        """
+        but: renvoyer le chemin de src à dest dans la forêt (parcours en largeur), ou None s'ils ne sont pas reliés.
+        """
+        parent = {src: None}
+        file = [src]
+        for node in file:
+            if node == dest:
+                chemin = [dest]
+                while parent[chemin[-1]] is not None:
+                    chemin.append(parent[chemin[-1]])
+                return chemin[::-1]
+            for voisin in self.adjacency[node]:
+                if voisin not in parent:
+                    parent[voisin] = node
+                    file.append(voisin)
+        return None
+
+    def _tree_nodes(self, src):
+        """
+        but: renvoyer l'ensemble des noeuds de l'arbre de la forêt qui contient src.
+        """
+        vus = {src}
+        file = [src]
+        for node in file:
+            for voisin in self.adjacency[node]:
+                if voisin not in vus:
+                    vus.add(voisin)
+                    file.append(voisin)
+        return vus
+
+    def insert(self, node1, node2, power):
+        """
+        Met à jour la forêt après l'ajout de l'arête (node1, node2, power) au graphe.
+        Renvoie (changed, merged) : changed vaut True si la forêt a changé, merged si deux composantes connexes ont
+        été réunies.
+        """
+        self.last_change = (None, None)
+        for node in (node1, node2):
+            if node not in self.adjacency:
+                self.adjacency[node] = {}
+        if node1 == node2:
+            return False, False
+        chemin = self._path(node1, node2)
+        if chemin is None:
+            self._link(node1, node2, power)
+            self.last_change = (None, (node1, node2, power))
+            return True, True
+        # arête la plus puissante du cycle formé avec la nouvelle arête
+        a, b = max(zip(chemin, chemin[1:]), key=lambda edge: self.adjacency[edge[0]][edge[1]])
+        if power >= self.adjacency[a][b]:
+            return False, False
+        self.last_change = ((a, b, self.adjacency[a][b]), (node1, node2, power))
+        self._cut(a, b)
+        self._link(node1, node2, power)
+        return True, False
+
+    def delete(self, graph, node1, node2, power):
+        """
+        Met à jour la forêt après la suppression de l'arête (node1, node2, power) du graphe graph (qui ne doit plus
+        contenir cette arête). Renvoie (changed, split) : changed vaut True si la forêt a changé, split si une
+        composante connexe a été coupée en deux.
+        """
+        self.last_change = (None, None)
+        if node1 == node2 or self.adjacency[node1].get(node2) != power:
+            return False, False #l'arête supprimée n'était pas dans la forêt
+        for voisin, power_min, _ in graph.graph[node1]:
+            if voisin == node2 and power_min == power:
+                return False, False #une arête parallèle de même puissance reste dans le graphe
+        self._cut(node1, node2)
+        cote1, cote2 = self._tree_nodes(node1), self._tree_nodes(node2)
+        petit = cote1 if len(cote1) <= len(cote2) else cote2
+        # toute arête du graphe qui sort du petit morceau arrive dans l'autre (ils formaient une seule composante)
+        remplacement = None
+        for node in petit:
+            for voisin, power_min, _ in graph.graph[node]:
+                if voisin not in petit and (remplacement is None or power_min < remplacement[2]):
+                    remplacement = (node, voisin, power_min)
+        if remplacement is None:
+            self.last_change = ((node1, node2, power), None)
+            return True, True
+        self._link(*remplacement)
+        self.last_change = ((node1, node2, power), remplacement)
+        return True, False
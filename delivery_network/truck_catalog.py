@@ -0,0 +1,103 @@
+from array import array
+from bisect import bisect_left
+from .graph import trucks_from_file
+
+
+class TruckCatalog:
+    """
+    Catalogue des modèles de camions, réduit à sa frontière de Pareto.
+
+    Un camion est inutile s'il existe un autre camion au moins aussi puissant et pas plus cher. Une fois ces camions
+    retirés, les camions restants, triés par puissance croissante, ont aussi des coûts strictement croissants : le
+    camion le moins cher de puissance >= p est donc le premier de puissance >= p, que l'on trouve par dichotomie.
+
+    Attributes:
+    -----------
+    trucks: list
+        tous les camions du fichier, sous la forme (power, cost) ; l'identifiant d'un camion est sa position dans cette liste.
+    powers, costs, ids: array
+        la frontière de Pareto triée par puissance croissante (puissance, coût et identifiant de chaque camion gardé).
+    """
+
+    def __init__(self, trucks):
+        """
+        Parameters:
+        -----------
+        trucks: list
+            liste de camions (power, cost)
+        """
+        self.trucks = list(trucks)
+        # par puissance décroissante (à puissance égale, le moins cher d'abord), on ne garde un camion que s'il est
+        # strictement moins cher que tous les camions plus puissants déjà vus
+        ordre = sorted(range(len(self.trucks)), key=lambda i: (-self.trucks[i][0], self.trucks[i][1]))
+        gardes = []
+        moins_cher = None
+        for i in ordre:
+            cost = self.trucks[i][1]
+            if moins_cher is None or cost < moins_cher:
+                gardes.append(i)
+                moins_cher = cost
+        gardes.reverse()
+        self.ids = array("q", gardes)
+        self.powers = array("q", (self.trucks[i][0] for i in gardes))
+        self.costs = array("q", (self.trucks[i][1] for i in gardes))
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        Lit un fichier trucks.x.in.
+        """
+        return cls(trucks_from_file(filename))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def cheapest(self, power):
+        """
+        Renvoie l'identifiant du camion le moins cher de puissance >= power, ou None s'il n'y en a pas.
+        Complexité : O(log T).
+        """
+        k = bisect_left(self.powers, power)
+        return self.ids[k] if k < len(self.ids) else None
+
+    def cheapest_many(self, powers):
+        """
+        Version par lot de cheapest : renvoie la liste des identifiants des camions pour chaque puissance de powers
+        (None pour une puissance trop grande ou None). Les puissances sont triées une fois puis parcourues en même temps
+        que la frontière, en une seule passe.
+        """
+        resultat = [None] * len(powers)
+        ordre = sorted((i for i, p in enumerate(powers) if p is not None), key=powers.__getitem__)
+        k = 0
+        nb = len(self.ids)
+        for i in ordre:
+            while k < nb and self.powers[k] < powers[i]:
+                k += 1
+            if k == nb:
+                break
+            resultat[i] = self.ids[k]
+        return resultat
+
+    def cheapest_array(self, powers, connected=None):
+        """
+        Version vectorisée de cheapest_many (nécessite numpy), pour le résultat de MinPowerTree.min_power_array :
+        renvoie le tableau numpy des identifiants des camions, -1 quand aucun camion ne convient ou quand
+        connected[i] est False. Une seule recherche dichotomique vectorisée (numpy.searchsorted).
+        """
+        import numpy as np
+        powers = np.asarray(powers)
+        if len(self.ids) == 0:
+            return np.full(len(powers), -1, dtype=np.int64)
+        k = np.searchsorted(np.frombuffer(self.powers, dtype=np.int64), powers, side="left")
+        possible = k < len(self.ids)
+        if connected is not None:
+            possible &= np.asarray(connected, dtype=bool)
+        return np.where(possible, np.frombuffer(self.ids, dtype=np.int64)[np.minimum(k, len(self.ids) - 1)], -1)
+
+    def power(self, truck):
+        """Renvoie la puissance du camion d'identifiant truck."""
+        return self.trucks[truck][0]
+
+    def cost(self, truck):
+        """Renvoie le coût du camion d'identifiant truck."""
+        return self.trucks[truck][1]
@@ -0,0 +1,41 @@
+class UnionFind:
+    """
+    Implementation of the Union-Find data structure with path compression and union by rank.
+    Elements are the integers 0, ..., n-1.
+
+    Attributes:
+    -----------
+    parent: list
+        parent[x] is the parent of x in its tree (the representative of a set is its own parent).
+    rank: list
+        an upper bound of the height of the tree of each representative.
+    nb_sets: int
+        The number of disjoint sets.
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.nb_sets = n
+    
+    def find(self, x):
+        """Renvoie le représentant de l'ensemble de x (itératif, pas de limite de récursion)."""
+        parent = self.parent
+        racine = x
+        while parent[racine] != racine:
+            racine = parent[racine]
+        while parent[x] != racine: #compression de chemin : tout le chemin pointe maintenant sur la racine
+            parent[x], x = racine, parent[x]
+        return racine
+
+    def union(self, x, y):
+        """Fusionne les ensembles de x et y. Renvoie False s'ils étaient déjà dans le même ensemble."""
+        px, py = self.find(x), self.find(y)
+        if px == py:
+            return False
+        if self.rank[px] < self.rank[py]:
+            px, py = py, px
+        self.parent[py] = px
+        if self.rank[px] == self.rank[py]:
+            self.rank[px] += 1
+        self.nb_sets -= 1
+        return True
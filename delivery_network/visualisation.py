@@ -0,0 +1,41 @@
+"""
+Dessin d'un graphe avec graphviz (paquet python graphviz et logiciel graphviz, voir install_graphviz.sh).
+Le module s'appelait graphviz.py : il masquait alors le paquet graphviz lui-même et ouvrait une fenêtre dès son import.
+
+Exemple (depuis la racine du dépôt) :
+    python -m delivery_network.visualisation input/network.01.in
+"""
+
+from .graph import graph_from_file
+
+
+def draw_graph(g, filename=None, view=True):
+    """
+    Construit le dessin du graphe g (objet de la classe Graph) : un noeud par sommet, une arête étiquetée par sa
+    puissance et sa distance. Si filename n'est pas None, le dessin est enregistré (format png) ; si view est True,
+    il est ouvert dans le visualiseur du système. Renvoie l'objet graphviz.Graph.
+    """
+    import graphviz #dépendance optionnelle, importée seulement quand on dessine
+
+    # Créer un objet Graph (les arêtes ne sont pas orientées)
+    graph = graphviz.Graph()
+
+    # Ajouter les nœuds
+    for node in g.graph:
+        graph.node(str(node))
+
+    # Ajouter les arêtes, chacune une seule fois, avec une étiquette pour la puissance et la distance
+    for node, neighbor, power, distance in g.edges():
+        graph.edge(str(node), str(neighbor), label=f"Power: {power}, Distance: {distance}")
+
+    # Rendu du graphique
+    if filename is not None:
+        graph.render(filename, format="png", view=view)
+    elif view:
+        graph.view()
+    return graph
+
+
+if __name__ == "__main__":
+    import sys
+    draw_graph(graph_from_file(sys.argv[1] if len(sys.argv) > 1 else "input/network.01.in"))
@@ -1,9 +1,7 @@
 # This will work if ran from the root folder.
-import sys 
-sys.path.append("delivery_network/")
 
 import unittest 
-from graph import Graph, graph_from_file
+from delivery_network.graph import Graph, graph_from_file
 
 class Test_GraphLoading(unittest.TestCase):
     def test_network0(self):
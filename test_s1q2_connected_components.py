@@ -1,8 +1,6 @@
 # This will work if ran from the root folder.
-import sys 
-sys.path.append("delivery_network")
 
-from graph import Graph, graph_from_file
+from delivery_network.graph import Graph, graph_from_file
 
 import unittest   # The test framework
 
@@ -17,5 +15,22 @@ class Test_GraphCC(unittest.TestCase):
         cc = g.connected_components_set()
         self.assertEqual(cc, {frozenset({1, 2, 3}), frozenset({4, 5, 6, 7})})
 
+    def test_same_component(self):
+        g = graph_from_file("input/network.01.in")
+        self.assertTrue(g.same_component(1, 3))
+        self.assertFalse(g.same_component(1, 4))
+        self.assertEqual(g.nb_components(), 2)
+        g.add_edge(3, 4, 1)
+        self.assertTrue(g.same_component(1, 4))
+        self.assertEqual(g.nb_components(), 1)
+
+    def test_long_path(self):
+        n = 50000 # bien plus que la limite de récursivité
+        g = Graph(list(range(n)))
+        for i in range(n - 1):
+            g.add_edge(i, i + 1, 1)
+        self.assertEqual(len(g.connected_components()), 1)
+        self.assertTrue(g.same_component(0, n - 1))
+
 if __name__ == '__main__':
     unittest.main()
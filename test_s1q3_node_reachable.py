@@ -1,8 +1,6 @@
 # This will work if ran from the root folder.
-import sys 
-sys.path.append("delivery_network")
 
-from graph import Graph, graph_from_file
+from delivery_network.graph import Graph, graph_from_file
 
 import unittest   # The test framework
 
@@ -17,6 +15,12 @@ class Test_Reachability(unittest.TestCase):
         self.assertIn(g.get_path_with_power(1, 2, 11), [[1, 2], [1, 4, 3, 2]])
         self.assertEqual(g.get_path_with_power(1, 2, 5), [1, 4, 3, 2])
 
+    def test_reachability_only(self):
+        g = graph_from_file("input/network.02.in")
+        self.assertTrue(g.get_path_with_power(1, 2, 5, return_path=False))
+        self.assertFalse(g.get_path_with_power(1, 2, 3, return_path=False))
+        self.assertEqual(g.get_path_with_power(1, 1, 0), [1])
+
 if __name__ == '__main__':
     unittest.main()
 
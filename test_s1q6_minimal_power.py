@@ -1,8 +1,6 @@
 # This will work if ran from the root folder.
-import sys 
-sys.path.append("delivery_network")
 
-from graph import graph_from_file
+from delivery_network.graph import graph_from_file
 import unittest   # The test framework
 
 class Test_MinimalPower(unittest.TestCase):
@@ -15,5 +13,38 @@ class Test_MinimalPower(unittest.TestCase):
         g = graph_from_file("input/network.04.in")
         self.assertEqual(g.min_power(1, 4)[1], 4)
 
+    def test_network1_exact(self):
+        g = graph_from_file("input/network.1.in")
+        for src in g.nodes:
+            for dest in g.nodes:
+                path, power = g.min_power(src, dest)
+                self.assertEqual(power, g.min_power_kruskal(src, dest)[0])
+                self.assertEqual((path[0], path[-1]), (src, dest))
+
+    def test_unreachable(self):
+        g = graph_from_file("input/network.01.in")
+        self.assertEqual(g.min_power(1, 4), (None, None))
+        self.assertEqual(g.min_power(1, 3)[1], 1)
+
+    def test_dijkstra(self):
+        g = graph_from_file("input/network.00.in")
+        self.assertEqual(g.min_power_dijkstra(1, 4)[0], 11)
+        self.assertEqual(g.min_power_dijkstra(2, 4), (10, [2, 3, 4]))
+        self.assertEqual(g.min_power_dijkstra(3, 3), (0, [3]))
+        self.assertEqual(graph_from_file("input/network.01.in").min_power_dijkstra(1, 4), (None, None))
+
+    def test_dijkstra_network1(self):
+        g = graph_from_file("input/network.1.in")
+        for src in g.nodes:
+            depuis = g.min_power_from(src)
+            for dest in g.nodes:
+                power, path = g.min_power_dijkstra(src, dest)
+                self.assertEqual(power, g.min_power_kruskal(src, dest)[0])
+                self.assertEqual(depuis[dest], power)
+                self.assertEqual((path[0], path[-1]), (src, dest))
+                self.assertIsNotNone(g.get_path_with_power(src, dest, power))
+                self.assertEqual(max((min(p for v, p, _ in g.graph[a] if v == b) for a, b in zip(path, path[1:])),
+                                     default=0), power)
+
 if __name__ == '__main__':
     unittest.main()
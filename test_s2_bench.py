@@ -0,0 +1,29 @@
+# This will work if ran from the root folder.
+
+import json
+import os
+import tempfile
+from delivery_network.bench import main, percentiles
+import unittest   # The test framework
+
+class Test_Bench(unittest.TestCase):
+    def test_percentiles(self):
+        stats = percentiles([float(i) for i in range(1, 101)])
+        self.assertEqual((stats["p50"], stats["p95"], stats["p99"]), (51.0, 96.0, 100.0))
+        self.assertEqual(percentiles([])["p50"], None)
+
+    def test_network1(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "bench.json")
+            main(["--networks", "1", "--output", sortie, "--label", "test"])
+            with open(sortie) as file:
+                resultats = json.load(file)
+        self.assertEqual(resultats["label"], "test")
+        run, = resultats["runs"]
+        self.assertEqual(set(run["stages"]), {"load", "mst", "preprocessing", "load_routes"})
+        self.assertEqual(run["strategies"]["tree"]["queries"], 140)
+        self.assertEqual(run["strategies"]["min_power"]["queries"], 20)
+        self.assertIn("process_max_rss_kb", run)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# This will work if ran from the root folder.
+
+import os
+import shutil
+import tempfile
+from delivery_network.graph import graph_from_file
+from delivery_network.cache import load_network, cache_path, create_arrays, read_arrays
+import unittest   # The test framework
+
+class Test_Cache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.network = os.path.join(self.dir, "network.1.in")
+        shutil.copy("input/network.1.in", self.network)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_reload(self):
+        graph, mst, tree = load_network(self.network)
+        self.assertTrue(os.path.exists(cache_path(self.network)))
+        graph2, mst2, tree2 = load_network(self.network)
+        self.assertIsInstance(tree2.parent, memoryview)
+        self.assertEqual(list(mst2), list(mst))
+        self.assertEqual(graph2.nb_edges, 100)
+        g = graph_from_file(self.network)
+        for src in g.nodes:
+            for dest in g.nodes:
+                self.assertEqual(tree2.min_power(src, dest), tree.min_power(src, dest))
+                self.assertEqual(tree2.get_path(src, dest), tree.get_path(src, dest))
+        self.assertEqual(graph2.get_path_with_power(1, 2, 100), graph.get_path_with_power(1, 2, 100))
+
+    def test_invalidation(self):
+        tree = load_network(self.network)[2]
+        self.assertEqual(tree.min_power(1, 2), 2)
+        with open(self.network) as file:
+            lines = file.readlines()
+        lines[1] = "1 2 1000 6312\n"
+        with open(self.network, "w") as file:
+            file.writelines(lines)
+        tree = load_network(self.network)[2]
+        self.assertEqual(tree.min_power(1, 2), graph_from_file(self.network).min_power_kruskal(1, 2)[0])
+        self.assertNotEqual(tree.min_power(1, 2), 2)
+
+    def test_create_arrays(self):
+        path = os.path.join(self.dir, "tables.bin")
+        with create_arrays(path, {"nom": "test"}, {"a": ("q", 5), "b": ("d", 3)}) as arrays:
+            self.assertFalse(os.path.exists(path)) #le fichier n'est mis à sa place qu'à la fin
+            arrays["a"][:] = memoryview(bytes(range(40))).cast("q")
+            for i in range(3):
+                arrays["b"][i] = i / 2
+        meta, arrays = read_arrays(path)
+        self.assertEqual(meta, {"nom": "test"})
+        self.assertEqual(arrays["a"].tobytes(), bytes(range(40)))
+        self.assertEqual(list(arrays["b"]), [0, 0.5, 1])
+        with self.assertRaises(ValueError):
+            with create_arrays(os.path.join(self.dir, "erreur.bin"), {}, {"a": ("q", 1)}):
+                raise ValueError
+        self.assertEqual(sorted(os.listdir(self.dir)), ["network.1.in", "tables.bin"])
+
+if __name__ == '__main__':
+    unittest.main()
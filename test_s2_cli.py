@@ -0,0 +1,43 @@
+# This will work if ran from the root folder.
+
+import os
+import subprocess
+import sys
+import tempfile
+from delivery_network.cli import main
+import unittest   # The test framework
+
+class Test_Cli(unittest.TestCase):
+    def test_lazy_import(self):
+        # importer Graph ne doit charger ni les modules de calcul ni les scripts
+        code = ("import sys; from delivery_network import Graph; "
+                "print(sorted(m for m in sys.modules if m.startswith('delivery_network')))")
+        sortie = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(eval(sortie), ["delivery_network", "delivery_network.graph",
+                                        "delivery_network.instrumentation"])
+
+    def test_mst(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "mst.in")
+            main(["mst", "input/network.1.in", "-o", sortie])
+            with open(sortie) as file:
+                lignes = file.readlines()
+        self.assertEqual(lignes[0], "20 19\n")
+        self.assertEqual(len(lignes), 20)
+
+    def test_minpower(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "routes.out")
+            stats = os.path.join(dossier, "stats.json")
+            main(["--stats", stats, "minpower", "input/network.1.in", "input/routes.1.in", "-o", sortie, "--no-cache"])
+            with open(sortie) as file:
+                self.assertEqual(len(file.readlines()), 140)
+            self.assertTrue(os.path.exists(stats))
+
+    def test_module(self):
+        sortie = subprocess.run([sys.executable, "-m", "delivery_network", "minpower", "input/network.04.in",
+                                 "--src", "1", "--dest", "4", "--no-cache"], capture_output=True, text=True, check=True)
+        self.assertEqual(sortie.stdout, "puissance 4, chemin [1, 2, 3, 4]\n")
+
+if __name__ == '__main__':
+    unittest.main()
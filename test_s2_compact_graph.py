@@ -0,0 +1,42 @@
+# This will work if ran from the root folder.
+
+from delivery_network.graph import graph_from_file
+from delivery_network.compact_graph import CompactGraph
+import unittest   # The test framework
+
+class Test_CompactGraph(unittest.TestCase):
+    def test_loading(self):
+        c = graph_from_file("input/network.04.in", compact=True)
+        self.assertEqual((c.nb_nodes, c.nb_edges), (10, 4))
+        self.assertEqual(c.to_graph().graph, graph_from_file("input/network.04.in").graph)
+
+    def test_components(self):
+        c = graph_from_file("input/network.01.in", compact=True)
+        self.assertEqual(c.connected_components_set(), {frozenset({1, 2, 3}), frozenset({4, 5, 6, 7})})
+
+    def test_path_and_min_power(self):
+        c = graph_from_file("input/network.02.in", compact=True)
+        self.assertEqual(c.get_path_with_power(1, 2, 5), [1, 4, 3, 2])
+        self.assertEqual(c.get_path_with_power(1, 2, 3), None)
+        c = graph_from_file("input/network.00.in", compact=True)
+        self.assertEqual(c.min_power(1, 4)[1], 11)
+        self.assertEqual(c.min_power(2, 4), ([2, 3, 4], 10))
+
+    def test_from_graph(self):
+        g = graph_from_file("input/network.1.in")
+        c = CompactGraph.from_graph(g)
+        self.assertEqual(c.nb_edges, g.nb_edges)
+        tree = c.min_power_tree()
+        for src in g.nodes:
+            for dest in g.nodes:
+                self.assertEqual(tree.min_power(src, dest), g.min_power_kruskal(src, dest)[0])
+                self.assertEqual(c.min_power(src, dest)[1], tree.min_power(src, dest))
+
+    def test_kruskal(self):
+        c = graph_from_file("input/network.00.in", compact=True)
+        mst = c.kruskal()
+        self.assertEqual(mst.nb_edges, 9)
+        self.assertEqual(sorted(mst.edge_power), [0, 4, 4, 4, 10, 11, 12, 14, 14])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# This will work if ran from the root folder.
+
+import random
+from delivery_network.graph import Graph, graph_from_file, kruskal
+from delivery_network.min_power_tree import MinPowerTree
+import unittest   # The test framework
+
+class Test_DynamicEdges(unittest.TestCase):
+    def _copie(self, g):
+        # graphe reconstruit de zéro, qui sert de référence
+        copie = Graph(list(g.graph))
+        for node1, node2, power, dist in g.edges():
+            copie.add_edge(node1, node2, power, dist)
+        return copie
+
+    def _poids(self, g):
+        return sum(power for _, _, power, _ in kruskal(g).edges())
+
+    def test_remove_edge(self):
+        g = graph_from_file("input/network.04.in")
+        self.assertEqual(g.min_power(1, 4), ([1, 2, 3, 4], 4))
+        self.assertEqual(g.remove_edge(3, 4), (4, 2))
+        self.assertEqual(g.nb_edges, 3)
+        self.assertEqual(g.min_power(1, 4), ([1, 4], 11))
+        self.assertEqual(g.min_power_tree().min_power(1, 4), 11)
+        g.remove_edge(1, 4, 11)
+        self.assertEqual(g.min_power(1, 4), (None, None))
+        self.assertFalse(g.same_component(1, 4))
+        self.assertRaises(ValueError, g.remove_edge, 1, 4)
+        self.assertRaises(ValueError, g.remove_edge, 1, 2, 5)
+
+    def test_change_edge_power(self):
+        g = graph_from_file("input/network.04.in")
+        tree = g.min_power_tree()
+        g.change_edge_power(1, 4, 11, 2)
+        self.assertEqual(g.min_power_tree().min_power(1, 4), 2)
+        self.assertEqual(g.min_power_tree().min_power(2, 4), 4)
+        self.assertEqual(g.graph[1][-1], (4, 2, 6))
+        self.assertIs(g.min_power_tree(), tree) #mise à jour en place
+
+    def test_unchanged_forest_keeps_tree(self):
+        g = graph_from_file("input/network.04.in")
+        tree = g.min_power_tree()
+        g.add_edge(1, 3, 50) #ne rentre pas dans la forêt couvrante minimale
+        self.assertIs(g.min_power_tree(), tree)
+        g.remove_edge(1, 3)
+        self.assertIs(g.min_power_tree(), tree)
+        g.add_edge(1, 3, 1)
+        self.assertIs(g.min_power_tree(), tree)
+        self.assertEqual(g.min_power_tree().min_power(1, 4), 4)
+        self.assertEqual(g.min_power_tree().min_power(1, 3), 1)
+
+    def test_new_node_self_loop(self):
+        g = Graph([1, 2])
+        g.add_edge(1, 2, 3)
+        self.assertEqual(g.min_power_kruskal(1, 2), (3, [1, 2]))
+        g.reconstruction_tree()
+        g.add_edge(5, 5, 1) #boucle sur un noeud qui n'existait pas : la forêt ne change pas
+        self.assertEqual(g.min_power_kruskal(5, 5), (0, [5]))
+        self.assertEqual(g.reconstruction_tree().reachable(5, 10), [5])
+        self.assertTrue(g.same_component(5, 5))
+        self.assertFalse(g.same_component(1, 5))
+
+    def test_partial_tree_update(self):
+        # la structure mise à jour sous-arbre par sous-arbre donne les mêmes réponses qu'une structure reconstruite
+        g = graph_from_file("input/network.1.in")
+        tree = g.min_power_tree()
+        tirage = random.Random(1)
+        noeuds = list(g.graph)
+        for etape in range(200):
+            aretes = list(g.edges())
+            if tirage.random() < 0.5 and aretes:
+                node1, node2, power, _ = tirage.choice(aretes)
+                g.remove_edge(node1, node2, power)
+            else:
+                g.add_edge(tirage.choice(noeuds), tirage.choice(noeuds), tirage.randint(1, 100))
+            reference = MinPowerTree(*g.spanning_forest().indexed_edges())
+            self.assertIs(g.min_power_tree(), tree)
+            for src in noeuds:
+                for dest in noeuds:
+                    self.assertEqual(tree.min_power(src, dest), reference.min_power(src, dest))
+            path = tree.get_path(noeuds[0], noeuds[-1])
+            if path is not None:
+                self.assertEqual(path, reference.get_path(noeuds[0], noeuds[-1]))
+
+    def test_random_updates(self):
+        g = graph_from_file("input/network.1.in")
+        g.spanning_forest()
+        tirage = random.Random(0)
+        for etape in range(300):
+            choix = tirage.random()
+            aretes = list(g.edges())
+            if choix < 0.4 and aretes:
+                node1, node2, power, _ = tirage.choice(aretes)
+                g.remove_edge(node1, node2, power)
+            elif choix < 0.7 and aretes:
+                node1, node2, power, _ = tirage.choice(aretes)
+                g.change_edge_power(node1, node2, power, tirage.randint(1, 100))
+            else:
+                g.add_edge(tirage.randint(1, 22), tirage.randint(1, 22), tirage.randint(1, 100), tirage.randint(1, 100))
+            reference = self._copie(g)
+            forest = g.spanning_forest()
+            self.assertEqual(sum(power for _, _, power in forest.edges()), self._poids(reference))
+            self.assertEqual(len(forest.edges()), g.nb_nodes - reference.nb_components())
+            if etape % 10 == 0:
+                tree, expected = g.min_power_tree(), reference.min_power_tree()
+                for src in g.graph:
+                    for dest in g.graph:
+                        self.assertEqual(tree.min_power(src, dest), expected.min_power(src, dest))
+                        self.assertEqual(g.same_component(src, dest), reference.same_component(src, dest))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# This will work if ran from the root folder.
+
+import json
+import os
+import tempfile
+from delivery_network import instrumentation
+from delivery_network.graph import graph_from_file
+from delivery_network.glouton import glouton
+import unittest   # The test framework
+
+class Test_Instrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        g = graph_from_file("input/network.1.in")
+        g.min_power(1, 2)
+        g.min_power_kruskal(1, 2)
+        self.assertEqual(instrumentation.summary(), {"stages": {}, "counters": {}})
+
+    def test_counters(self):
+        instrumentation.enable()
+        g = graph_from_file("input/network.1.in")
+        g.min_power(1, 2)
+        g.min_power(3, 7)
+        g.min_power_kruskal(1, 2)
+        g.shortest_path_with_power(1, 2, 10**9)
+        resume = instrumentation.summary()
+        self.assertEqual(resume["counters"]["min_power_calls"], 2)
+        self.assertEqual(resume["counters"]["min_power_kruskal_calls"], 1)
+        self.assertGreaterEqual(resume["counters"]["bfs_calls"], 2)
+        self.assertGreater(resume["counters"]["bfs_nodes_expanded"], 0)
+        self.assertEqual(resume["counters"]["union_find_unions"], 19) #network.1 est connexe, 20 noeuds
+        self.assertEqual(resume["counters"]["dijkstra_calls"], 1)
+        for etape in ["parse", "adjacency", "kruskal", "min_power_tree"]:
+            self.assertEqual(resume["stages"][etape]["calls"], 1)
+
+    def test_glouton_and_json(self):
+        instrumentation.enable()
+        glouton("input/network.1.in", "input/routes.1.in", "input/trucks.0.in")
+        with tempfile.TemporaryDirectory() as dossier:
+            filename = os.path.join(dossier, "stats.json")
+            instrumentation.write_summary(filename)
+            with open(filename) as file:
+                resume = json.load(file)
+        for etape in ["network", "inputs", "powers", "trucks", "allocation", "paths"]:
+            self.assertIn(f"glouton.{etape}", resume["stages"])
+        self.assertEqual(resume["counters"]["glouton_routes"], 140)
+
+    def test_profile(self):
+        resultat, texte = instrumentation.profile(sorted, [3, 1, 2])
+        self.assertEqual(resultat, [1, 2, 3])
+        self.assertIn("function calls", texte)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# This will work if ran from the root folder.
+
+import tempfile
+from delivery_network.graph import Graph, graph_from_file, routes_from_file
+from delivery_network.min_power_tree import MinPowerTree, _numpy
+from delivery_network.routes_io import read_routes_arrays
+from delivery_network.truck_catalog import TruckCatalog
+from delivery_network.cache import load_network
+import unittest   # The test framework
+
+np = _numpy()
+
+@unittest.skipIf(np is None, "numpy n'est pas installé")
+class Test_MinPowerArray(unittest.TestCase):
+    def _attendu(self, tree, srcs, dests):
+        return [tree.min_power(src, dest) for src, dest in zip(srcs, dests)]
+
+    def test_network1(self):
+        tree = MinPowerTree.from_graph(graph_from_file("input/network.1.in"))
+        srcs = [src for src in range(1, 21) for dest in range(1, 21)]
+        dests = [dest for src in range(1, 21) for dest in range(1, 21)]
+        powers, connected = tree.min_power_array(np.array(srcs), np.array(dests))
+        self.assertTrue(connected.all())
+        self.assertEqual(powers.tolist(), self._attendu(tree, srcs, dests))
+        self.assertEqual(tree.min_power_many(srcs, dests), self._attendu(tree, srcs, dests))
+
+    def test_forest_and_labels(self):
+        g = Graph(["a", "b", "c", "d", "e"])
+        g.add_edge("a", "b", 3)
+        g.add_edge("b", "c", 1)
+        g.add_edge("d", "e", 2.5)
+        tree = MinPowerTree.from_graph(g)
+        powers, connected = tree.min_power_array(["a", "c", "a", "e", "d"], ["c", "a", "d", "d", "d"])
+        self.assertEqual(connected.tolist(), [True, True, False, True, True])
+        self.assertEqual(powers[connected].tolist(), [3, 3, 2.5, 0])
+        self.assertRaises(KeyError, tree.min_power_array, ["a"], ["z"])
+
+    def test_routes_cache_and_trucks(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            tree = load_network("input/network.1.in", dossier)[2] #tables lues dans le cache (memoryview)
+            srcs, dests, utilities = read_routes_arrays("input/routes.1.in")
+            routes = routes_from_file("input/routes.1.in")
+            self.assertEqual(list(zip(srcs.tolist(), dests.tolist(), utilities.tolist())), routes)
+            powers, connected = tree.min_power_array(srcs, dests)
+            self.assertEqual(powers.tolist(), self._attendu(tree, srcs.tolist(), dests.tolist()))
+        self.assertRaises(KeyError, tree.min_power_array, [0], [1])
+        catalog = TruckCatalog.from_file("input/trucks.0.in")
+        self.assertEqual(catalog.cheapest_array(powers, connected).tolist(), catalog.cheapest_many(powers.tolist()))
+        self.assertEqual(catalog.cheapest_array([10**12]).tolist(), [-1])
+
+if __name__ == '__main__':
+    unittest.main()
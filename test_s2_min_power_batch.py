@@ -0,0 +1,18 @@
+# This will work if ran from the root folder.
+
+from delivery_network.graph import graph_from_file
+import unittest   # The test framework
+
+class Test_MinPowerBatch(unittest.TestCase):
+    def test_network1(self):
+        g = graph_from_file("input/network.1.in")
+        pairs = [(src, dest) for src in g.nodes for dest in g.nodes]
+        expected = [g.min_power_kruskal(src, dest)[0] for src, dest in pairs]
+        self.assertEqual(g.min_power_batch(pairs), expected)
+
+    def test_disconnected(self):
+        g = graph_from_file("input/network.01.in")
+        self.assertEqual(g.min_power_batch([(1, 3), (1, 4), (5, 7), (2, 2)]), [1, None, 1, 0])
+
+if __name__ == '__main__':
+    unittest.main()
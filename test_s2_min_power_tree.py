@@ -0,0 +1,59 @@
+# This will work if ran from the root folder.
+
+from delivery_network.graph import graph_from_file, kruskal
+from delivery_network.min_power_tree import MinPowerTree
+import unittest   # The test framework
+
+class Test_MinPowerTree(unittest.TestCase):
+    def test_network00(self):
+        g = graph_from_file("input/network.00.in")
+        tree = MinPowerTree.from_graph(g)
+        self.assertEqual(tree.min_power(1, 4), 11)
+        self.assertEqual(tree.min_power(2, 4), 10)
+        self.assertEqual(tree.min_power(3, 3), 0)
+        self.assertEqual(tree.get_path(2, 4), [2, 3, 4])
+        self.assertEqual(tree.get_path(6, 3), [6, 1, 2, 3])
+
+    def test_routes1(self):
+        g = graph_from_file("input/network.1.in")
+        with open("input/routes.1.in") as file:
+            trajets = [tuple(map(int, line.split()[:2])) for line in file.readlines()[1:]]
+        for src, dest in trajets:
+            power, path = g.min_power_kruskal(src, dest)
+            self.assertEqual(path[0], src)
+            self.assertEqual(path[-1], dest)
+            self.assertIsNotNone(g.get_path_with_power(src, dest, power))
+            if src != dest:
+                self.assertEqual(g.get_path_with_power(src, dest, power - 1), None)
+
+    def test_from_mst(self):
+        # la structure du graphe peut être construite à partir d'un arbre couvrant minimal déjà calculé
+        g = graph_from_file("input/network.01.in")
+        tree = g.min_power_tree(kruskal(g))
+        self.assertIs(g.min_power_tree(), tree)
+        self.assertEqual(g.min_power_kruskal(1, 2), (tree.min_power(1, 2), tree.get_path(1, 2)))
+        self.assertEqual(tree.min_power(1, 4), None)
+
+    def test_range_index(self):
+        # noeuds 1..n : l'indice se calcule sans dictionnaire, pour tout entier (numpy compris) et seulement un entier
+        class Entier: #se comporte comme numpy.int64
+            def __init__(self, valeur):
+                self.valeur = valeur
+
+            def __index__(self):
+                return self.valeur
+
+        tree = MinPowerTree(range(1, 11), [(0, 1, 5), (1, 2, 7)])
+        self.assertEqual(tree.index[Entier(3)], 2)
+        self.assertEqual(tree.min_power(Entier(1), Entier(3)), 7)
+        for node in [3.0, "3", None, 0, 11, -1]:
+            self.assertRaises(KeyError, tree.min_power, node, 1)
+        self.assertIn(Entier(10), tree.index)
+        self.assertNotIn(3.0, tree.index)
+
+    def test_disconnected(self):
+        g = graph_from_file("input/network.01.in")
+        self.assertEqual(g.min_power_kruskal(1, 4), (None, None))
+
+if __name__ == '__main__':
+    unittest.main()
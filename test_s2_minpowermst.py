@@ -1,8 +1,6 @@
-import sys 
-sys.path.append("delivery_network")
 
 import unittest
-from graph import Graph, graph_from_file
+from delivery_network.graph import Graph, graph_from_file
 
 
 class TestMinPowerKruskal(unittest.TestCase):
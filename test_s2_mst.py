@@ -1,9 +1,7 @@
 # This will work if ran from the root folder.
-import sys 
-sys.path.append("delivery_network")
 
-from graph import graph_from_file
-from kruskal import kruskal
+from delivery_network.graph import graph_from_file
+from delivery_network.kruskal import kruskal
 import unittest   # The test framework
 
 class Test_MST(unittest.TestCase):
@@ -32,5 +30,17 @@ class Test_MST(unittest.TestCase):
                         }
         self.assertEqual(g_mst.graph, mst_expected)
 
+    def test_network01_forest(self):
+        g = graph_from_file("input/network.01.in")
+        g_mst = kruskal(g)
+        self.assertEqual(g_mst.nb_edges, 5)
+        self.assertEqual(g_mst.connected_components_set(), g.connected_components_set())
+
+    def test_network1(self):
+        g = graph_from_file("input/network.1.in")
+        g_mst = kruskal(g)
+        self.assertEqual(g_mst.nb_edges, g.nb_nodes - 1)
+        self.assertEqual(g_mst.connected_components_set(), g.connected_components_set())
+
 if __name__ == '__main__':
     unittest.main()
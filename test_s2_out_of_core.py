@@ -0,0 +1,67 @@
+# This will work if ran from the root folder.
+
+import os
+import tempfile
+from delivery_network.graph import graph_from_file, read_network, kruskal_edges
+from delivery_network.min_power_tree import MinPowerTree
+from delivery_network.out_of_core import external_kruskal, load_forest, read_forest, save_forest
+from delivery_network.batch import min_power_file
+import unittest   # The test framework
+
+class Test_OutOfCore(unittest.TestCase):
+    def test_same_forest_as_kruskal(self):
+        for filename in ["input/network.00.in", "input/network.01.in", "input/network.04.in", "input/network.1.in"]:
+            n, m, node1, node2, power, _ = read_network(filename)
+            garde = kruskal_edges(n + 1, node1, node2, power)
+            for run_size in [1, 5, 1000]:
+                resultat = external_kruskal(filename, run_size)
+                self.assertEqual(resultat[:2], (n, m))
+                self.assertEqual(list(zip(*resultat[2:])), [(node1[e], node2[e], power[e]) for e in garde])
+
+    def test_load_forest(self):
+        g = graph_from_file("input/network.1.in")
+        attendu = MinPowerTree.from_graph(g)
+        with tempfile.TemporaryDirectory() as dossier:
+            forest, tree = load_forest("input/network.1.in", dossier, run_size=7)
+            self.assertEqual(len(forest["power"]), 19)
+            self.assertIsInstance(tree.parent, memoryview) #les tables sont projetées en mémoire
+            for src in range(1, 21):
+                for dest in range(1, 21):
+                    self.assertEqual(tree.min_power(src, dest), attendu.min_power(src, dest))
+            self.assertEqual(len(os.listdir(dossier)), 1) #les runs temporaires ont été effacés
+            self.assertIs(type(load_forest("input/network.1.in", dossier)[1]), MinPowerTree) #relu sans calcul
+
+    def test_routes(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            attendu = os.path.join(dossier, "attendu.out")
+            sortie = os.path.join(dossier, "routes.out")
+            min_power_file("input/network.1.in", "input/routes.1.in", attendu)
+            min_power_file("input/network.1.in", "input/routes.1.in", sortie, out_of_core=True)
+            with open(attendu) as a, open(sortie) as b:
+                self.assertEqual(a.read(), b.read())
+
+    def test_same_tables_as_min_power_tree(self):
+        # les tables calculées dans le fichier sont celles que MinPowerTree calcule en mémoire
+        for filename in ["input/network.01.in", "input/network.1.in"]:
+            n, m, node1, node2, power = external_kruskal(filename)
+            attendu = MinPowerTree(range(1, n + 1), ((a - 1, b - 1, p) for a, b, p in zip(node1, node2, power)))
+            with tempfile.TemporaryDirectory() as dossier:
+                tree = save_forest(os.path.join(dossier, "forest.bin"), n, node1, node2, power)
+                self.assertEqual(len(tree.up), len(attendu.up))
+                for name, values in attendu.tables().items():
+                    if name != "levels":
+                        self.assertEqual(list(tree.tables()[name]), list(values))
+                del tree
+
+    def test_save_and_read(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            path = os.path.join(dossier, "forest.bin")
+            n, m, node1, node2, power = external_kruskal("input/network.01.in")
+            save_forest(path, n, node1, node2, power, {"nb_edges": m})
+            meta, forest, tree = read_forest(path)
+            self.assertEqual(meta["nb_edges"], m)
+            self.assertEqual(list(forest["node1"]), list(node1))
+            self.assertEqual(tree.min_power(1, 4), None)
+
+if __name__ == '__main__':
+    unittest.main()
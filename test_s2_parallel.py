@@ -0,0 +1,37 @@
+# This will work if ran from the root folder.
+
+import os
+import tempfile
+from delivery_network import parallel
+from delivery_network.cache import cache_path, load_network, read_network_cache
+from delivery_network.graph import graph_from_file, routes_from_file
+from delivery_network.parallel import min_power_parallel
+import unittest   # The test framework
+
+class Test_Parallel(unittest.TestCase):
+    def test_routes1(self):
+        g = graph_from_file("input/network.1.in")
+        pairs = [(src, dest) for src, dest, _ in routes_from_file("input/routes.1.in")]
+        with tempfile.TemporaryDirectory() as dossier:
+            powers = min_power_parallel("input/network.1.in", pairs, workers=2, shard_size=13, cache_dir=dossier)
+        self.assertEqual(powers, g.min_power_batch(pairs))
+
+    def test_stale_cache(self):
+        # un processus de calcul qui ne trouve pas le cache attendu le signale clairement
+        with tempfile.TemporaryDirectory() as dossier:
+            load_network("input/network.04.in", dossier)
+            path = cache_path("input/network.04.in", dossier)
+            empreinte = read_network_cache(path)[0]
+            for chemin, attendue, message in [(path, "0" * 40, "périmé"),
+                                              (os.path.join(dossier, "absent.bin"), empreinte, "absent")]:
+                parallel._init_worker(chemin, attendue)
+                with self.assertRaises(RuntimeError) as erreur:
+                    parallel._solve_shard(([1], [4]))
+                self.assertIn(message, str(erreur.exception))
+                self.assertIn(chemin, str(erreur.exception))
+            parallel._init_worker(path, empreinte)
+            self.assertEqual(parallel._solve_shard(([1], [4])), [4])
+            parallel._tree = None
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# This will work if ran from the root folder.
+
+from delivery_network.graph import graph_from_file
+from delivery_network.query_cache import QueryCache
+import unittest   # The test framework
+
+class Test_QueryCache(unittest.TestCase):
+    def test_mirrored_pairs(self):
+        g = graph_from_file("input/network.00.in")
+        g.enable_query_cache()
+        self.assertEqual(g.min_power(2, 4), ([2, 3, 4], 10))
+        self.assertEqual(g.min_power(4, 2), ([4, 3, 2], 10))
+        self.assertEqual(g.min_power(2, 4), ([2, 3, 4], 10))
+        self.assertEqual(g.min_power_kruskal(6, 3), (12, [6, 1, 2, 3]))
+        self.assertEqual(g.min_power_kruskal(3, 6), (12, [3, 2, 1, 6]))
+        self.assertEqual(g.query_cache_info(), {"hits": 3, "misses": 2, "size": 2, "maxsize": 100000})
+
+    def test_same_results(self):
+        g = graph_from_file("input/network.1.in")
+        reference = graph_from_file("input/network.1.in")
+        g.enable_query_cache(maxsize=50)
+        for _ in range(2):
+            for src in g.graph:
+                for dest in g.graph:
+                    self.assertEqual(g.min_power_kruskal(src, dest), reference.min_power_kruskal(src, dest))
+        self.assertEqual(g.query_cache_info()["size"], 50)
+
+    def test_invalidation(self):
+        g = graph_from_file("input/network.00.in")
+        g.enable_query_cache()
+        self.assertEqual(g.min_power(2, 4)[1], 10)
+        g.add_edge(2, 4, 1)
+        self.assertEqual(g.min_power(2, 4), ([2, 4], 1))
+        g.remove_edge(2, 4, 1)
+        self.assertEqual(g.min_power(4, 2), ([4, 3, 2], 10))
+        self.assertEqual(g.query_cache_info()["hits"], 0)
+
+    def test_lru(self):
+        cache = QueryCache(maxsize=2)
+        calcul = lambda src, dest: ([src, dest], src + dest)
+        cache.call("q", 1, 2, calcul)
+        cache.call("q", 3, 4, calcul)
+        cache.call("q", 2, 1, calcul) #1-2 devient le plus récent
+        cache.call("q", 5, 6, calcul) #3-4 est oublié
+        self.assertEqual(cache.call("q", 1, 2, calcul), ([1, 2], 3))
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        cache.call("q", 4, 3, calcul)
+        self.assertEqual(cache.misses, 4)
+        resultat = cache.call("q", 1, 2, calcul)
+        resultat[0].append(7) #modifier un résultat ne modifie pas le cache
+        self.assertEqual(cache.call("q", 1, 2, calcul), ([1, 2], 3))
+        self.assertRaises(ValueError, QueryCache, 0)
+
+if __name__ == '__main__':
+    unittest.main()
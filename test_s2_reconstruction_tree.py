@@ -0,0 +1,61 @@
+# This will work if ran from the root folder.
+
+from delivery_network.graph import Graph, graph_from_file
+from delivery_network.reconstruction_tree import ReconstructionTree
+import unittest   # The test framework
+
+class Test_ReconstructionTree(unittest.TestCase):
+    def _reachable(self, g, src, power):
+        # parcours en largeur de référence
+        vus = {src}
+        file = [src]
+        for node in file:
+            for voisin, power_min, _ in g.graph[node]:
+                if power_min <= power and voisin not in vus:
+                    vus.add(voisin)
+                    file.append(voisin)
+        return vus
+
+    def test_network04(self):
+        g = graph_from_file("input/network.04.in")
+        tree = ReconstructionTree.from_graph(g)
+        self.assertEqual(sorted(tree.reachable(1, 4)), [1, 2, 3, 4])
+        self.assertEqual(sorted(tree.reachable(1, 3)), [1])
+        self.assertEqual(tree.reachable(5, 100), [5])
+        self.assertEqual(tree.component_size(2, 4), 4)
+        self.assertTrue(tree.same_component(1, 4, 4))
+        self.assertFalse(tree.same_component(1, 5, 100))
+        self.assertEqual(tree.min_power(1, 4), 4)
+        self.assertEqual(tree.min_power(3, 3), 0)
+        self.assertEqual(tree.min_power(1, 5), None)
+        self.assertEqual(tree.min_power_set([1, 2, 3]), 4)
+        self.assertEqual(tree.min_power_set([1, 2, 5]), None)
+
+    def test_same_as_bfs(self):
+        for filename in ["input/network.00.in", "input/network.01.in", "input/network.1.in"]:
+            g = graph_from_file(filename)
+            tree = g.reconstruction_tree()
+            powers = [0] + g.distinct_powers()
+            for src in g.nodes:
+                for power in powers:
+                    attendu = self._reachable(g, src, power)
+                    self.assertEqual(set(g.reachable_with_power(src, power)), attendu)
+                    self.assertEqual(tree.component_size(src, power), len(attendu))
+
+    def test_same_as_min_power_tree(self):
+        g = graph_from_file("input/network.1.in")
+        tree = g.reconstruction_tree()
+        for src in g.nodes:
+            for dest in g.nodes:
+                self.assertEqual(tree.min_power(src, dest), g.min_power_tree().min_power(src, dest))
+
+    def test_add_edge(self):
+        g = Graph([1, 2, 3])
+        g.add_edge(1, 2, 5)
+        self.assertEqual(sorted(g.reachable_with_power(1, 10)), [1, 2])
+        g.add_edge(2, 3, 7)
+        self.assertEqual(sorted(g.reachable_with_power(1, 10)), [1, 2, 3])
+        self.assertEqual(sorted(g.reachable_with_power(1, 6)), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
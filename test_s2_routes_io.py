@@ -0,0 +1,37 @@
+# This will work if ran from the root folder.
+
+import os
+import tempfile
+from delivery_network.graph import graph_from_file, routes_from_file
+from delivery_network.batch import min_power_file
+from delivery_network.routes_io import iter_routes, iter_route_chunks, RoutesWriter
+import unittest   # The test framework
+
+class Test_RoutesIO(unittest.TestCase):
+    def test_reader(self):
+        paquets = list(iter_route_chunks("input/routes.1.in", chunk_size=50))
+        self.assertEqual([len(paquet) for paquet in paquets], [50, 50, 40])
+        self.assertEqual(list(iter_routes("input/routes.1.in", chunk_size=7)), routes_from_file("input/routes.1.in"))
+
+    def test_writer(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "routes.out")
+            with RoutesWriter(sortie) as writer:
+                writer.write(3)
+                writer.write_many([4, None])
+                self.assertEqual(writer.count, 3)
+            with open(sortie) as file:
+                self.assertEqual(file.read(), "3\n4\nNone\n")
+
+    def test_min_power_file_chunks(self):
+        # sans cache ni processus, les trajets sont aussi résolus paquet par paquet
+        g = graph_from_file("input/network.1.in")
+        attendu = g.min_power_batch([(src, dest) for src, dest, _ in routes_from_file("input/routes.1.in")])
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "routes.out")
+            min_power_file("input/network.1.in", "input/routes.1.in", sortie, chunk_size=30)
+            with open(sortie) as file:
+                self.assertEqual(file.read(), "".join(f"{power}\n" for power in attendu))
+
+if __name__ == '__main__':
+    unittest.main()
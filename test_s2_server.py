@@ -0,0 +1,113 @@
+# This will work if ran from the root folder.
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from unittest import mock
+from delivery_network.graph import graph_from_file
+from delivery_network.server import QueryServer, Client
+import unittest   # The test framework
+
+class Test_Server(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dossier = tempfile.TemporaryDirectory()
+        cls.server = QueryServer(["input/network.1.in", "input/network.04.in"], cache_dir=cls.dossier.name)
+        cls.loop = asyncio.new_event_loop()
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        cls.host, cls.port = asyncio.run_coroutine_threadsafe(cls.server.start(port=0), cls.loop).result()
+
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run_coroutine_threadsafe(cls.server.close(), cls.loop).result()
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+        cls.dossier.cleanup()
+
+    def test_queries(self):
+        g = graph_from_file("input/network.1.in")
+        with Client(self.host, self.port) as client:
+            self.assertEqual(client.networks(), ["network.04", "network.1"])
+            for src in range(1, 21):
+                power, path = g.min_power_kruskal(src, 1)
+                self.assertEqual(client.min_power("network.1", src, 1), power)
+                self.assertEqual(client.min_power("network.1", src, 1, path=True), [power, path])
+                self.assertEqual(client.get_path_with_power("network.1", src, 1, power), path)
+                if src != 1:
+                    self.assertIsNone(client.get_path_with_power("network.1", src, 1, power - 1))
+            self.assertEqual(client.min_power("network.04", 1, 5), None)
+            self.assertEqual(client.min_power_batch("network.04", [(1, 4), (2, 3), (1, 5)]), [4, 4, None])
+
+    def test_pipeline(self):
+        g = graph_from_file("input/network.1.in")
+        pairs = [(src, dest) for src in range(1, 21) for dest in range(1, 21)]
+        with Client(self.host, self.port) as client:
+            resultats = client.pipeline([{"op": "min_power", "network": "network.1", "src": src, "dest": dest}
+                                         for src, dest in pairs])
+        self.assertEqual(resultats, g.min_power_batch(pairs))
+
+    def test_errors(self):
+        with Client(self.host, self.port) as client:
+            self.assertRaises(RuntimeError, client.min_power, "network.9", 1, 2)
+            self.assertRaises(RuntimeError, client.min_power, "network.1", 1, 999)
+            self.assertRaises(RuntimeError, client.call, "inconnue", network="network.1")
+            self.assertRaises(RuntimeError, client.call, "min_power_batch", network="network.1", pairs=[[1]])
+            self.assertRaises(RuntimeError, client.call, "min_power_batch", network="network.1", pairs=[1, 2])
+            self.assertRaises(RuntimeError, client.call, "min_power_batch", network="network.1", pairs=3)
+            self.assertEqual(client.min_power("network.1", 1, 1), 0) #la connexion reste utilisable
+
+    def test_pipeline_with_errors(self):
+        # les réponses d'une requête invalide ou d'une erreur inattendue n'empêchent pas les suivantes
+        requetes = [{"id": 1, "op": "min_power", "network": "network.04", "src": 1, "dest": 4},
+                    {"id": 2, "op": "min_power_batch", "network": "network.04", "pairs": [[1]]},
+                    {"id": 3, "op": "min_power", "network": "network.04", "src": 2, "dest": 3}]
+        with Client(self.host, self.port) as client:
+            client.socket.sendall(b"".join(json.dumps(requete).encode() + b"\n" for requete in requetes) + b"[]\n")
+            reponses = [json.loads(client._file.readline()) for _ in range(4)]
+            self.assertEqual([reponse["id"] for reponse in reponses], [1, 2, 3, None])
+            self.assertEqual(reponses[0]["result"], 4)
+            self.assertIn("error", reponses[1])
+            self.assertEqual(reponses[2]["result"], 4)
+            with mock.patch.object(self.server, "_answer", side_effect=IndexError("panne")):
+                self.assertRaises(RuntimeError, client.networks)
+            self.assertEqual(client.networks(), ["network.04", "network.1"])
+
+    def test_large_batch(self):
+        # une requête de plus de 64 Kio (la limite par défaut d'asyncio)
+        g = graph_from_file("input/network.1.in")
+        pairs = [(1 + i % 20, 1 + (7 * i) % 20) for i in range(10000)]
+        self.assertGreater(len(json.dumps({"pairs": pairs})), 1 << 16)
+        with Client(self.host, self.port) as client:
+            self.assertEqual(client.min_power_batch("network.1", pairs), g.min_power_batch(pairs))
+
+    def test_line_too_long(self):
+        server = QueryServer({"reseau": "input/network.04.in"}, cache_dir=self.dossier.name, line_limit=1024)
+        host, port = asyncio.run_coroutine_threadsafe(server.start(port=0), self.loop).result()
+        try:
+            with Client(host, port) as client:
+                self.assertRaises(RuntimeError, client.min_power_batch, "reseau", [(1, 4)] * 1000)
+                self.assertEqual(client.min_power_batch("reseau", [(1, 4)]), [4]) #le flux est resté synchronisé
+                requete = json.dumps({"id": 1, "op": "min_power_batch", "network": "reseau", "pairs": [[1, 4]] * 1000})
+                client.socket.sendall(requete.encode() + b"\n" + b'{"id": 2, "op": "networks"}\n')
+                reponses = [json.loads(client._file.readline()) for _ in range(2)]
+                self.assertEqual(reponses[0], {"id": None, "error": "requête trop longue"})
+                self.assertEqual(reponses[1], {"id": 2, "result": ["reseau"]})
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), self.loop).result()
+
+    def test_unix_socket(self):
+        path = os.path.join(self.dossier.name, "server.sock")
+        server = QueryServer({"reseau": "input/network.04.in"}, cache_dir=self.dossier.name)
+        asyncio.run_coroutine_threadsafe(server.start(path=path), self.loop).result()
+        try:
+            with Client(path=path) as client:
+                self.assertEqual(client.min_power("reseau", 1, 4, path=True), [4, [1, 2, 3, 4]])
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), self.loop).result()
+
+if __name__ == '__main__':
+    unittest.main()
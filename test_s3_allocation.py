@@ -0,0 +1,52 @@
+# This will work if ran from the root folder.
+
+import random
+from delivery_network.allocation import allocate
+import unittest   # The test framework
+
+def meilleur_profit(profits, costs, budget):
+    # programmation dynamique classique sur le budget (petites instances uniquement)
+    meilleur = [0] * (budget + 1)
+    for p, c in zip(profits, costs):
+        if c is None:
+            continue
+        for b in range(budget, c - 1, -1):
+            meilleur[b] = max(meilleur[b], meilleur[b - c] + p)
+    return meilleur[budget]
+
+class Test_Allocation(unittest.TestCase):
+    def test_greedy(self):
+        resultat = allocate([10, 7, 6, 1], [5, 4, 4, 1], budget=9)
+        self.assertEqual(resultat["selected"], [0, 1])
+        self.assertEqual((resultat["profit"], resultat["spend"]), (17, 9))
+        resultat = allocate([10, 7, 6, 1], [5, 4, None, 1], budget=9)
+        self.assertNotIn(2, resultat["selected"])
+
+    def test_exact(self):
+        tirage = random.Random(1)
+        for _ in range(30):
+            n = tirage.randrange(1, 15)
+            profits = [tirage.randrange(1, 50) for _ in range(n)]
+            costs = [tirage.randrange(1, 30) for _ in range(n)]
+            budget = tirage.randrange(1, 100)
+            resultat = allocate(profits, costs, budget, mode="exact")
+            self.assertTrue(resultat["core_optimal"])
+            self.assertEqual(resultat["profit"], meilleur_profit(profits, costs, budget))
+            self.assertLessEqual(resultat["spend"], budget)
+            self.assertLessEqual(resultat["profit"], resultat["upper_bound"])
+            glouton = allocate(profits, costs, budget)
+            self.assertLessEqual(glouton["profit"], resultat["profit"])
+            self.assertLessEqual(glouton["spend"], budget)
+
+    def test_large_core(self):
+        # un coeur plus long que la limite de récursion de python : la recherche respecte node_limit
+        tirage = random.Random(2)
+        profits = [tirage.randrange(1, 1000) for _ in range(4000)]
+        costs = [tirage.randrange(1, 1000) for _ in range(4000)]
+        budget = sum(costs) // 2
+        resultat = allocate(profits, costs, budget, mode="exact", core_size=1500, node_limit=5000)
+        self.assertLessEqual(resultat["spend"], budget)
+        self.assertGreaterEqual(resultat["profit"], allocate(profits, costs, budget)["profit"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+# This will work if ran from the root folder.
+
+import os
+import tempfile
+from delivery_network.graph import graph_from_file, routes_from_file
+from delivery_network.glouton import glouton
+import unittest   # The test framework
+
+class Test_Glouton(unittest.TestCase):
+    def test_pipeline(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "routes.1.out")
+            allocation = glouton("input/network.1.in", "input/routes.1.in", "input/trucks.1.in",
+                                 budget=10**6, fileout=sortie)
+            with open(sortie) as file:
+                powers = [int(line) for line in file]
+        g = graph_from_file("input/network.1.in")
+        routes = routes_from_file("input/routes.1.in")
+        self.assertEqual(powers, g.min_power_batch([(src, dest) for src, dest, _ in routes]))
+        self.assertLessEqual(allocation["spend"], 10**6)
+        self.assertEqual(allocation["profit"], sum(routes[i][2] for i in allocation["selected"]))
+        self.assertEqual(set(allocation["timings"]), {"network", "inputs", "powers", "trucks", "allocation", "paths"})
+        for truck, path in allocation["results"]:
+            self.assertIsNotNone(truck)
+            self.assertIsNotNone(path)
+
+if __name__ == '__main__':
+    unittest.main()
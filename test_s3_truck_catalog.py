@@ -0,0 +1,32 @@
+# This will work if ran from the root folder.
+
+import random
+from delivery_network.truck_catalog import TruckCatalog
+import unittest   # The test framework
+
+class Test_TruckCatalog(unittest.TestCase):
+    def test_pareto(self):
+        catalog = TruckCatalog([(10, 5), (20, 4), (20, 3), (30, 8), (5, 6), (40, 8)])
+        self.assertEqual(list(catalog.ids), [2, 5])
+        self.assertEqual(catalog.cheapest(1), 2)
+        self.assertEqual(catalog.cheapest(20), 2)
+        self.assertEqual(catalog.cheapest(21), 5)
+        self.assertEqual(catalog.cheapest(41), None)
+
+    def test_file(self):
+        catalog = TruckCatalog.from_file("input/trucks.2.in")
+        self.assertEqual(len(catalog.trucks), 10000)
+        costs = list(catalog.costs)
+        self.assertEqual(costs, sorted(set(costs)))
+        tirage = random.Random(0)
+        powers = [tirage.randrange(0, 2 * catalog.powers[-1]) for _ in range(200)] + [None]
+        attendu = []
+        for p in powers:
+            candidats = [(cost, i) for i, (power, cost) in enumerate(catalog.trucks) if p is not None and power >= p]
+            attendu.append(min(candidats)[0] if candidats else None)
+        trouves = catalog.cheapest_many(powers)
+        self.assertEqual([catalog.cost(j) if j is not None else None for j in trouves], attendu)
+        self.assertEqual(trouves[:-1], [catalog.cheapest(p) for p in powers[:-1]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,50 @@
-# À compléter
\ No newline at end of file
+# This will work if ran from the root folder.
+
+import os
+import tempfile
+import unittest 
+from delivery_network.graph import Graph, graph_from_file, read_network, routes_from_file, trucks_from_file
+
+class Test_GraphLoading2(unittest.TestCase):
+    def test_network4(self):
+        g = graph_from_file("input/network.04.in")
+        self.assertEqual(g.nb_nodes, 10)
+        self.assertEqual(g.nb_edges, 4)
+        self.assertEqual(g.graph[1], [(4, 11, 6), (2, 4, 89)])
+
+    def test_same_as_add_edge(self):
+        g = graph_from_file("input/network.1.in")
+        expected = Graph(list(range(1, 21)))
+        with open("input/network.1.in") as file:
+            for line in file.readlines()[1:]:
+                expected.add_edge(*map(int, line.split()))
+        self.assertEqual(g.graph, expected.graph)
+
+    def test_columns(self):
+        n, m, node1, node2, power, dist = read_network("input/network.00.in")
+        self.assertEqual((n, m), (10, 9))
+        self.assertEqual(list(power[:3]), [11, 10, 4])
+        self.assertEqual(list(dist), [1] * 9)
+
+    def test_malformed(self):
+        # 5 + 3 colonnes : autant d'entiers que 2 lignes de 4 colonnes, mais le fichier est mal formé
+        with tempfile.TemporaryDirectory() as dossier:
+            filename = os.path.join(dossier, "network.in")
+            for contenu, attendu in [("3 2\n1 2 5 7 9\n2 3 4\n", None), ("3 2\n1 2 5 7\n2 3 4", [7, 1]),
+                                     ("3 2\n1 2 5\n2 3 4 8\n", [1, 8]), ("3 2\r\n1 2 5 7\r\n2 3 4 8\r\n", [7, 8])]:
+                with open(filename, "w", newline="") as file:
+                    file.write(contenu)
+                if attendu is None:
+                    self.assertRaises(Exception, read_network, filename)
+                else:
+                    self.assertEqual(list(read_network(filename)[5]), attendu)
+
+    def test_routes_trucks(self):
+        routes = routes_from_file("input/routes.1.in")
+        self.assertEqual(len(routes), 140)
+        self.assertEqual(routes[0], (6, 11, 9664))
+        trucks = trucks_from_file("input/trucks.0.in")
+        self.assertEqual(trucks, [(2000000, 200000), (6000000, 900000)])
+
+if __name__ == '__main__':
+    unittest.main()
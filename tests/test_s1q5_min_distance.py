@@ -1 +1,53 @@
-# À compléter
\ No newline at end of file
+# This will work if ran from the root folder.
+
+import random
+import unittest 
+from delivery_network.graph import Graph, graph_from_file
+
+class Test_MinDistance(unittest.TestCase):
+    def test_network4(self):
+        g = graph_from_file("input/network.04.in")
+        self.assertEqual(g.shortest_path_with_power(1, 4, 11), ([1, 4], 6))
+        self.assertEqual(g.shortest_path_with_power(1, 4, 10), ([1, 2, 3, 4], 94))
+        self.assertEqual(g.shortest_path_with_power(1, 4, 3), (None, None))
+        self.assertEqual(g.shortest_path_with_power(1, 5, 100), (None, None))
+        self.assertEqual(g.shortest_path_with_power(3, 3, 0), ([3], 0))
+
+    def test_bidirectional(self):
+        g = graph_from_file("input/network.04.in")
+        self.assertEqual(g.shortest_path_with_power(1, 4, 11, bidirectional=True), ([1, 4], 6))
+        self.assertEqual(g.shortest_path_with_power(1, 4, 10, bidirectional=True), ([1, 2, 3, 4], 94))
+        self.assertEqual(g.shortest_path_with_power(4, 1, 10, bidirectional=True), ([4, 3, 2, 1], 94))
+        self.assertEqual(g.shortest_path_with_power(1, 4, 3, bidirectional=True), (None, None))
+
+    def _distance(self, g, path, power):
+        total = 0
+        for a, b in zip(path, path[1:]):
+            total += min(d for v, p, d in g.graph[a] if v == b and p <= power)
+        return total
+
+    def test_same_distances(self):
+        g = graph_from_file("input/network.1.in")
+        tirage = random.Random(0)
+        powers = g.distinct_powers()
+        queries = [(tirage.randint(1, 20), tirage.randint(1, 20), tirage.choice(powers)) for _ in range(200)]
+        batch = g.shortest_paths_with_power_batch(queries)
+        for (src, dest, power), resultat in zip(queries, batch):
+            path, dist = g.shortest_path_with_power(src, dest, power)
+            self.assertEqual(resultat[1], dist)
+            self.assertEqual(g.shortest_path_with_power(src, dest, power, bidirectional=True)[1], dist)
+            self.assertEqual(path is None, g.get_path_with_power(src, dest, power) is None)
+            if path is not None:
+                self.assertEqual((path[0], path[-1]), (src, dest))
+                self.assertEqual(self._distance(g, path, power), dist)
+
+    def test_parallel_edges(self):
+        g = Graph([1, 2, 3])
+        g.add_edge(1, 2, 5, 10)
+        g.add_edge(1, 2, 1, 3)
+        g.add_edge(2, 3, 1, 1)
+        self.assertEqual(g.shortest_path_with_power(1, 3, 5), ([1, 2, 3], 4))
+        self.assertEqual(g.shortest_path_with_power(1, 3, 5, bidirectional=True), ([1, 2, 3], 4))
+
+if __name__ == '__main__':
+    unittest.main()